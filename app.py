@@ -1,17 +1,19 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import os
 import sys
+import threading
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.rss_manager import RSSManager
 from src.api.routes import router, set_rss_manager
-from src.api.constants import router as constants_router
+from src.api.assets import REVALIDATE, FileAsset, asset_response
+from src.api.constants import constants_asset, router as constants_router
 from src.general.general_constant import APP_VERSION, get_app_version
 
 app = FastAPI(version=APP_VERSION)
@@ -24,6 +26,14 @@ static_dir = os.path.join("src", "static")
 if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+
+def _link_versioned_constants(html: bytes) -> bytes:
+    # The page pins the constants by content hash, so the browser never re-fetches an unchanged copy
+    return html.replace(b'src="/api/constants.js"', f'src="/api/constants.js?v={constants_asset().version}"'.encode("ascii"))
+
+
+index_asset = FileAsset(os.path.join(static_dir, "index.html"), "text/html; charset=utf-8", transform=_link_versioned_constants)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -44,17 +54,27 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 
 @app.on_event("startup")
 def startup_event():
-    rss.start_all()
+    # Hash and compress the UI once up front instead of on the first page load
+    index_asset.get()
+    # Boot the scheduler off the startup path so the server accepts requests right away;
+    # /api/health reports "starting" until every feed is armed.
+    # With `uvicorn --workers N` and RSS_CLUSTER_MODE set, feeds are scheduled by the leader or split
+    # across shards; see README
+    threading.Thread(target=rss.start_cluster, daemon=True, name="scheduler-boot").start()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    rss.shutdown()
 
 # -------------------------------
 # Root endpoint
 # -------------------------------
 @app.get("/")
-def root():
+def root(request: Request):
     # Serve HTML file if it exists, otherwise return API info
-    index_path = os.path.join(static_dir, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path, media_type="text/html")
+    asset = index_asset.get()
+    if asset is not None:
+        return asset_response(request, asset, REVALIDATE)
     return {
         "message": "RSS to Transmission Manager API",
         "version": get_app_version(),
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+IMPORT_PROBE = (
+    "import time; started = time.perf_counter(); import app; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def seed_storage(base_dir: str, count: int):
+    # Point feeds at a closed local port so startup checks fail fast instead of hitting trackers
+    feeds = {}
+    for i in range(count):
+        rss_id = str(uuid.uuid4())
+        feeds[rss_id] = {
+            "id": rss_id,
+            "name": f"bench-{i}",
+            "url": f"http://127.0.0.1:9/bench-{i}",
+            "pt_site": "Other",
+            "key_words": "",
+            "path": "",
+            "interval": 60,
+        }
+    storage_dir = os.path.join(base_dir, "storage")
+    os.makedirs(os.path.join(storage_dir, "logs"), exist_ok=True)
+    with open(os.path.join(storage_dir, "storage.json"), "w", encoding="utf-8") as f:
+        json.dump({"rss": feeds, "settings": {}}, f)
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(base_dir: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=base_dir,
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def get_health(url: str):
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, ConnectionError, TimeoutError):
+        return None
+
+
+def measure_readiness(base_dir: str, timeout: float) -> dict:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--app-dir", ROOT, "--port", str(port), "--log-level", "warning"],
+        cwd=base_dir,
+        env=child_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    health_url = f"http://127.0.0.1:{port}/api/health"
+    healthy_at = None
+    scheduler_at = None
+    try:
+        while time.perf_counter() - started < timeout:
+            health = get_health(health_url)
+            now = time.perf_counter() - started
+            if health is not None and healthy_at is None:
+                healthy_at = now
+            if health is not None and health.get("scheduler") == "running":
+                scheduler_at = now
+                break
+            time.sleep(0.01)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return {"health": healthy_at, "scheduler": scheduler_at}
+
+
+def describe(values: list) -> dict:
+    values = [value for value in values if value is not None]
+    if not values:
+        return {"median_ms": None, "max_ms": None, "runs": 0}
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1),
+        "runs": len(values),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser(description="Measure MediaRSSManagement import time and time-to-ready")
+    p.add_argument("--feeds", type=int, default=5000, help="How many feeds to seed into storage")
+    p.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs per measurement")
+    p.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for readiness per run")
+    p.add_argument("--json", dest="json_output", help="Write the summary as JSON to this path")
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mrm-startup-") as base_dir:
+        seed_storage(base_dir, args.feeds)
+        imports = [measure_import(base_dir) for _ in range(args.runs)]
+        readiness = [measure_readiness(base_dir, args.timeout) for _ in range(args.runs)]
+
+    summary = {
+        "feeds": args.feeds,
+        "import_app": describe(imports),
+        "first_health_ok": describe([run["health"] for run in readiness]),
+        "scheduler_running": describe([run["scheduler"] for run in readiness]),
+    }
+    print(f"Startup benchmark ({args.feeds} feeds, {args.runs} runs)")
+    print(f"{'metric':<20}{'median ms':>12}{'max ms':>12}{'runs':>8}")
+    for name in ("import_app", "first_health_ok", "scheduler_running"):
+        row = summary[name]
+        median = "-" if row["median_ms"] is None else f"{row['median_ms']:.1f}"
+        worst = "-" if row["max_ms"] is None else f"{row['max_ms']:.1f}"
+        print(f"{name:<20}{median:>12}{worst:>12}{row['runs']:>8}")
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+        print(f"Summary written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
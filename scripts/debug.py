@@ -43,7 +43,7 @@ def save_torrent_list(rss_id: str):
     RSS_test = RSSManager()
     RSS_test.load_storage()
 
-    item = RSSItem(**RSS_test.storage["rss"][rss_id])
+    item = RSS_test.feeds.get(rss_id)
     feed = feedparser.parse(item.url)
     print(feed)
 
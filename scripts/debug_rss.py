@@ -21,18 +21,18 @@ def list_rss(mgr: RSSManager):
     if not rss:
         print("No RSS entries found in storage.")
         return
-    for rss_id, data in rss.items():
-        print(f"- {rss_id}: {data.get('title', data.get('url'))} (interval={data.get('interval')})")
+    for rss_id, item in rss.items():
+        print(f"- {rss_id}: {item.name or item.url} (interval={item.interval})")
 
 
 def check_rss_once(mgr: RSSManager, rss_id: str):
-    if rss_id not in mgr.storage.get("rss", {}):
+    if rss_id not in mgr.feeds:
         print(f"RSS id '{rss_id}' not found in storage.")
         return
     print(f"Running check_rss for '{rss_id}'...")
     mgr.check_rss(rss_id)
     # show updated storage entry
-    entry = mgr.storage["rss"][rss_id]
+    entry = mgr.feeds.raw(rss_id)
     print("Updated storage entry:")
     pretty_print_storage_entry(entry)
 
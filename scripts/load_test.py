@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import requests
+import uvicorn
+from fastapi import FastAPI
+
+import src.general.general_constant as GC
+from src.general.general_class import RSSItem
+from src.rss_manager import RSSManager
+from src.api.routes import router, set_rss_manager
+from src.api.constants import router as constants_router
+
+
+DEFAULT_MIX = "list=60,add=5,update=10,logs=20,check=5"
+
+
+def parse_mix(raw: str) -> dict:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise SystemExit(f"Unknown operation in --mix: {name}")
+        mix[name] = max(int(weight or 0), 0)
+    if not any(mix.values()):
+        raise SystemExit("--mix must contain at least one positive weight")
+    return mix
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def use_temp_storage(base_dir: str):
+    # Redirect all storage paths before the manager is created
+    GC.STORAGE_DIR = os.path.join(base_dir, "storage")
+    GC.LOG_DIR = os.path.join(GC.STORAGE_DIR, "logs")
+    GC.STORAGE_PATH = os.path.join(GC.STORAGE_DIR, "storage.json")
+
+
+def seed_feeds(mgr: RSSManager, count: int, interval: int):
+    sites = GC.SUPPORTED_PT_SITES
+    for i in range(count):
+        item = RSSItem(
+            id=str(uuid.uuid4()),
+            name=f"load-feed-{i}",
+            url=f"https://tracker.invalid/rss/{i}",
+            path=f"/downloads/load/{i % 10}",
+            interval=interval,
+            pt_site=sites[i % len(sites)],
+            key_words="Episode 1080p" if GC.PT_SITE_TYPES.get(sites[i % len(sites)]) == GC.FILTER else None,
+        )
+        mgr.feeds.put(item)
+    mgr.save_storage()
+
+
+def install_fake_fetch(mgr: RSSManager, delay: float, entries: int):
+    def fake_fetch(rss_id, item, run_id):
+        time.sleep(delay)
+        stamp = int(time.time())
+        return SimpleNamespace(
+            bozo=False,
+            entries=[
+                SimpleNamespace(
+                    title=f"Episode {stamp}-{n} 1080p",
+                    links=[{"rel": "enclosure", "type": "application/x-bittorrent", "href": f"https://tracker.invalid/t/{rss_id}/{stamp}-{n}.torrent"}],
+                )
+                for n in range(entries)
+            ],
+        )
+
+    mgr._fetch_feed = fake_fetch
+
+
+def start_server(mgr: RSSManager, port: int):
+    app = FastAPI()
+    set_rss_manager(mgr)
+    app.include_router(router, prefix="/api", tags=["api"])
+    app.include_router(constants_router, prefix="/api", tags=["constants"])
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True, name="load-test-server")
+    thread.start()
+    deadline = time.monotonic() + 15
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise SystemExit("API server did not start within 15s")
+        time.sleep(0.05)
+    return server, thread
+
+
+# ---------------------
+# Operations
+# ---------------------
+def op_list(session, base_url, feed_ids):
+    return session.get(f"{base_url}/api/feeds")
+
+
+def op_add(session, base_url, feed_ids):
+    payload = {
+        "name": "load-added",
+        "url": f"https://tracker.invalid/rss/added/{uuid.uuid4().hex}",
+        "pt_site": GC.DEFAULT_PT_SITE,
+        "path": "/downloads/load/added",
+        "interval": GC.DEFAULT_RSS_INTERVAL,
+    }
+    return session.post(f"{base_url}/api/feeds", json=payload)
+
+
+def op_update(session, base_url, feed_ids):
+    feed_id = random.choice(feed_ids)
+    return session.put(f"{base_url}/api/feeds/{feed_id}", json={"name": f"load-updated-{int(time.time())}"})
+
+
+def op_logs(session, base_url, feed_ids):
+    feed_id = random.choice(feed_ids)
+    return session.get(f"{base_url}/api/feeds/{feed_id}/logs")
+
+
+def op_check(session, base_url, feed_ids):
+    feed_id = random.choice(feed_ids)
+    return session.post(f"{base_url}/api/feeds/{feed_id}/check")
+
+
+OPERATIONS = {
+    "list": op_list,
+    "add": op_add,
+    "update": op_update,
+    "logs": op_logs,
+    "check": op_check,
+}
+
+# A 409 from check means the feed was already running, which is expected under load
+EXPECTED_STATUS = {
+    "check": {200, 202, 409},
+}
+
+
+def run_client(base_url, mix, feed_ids, stop_at, results, lock):
+    names = list(mix.keys())
+    weights = list(mix.values())
+    local = defaultdict(lambda: {"latencies": [], "errors": 0, "statuses": defaultdict(int)})
+    with requests.Session() as session:
+        while time.monotonic() < stop_at:
+            name = random.choices(names, weights=weights)[0]
+            started = time.perf_counter()
+            try:
+                response = OPERATIONS[name](session, base_url, feed_ids)
+                status = response.status_code
+            except requests.RequestException:
+                status = "exception"
+            elapsed = time.perf_counter() - started
+            bucket = local[name]
+            bucket["latencies"].append(elapsed)
+            bucket["statuses"][status] += 1
+            if status not in EXPECTED_STATUS.get(name, {200}):
+                bucket["errors"] += 1
+    with lock:
+        for name, bucket in local.items():
+            merged = results[name]
+            merged["latencies"].extend(bucket["latencies"])
+            merged["errors"] += bucket["errors"]
+            for status, count in bucket["statuses"].items():
+                merged["statuses"][status] += count
+
+
+def probe_state_lock(mgr: RSSManager, stop_event: threading.Event, samples: list, period: float):
+    # Measure how long an uncontended caller waits for state_lock while the load runs
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        with mgr.state_lock:
+            waited = time.perf_counter() - started
+        samples.append(waited)
+        stop_event.wait(period)
+
+
+def summarize(results: dict, lock_samples: list, duration: float) -> dict:
+    summary = {"duration_s": round(duration, 2), "operations": {}}
+    for name, bucket in sorted(results.items()):
+        latencies = bucket["latencies"]
+        summary["operations"][name] = {
+            "count": len(latencies),
+            "errors": bucket["errors"],
+            "throughput_rps": round(len(latencies) / duration, 2) if duration else 0.0,
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "max_ms": round(max(latencies) * 1000, 2) if latencies else 0.0,
+            "statuses": {str(k): v for k, v in sorted(bucket["statuses"].items(), key=lambda kv: str(kv[0]))},
+        }
+    summary["state_lock_wait"] = {
+        "samples": len(lock_samples),
+        "p50_ms": round(percentile(lock_samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(lock_samples, 99) * 1000, 3),
+        "max_ms": round(max(lock_samples) * 1000, 3) if lock_samples else 0.0,
+    }
+    return summary
+
+
+def print_summary(summary: dict, args):
+    print(f"\nfeeds={args.feeds} clients={args.concurrency} duration={summary['duration_s']}s scheduler={'on' if args.scheduler else 'off'}")
+    header = f"{'op':<8}{'count':>8}{'err':>6}{'rps':>10}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in summary["operations"].items():
+        print(
+            f"{name:<8}{stats['count']:>8}{stats['errors']:>6}{stats['throughput_rps']:>10}"
+            f"{stats['mean_ms']:>10}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}"
+        )
+    lock_stats = summary["state_lock_wait"]
+    print(f"\nstate_lock wait (ms): p50={lock_stats['p50_ms']} p99={lock_stats['p99_ms']} max={lock_stats['max_ms']} samples={lock_stats['samples']}")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Load-test the MediaRSSManagement API against a seeded feed inventory")
+    p.add_argument("--feeds", type=int, default=5000, help="How many feeds to seed (e.g. 5000-50000)")
+    p.add_argument("--concurrency", type=int, default=16, help="Concurrent API clients")
+    p.add_argument("--duration", type=float, default=30.0, help="Seconds to drive load")
+    p.add_argument("--mix", default=DEFAULT_MIX, help=f"Weighted operation mix (default: {DEFAULT_MIX})")
+    p.add_argument("--port", type=int, default=8765, help="Local port for the in-process API server")
+    p.add_argument("--interval", type=int, default=1, help="Interval in minutes for seeded feeds")
+    p.add_argument("--no-scheduler", dest="scheduler", action="store_false", help="Do not start the feed scheduler")
+    p.add_argument("--fetch-delay", type=float, default=0.2, help="Simulated tracker latency per fetch in seconds")
+    p.add_argument("--entries", type=int, default=20, help="Entries returned by each simulated fetch")
+    p.add_argument("--json", dest="json_output", help="Write the summary as JSON to this path")
+    p.add_argument("--seed", type=int, help="Random seed for the operation mix")
+    args = p.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    mix = parse_mix(args.mix)
+
+    with tempfile.TemporaryDirectory(prefix="mrm-load-") as base_dir:
+        use_temp_storage(base_dir)
+        mgr = RSSManager()
+        seed_started = time.perf_counter()
+        seed_feeds(mgr, args.feeds, args.interval)
+        print(f"Seeded {args.feeds} feeds in {time.perf_counter() - seed_started:.2f}s")
+        install_fake_fetch(mgr, args.fetch_delay, args.entries)
+
+        if args.scheduler:
+            boot_started = time.perf_counter()
+            mgr.start_all()
+            print(f"Scheduler started in {time.perf_counter() - boot_started:.2f}s")
+
+        server, server_thread = start_server(mgr, args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+        feed_ids = list(mgr.list_rss().keys())
+
+        results = defaultdict(lambda: {"latencies": [], "errors": 0, "statuses": defaultdict(int)})
+        results_lock = threading.Lock()
+        lock_samples = []
+        stop_event = threading.Event()
+        prober = threading.Thread(target=probe_state_lock, args=(mgr, stop_event, lock_samples, 0.05), daemon=True)
+        prober.start()
+
+        started = time.monotonic()
+        stop_at = started + args.duration
+        clients = [
+            threading.Thread(target=run_client, args=(base_url, mix, feed_ids, stop_at, results, results_lock), daemon=True)
+            for _ in range(args.concurrency)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        duration = time.monotonic() - started
+        stop_event.set()
+        prober.join()
+
+        server.should_exit = True
+        server_thread.join(15)
+        # Timers, runs and the search-index flush would otherwise keep writing into the temp dir
+        mgr.shutdown()
+        summary = summarize(results, lock_samples, duration)
+        print_summary(summary, args)
+        if args.json_output:
+            with open(args.json_output, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=4)
+            print(f"Summary written to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import src.general.general_constant as GC
+from src.feed_capture import FeedCapture
+from src.feed_replay import FeedReplay
+from src.rss_manager import RSSManager
+
+
+def use_temp_storage(base_dir: str):
+    # Replayed runs write caches, logs and storage.json here, never into the live storage
+    GC.STORAGE_DIR = os.path.join(base_dir, "storage")
+    GC.LOG_DIR = os.path.join(GC.STORAGE_DIR, "logs")
+    GC.STORAGE_PATH = os.path.join(GC.STORAGE_DIR, "storage.json")
+    GC.FEED_CAPTURE = False
+    GC.TORRENT_FILE_CACHE = False
+
+
+def print_summary(summary: dict, capture_stats: dict):
+    print(
+        f"Captures: {capture_stats['records']} fetches of {capture_stats['feeds']} feeds, "
+        f"{capture_stats['blobs']} distinct bodies, {capture_stats['storedBytes'] / 1024 / 1024:.1f} MiB stored"
+    )
+    print(f"Replayed {summary['runs']} runs of {summary['feeds']} feeds in {summary['elapsedSeconds']:.2f}s ({summary['runsPerSecond']} runs/s)")
+    print(f"  statuses: {summary['statuses']}")
+    print(f"  new items={summary['newItems']} sent={summary['sent']} rejected={summary['rejected']} skipped={summary['skipped']}")
+    runs = summary["runSeconds"]
+    print(f"  run latency p50={runs['p50']}s p95={runs['p95']}s max={runs['max']}s")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Replay captured feed responses through check_rss against a fake Transmission")
+    p.add_argument("--captures", default=os.path.join(GC.STORAGE_DIR, GC.FEED_CAPTURE_DIR), help="Capture directory (default: storage/captures)")
+    p.add_argument("--feed", dest="feed_ids", action="append", help="Only replay this feed id (repeatable)")
+    p.add_argument("--limit", type=int, help="Replay at most this many fetches")
+    p.add_argument("--profile", type=int, metavar="N", help="Run under cProfile and print the top N functions by cumulative time")
+    p.add_argument("--keep", action="store_true", help="Keep the temporary storage (logs, caches) and print its path")
+    p.add_argument("--json", dest="json_output", help="Write the summary as JSON to this path")
+    args = p.parse_args()
+
+    capture = FeedCapture(os.path.abspath(args.captures), GC.FEED_CAPTURE_MAX_BYTES)
+    capture_stats = capture.stats()
+    if not capture_stats["records"]:
+        raise SystemExit(f"No captures found in {args.captures} (run the app with RSS_FEED_CAPTURE=1 first)")
+
+    base_dir = tempfile.mkdtemp(prefix="mrm-replay-")
+    try:
+        use_temp_storage(base_dir)
+        mgr = RSSManager()
+        replay = FeedReplay(mgr, capture)
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+        summary = replay.run(args.feed_ids, args.limit)
+        if profiler:
+            profiler.disable()
+        mgr.feed_parser.shutdown()
+        mgr.run_pool.shutdown()
+
+        print_summary(summary, capture_stats)
+        if profiler:
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(args.profile)
+            print(out.getvalue())
+        if args.json_output:
+            with open(args.json_output, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=4)
+            print(f"Summary written to {args.json_output}")
+    finally:
+        if args.keep:
+            print(f"Replay storage kept at {base_dir}")
+        else:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Prebuilt UI responses: content-hash ETags, gzip/brotli variants and conditional GETs
+"""
+import gzip
+import hashlib
+import os
+import threading
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:
+    # br variants are skipped when the brotli package is not installed
+    brotli = None
+
+from src.general import general_constant as GC
+
+IMMUTABLE = f"public, max-age={GC.STATIC_MAX_AGE_SECONDS}, immutable"
+# Cached, but revalidated on every use: a reload costs one conditional request answered with 304
+REVALIDATE = "no-cache"
+
+
+class StaticAsset:
+    """One response body, hashed and compressed once; variants are only kept when they are smaller."""
+
+    __slots__ = ("media_type", "version", "variants")
+
+    def __init__(self, body: bytes, media_type: str):
+        self.media_type = media_type
+        self.version = hashlib.sha256(body).hexdigest()[:20]
+        self.variants = {"identity": body}
+        compressed = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(body, quality=11)
+        for encoding, data in compressed.items():
+            if len(data) < len(body):
+                self.variants[encoding] = data
+
+    def etag(self, encoding: str) -> str:
+        # Each encoding is a different byte sequence, so it gets its own strong validator
+        return f'"{self.version}"' if encoding == "identity" else f'"{self.version}-{encoding}"'
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _choose_encoding(asset: StaticAsset, request: Request) -> str:
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    for encoding in ("br", "gzip"):
+        if encoding in asset.variants and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+def _not_modified(asset: StaticAsset, request: Request) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Any variant's tag matches: the content behind all of them is the same
+    for tag in header.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag.split("-", 1)[0] == asset.version:
+            return True
+    return False
+
+
+def asset_response(request: Request, asset: StaticAsset, cache_control: str) -> Response:
+    encoding = _choose_encoding(asset, request)
+    headers = {"ETag": asset.etag(encoding), "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if _not_modified(asset, request):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+
+class FileAsset:
+    """A file on disk served as a StaticAsset; rebuilt only when the file changes (edits during development)."""
+
+    def __init__(self, path: str, media_type: str, transform=None):
+        self.path = path
+        self.media_type = media_type
+        self.transform = transform
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._asset = None
+
+    def get(self):
+        """The current asset, or None when the file does not exist."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if stamp != self._stamp:
+                with open(self.path, "rb") as f:
+                    body = f.read()
+                if self.transform is not None:
+                    body = self.transform(body)
+                self._asset = StaticAsset(body, self.media_type)
+                self._stamp = stamp
+            return self._asset
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request
 import json
+import threading
+from src.api.assets import IMMUTABLE, REVALIDATE, StaticAsset, asset_response
 from src.general import general_constant as GC
 
 router = APIRouter()
 
+_constants_lock = threading.Lock()
+_constants_asset = None
 
-@router.get('/constants.js')
-def constants_js():
+
+def build_constants_payload() -> dict:
     # Build a safe payload for the frontend (do not expose secrets)
-    payload = {
+    return {
         'APP': {
             'VERSION': GC.get_app_version()
         },
@@ -23,13 +27,25 @@ def constants_js():
         'STRINGS': getattr(GC, 'STRINGS', {}),
         'LISTS': getattr(GC, 'LISTS', {})
     }
-    # Serialize with ensure_ascii=False to keep Unicode readable in JS
-    body = 'window.GENERAL_CONSTANTS = ' + json.dumps(payload, ensure_ascii=False) + ';'
-    return Response(
-        content=body,
-        media_type='application/javascript',
-        headers={"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"},
-    )
+
+
+def constants_asset() -> StaticAsset:
+    """constants.js, serialized and compressed once per process (the constants do not change at runtime)."""
+    global _constants_asset
+    with _constants_lock:
+        if _constants_asset is None:
+            # Serialize with ensure_ascii=False to keep Unicode readable in JS
+            body = 'window.GENERAL_CONSTANTS = ' + json.dumps(build_constants_payload(), ensure_ascii=False) + ';'
+            _constants_asset = StaticAsset(body.encode('utf-8'), 'application/javascript; charset=utf-8')
+        return _constants_asset
+
+
+@router.get('/constants.js')
+def constants_js(request: Request):
+    asset = constants_asset()
+    # index.html references /api/constants.js?v=<content hash>: that URL can be cached for good
+    versioned = request.query_params.get('v') == asset.version
+    return asset_response(request, asset, IMMUTABLE if versioned else REVALIDATE)
 
 
 @router.get('/version')
@@ -0,0 +1,108 @@
+"""
+Feed import/export helpers (JSON and OPML)
+"""
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+# Fields carried in exports; runtime state (last_fetch, last_status, ...) is not exported
+EXPORT_FIELDS = (
+    "name", "url", "pt_site", "key_words", "path", "interval", "max_response_bytes", "transmission_endpoint",
+    "min_size_mb", "max_size_mb", "categories", "freeleech_only",
+)
+PROFILE_EXPORT_FIELDS = ("id", "name", "key_words", "path")
+
+# OPML attribute names for fields without a standard OPML equivalent
+OPML_ATTRS = {
+    "pt_site": "ptSite",
+    "key_words": "keyWords",
+    "path": "path",
+    "interval": "interval",
+}
+
+FORMAT_JSON = "json"
+FORMAT_OPML = "opml"
+
+
+def export_record(rss_data: dict) -> dict:
+    record = {field: rss_data.get(field) for field in EXPORT_FIELDS}
+    record["profiles"] = [
+        {field: profile.get(field) for field in PROFILE_EXPORT_FIELDS}
+        for profile in rss_data.get("profiles") or []
+    ]
+    return record
+
+
+def feeds_to_json(feeds: dict) -> str:
+    payload = {
+        "exported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "feeds": [export_record(rss_data) for rss_data in feeds.values()],
+    }
+    return json.dumps(payload, indent=4, ensure_ascii=False)
+
+
+def feeds_to_opml(feeds: dict, title: str) -> str:
+    root = ET.Element("opml", version="2.0")
+    head = ET.SubElement(root, "head")
+    ET.SubElement(head, "title").text = title
+    ET.SubElement(head, "dateCreated").text = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    body = ET.SubElement(root, "body")
+    # OPML has no place for filter profiles or pre-send rules; use the JSON export to carry them
+    for rss_data in feeds.values():
+        record = export_record(rss_data)
+        attrs = {
+            "type": "rss",
+            "text": record["name"] or "",
+            "title": record["name"] or "",
+            "xmlUrl": record["url"] or "",
+        }
+        for field, attr in OPML_ATTRS.items():
+            if record.get(field) not in (None, ""):
+                attrs[attr] = str(record[field])
+        ET.SubElement(body, "outline", attrs)
+    ET.indent(root)
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(root, encoding="unicode")
+
+
+def parse_json_feeds(raw: bytes) -> list:
+    """Accept either a list of feed records or an export document with a "feeds" list."""
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Invalid JSON: {exc}")
+    if isinstance(data, dict):
+        data = data.get("feeds")
+    if not isinstance(data, list):
+        raise ValueError("JSON import must be a list of feeds or an object with a 'feeds' list")
+    return data
+
+
+def parse_opml_feeds(raw: bytes) -> list:
+    try:
+        root = ET.fromstring(raw)
+    except ET.ParseError as exc:
+        raise ValueError(f"Invalid OPML: {exc}")
+    records = []
+    # Nested outlines are folders; only outlines with an xmlUrl are feeds
+    for outline in root.iter("outline"):
+        url = outline.get("xmlUrl")
+        if url is None:
+            continue
+        record = {
+            "name": outline.get("title") or outline.get("text") or "",
+            "url": url,
+        }
+        for field, attr in OPML_ATTRS.items():
+            if outline.get(attr) is not None:
+                record[field] = outline.get(attr)
+        records.append(record)
+    return records
+
+
+def detect_format(content_type: str, explicit: str | None) -> str:
+    if explicit:
+        return explicit.lower()
+    content_type = (content_type or "").lower()
+    if "xml" in content_type or "opml" in content_type:
+        return FORMAT_OPML
+    return FORMAT_JSON
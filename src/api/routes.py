@@ -1,15 +1,39 @@
 """
 API routes
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import Optional
+import json
 import uuid
-from src.general.general_class import RSSItem, Settings, model_to_dict
-from src.general.general_constant import DEFAULT_TRANSMISSION_URL, DEFAULT_TRANSMISSION_PORT, DEFAULT_RSS_INTERVAL, DEFAULT_PT_SITE
+from src.general.general_class import FilterProfile, RSSItem, Settings, model_to_dict
+from src.general.general_constant import DEFAULT_TRANSMISSION_URL, DEFAULT_TRANSMISSION_PORT, DEFAULT_RSS_INTERVAL, DEFAULT_PT_SITE, EVENT_STREAM_HEARTBEAT_SECONDS
+from src.general.general_constant import DEFAULT_FEED_PAGE_SIZE, MAX_FEED_PAGE_SIZE
+from src.general.general_constant import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
 from src.rss_manager import RSSManager
+from src.cluster import WorkerUnavailableError
+from src.api import feed_io
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder when orjson is not installed
+    orjson = None
 
 router = APIRouter()
 
 
+def _json_response(payload, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """Serialize hot-path responses directly, skipping FastAPI's jsonable_encoder pass."""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+
 # RSSManager instance dependency injection 
 # Use _rss_manager to initialize
 _rss_instance = None
@@ -23,31 +47,102 @@ def get_rss_manager() -> RSSManager:
     """ Dependency to get the RSSManager instance """
     if _rss_instance is None:
         raise RuntimeError("RSSManager instance not initialized")
+    # Other uvicorn workers may have written storage.json since this worker last looked
+    _rss_instance.refresh_storage()
     return _rss_instance
 
 
-def _convert_rss_to_feed(rss_id: str, rss_data: dict) -> dict:
+def _validation_message(exc: ValidationError) -> str:
+    """First field error of a model validation failure, as shown to API clients."""
+    return str(exc.errors()[0].get("msg", exc))
+
+
+def _convert_rss_to_feed(rss_id: str, item: RSSItem) -> dict:
     """Convert internal RSS format to frontend feed format"""
     return {
         "id": rss_id,
-        "name": rss_data.get("name", ""),
-        "url": rss_data.get("url", ""),
-        "pt_site": rss_data.get("pt_site", DEFAULT_PT_SITE),
-        "key_words": rss_data.get("key_words", ""),
-        "path": rss_data.get("path", ""),
-        "interval": rss_data.get("interval", 10),
-        "lastChecked": rss_data.get("last_fetch"),
-        "lastStatus": rss_data.get("last_status") or ("OK" if rss_data.get("last_fetch") else "Never"),
-        "lastError": rss_data.get("last_error"),
+        "name": item.name,
+        "url": item.url,
+        "pt_site": item.pt_site,
+        "key_words": item.key_words or "",
+        "path": item.path,
+        "interval": item.interval,
+        "lastChecked": item.last_fetch,
+        "lastStatus": RSSManager.feed_status(item),
+        "lastError": item.last_error,
+        "profiles": [
+            {key: getattr(profile, key) for key in ("id", "name", "key_words", "path")}
+            for profile in item.profiles
+        ],
+        "maxResponseBytes": item.max_response_bytes,
+        "transmissionEndpoint": item.transmission_endpoint,
+        "rules": {
+            "minSizeMb": item.min_size_mb,
+            "maxSizeMb": item.max_size_mb,
+            "categories": item.categories,
+            "freeleechOnly": item.freeleech_only,
+        },
+        "consecutiveFailures": item.consecutive_failures,
+        "fetchStats": {
+            "wireBytes": item.last_wire_bytes,
+            "decodedBytes": item.last_decoded_bytes,
+            "totalWireBytes": item.total_wire_bytes,
+            "totalDecodedBytes": item.total_decoded_bytes,
+        },
     }
 
 
+def _build_rules(feed_data: dict, existing: Optional[dict] = None) -> dict:
+    """Validate the pre-send rule fields; fields missing from feed_data keep their stored values."""
+    existing = existing or {}
+    rules = {}
+    for key in ("min_size_mb", "max_size_mb"):
+        value = feed_data.get(key, existing.get(key))
+        if value in (None, ""):
+            rules[key] = None
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be a number")
+        if value < 0:
+            raise ValueError(f"{key} must not be negative")
+        rules[key] = value or None
+    if rules["min_size_mb"] and rules["max_size_mb"] and rules["min_size_mb"] > rules["max_size_mb"]:
+        raise ValueError("min_size_mb must not exceed max_size_mb")
+    rules["categories"] = (feed_data.get("categories", existing.get("categories")) or "").strip() or None
+    rules["freeleech_only"] = bool(feed_data.get("freeleech_only", existing.get("freeleech_only", False)))
+    return rules
+
+
+def _build_profiles(raw_profiles, existing_profiles=None) -> list:
+    """Validate filter profiles, keeping the dedupe state of profiles that already exist."""
+    if raw_profiles is None:
+        return []
+    if not isinstance(raw_profiles, list):
+        raise ValueError("profiles must be a list")
+    existing = {profile.get("id"): profile for profile in existing_profiles or []}
+    profiles = []
+    for raw in raw_profiles:
+        if not isinstance(raw, dict):
+            raise ValueError("each profile must be an object")
+        profile_id = raw.get("id") or uuid.uuid4().hex[:8]
+        profiles.append(FilterProfile(
+            id=profile_id,
+            name=raw.get("name") or "",
+            key_words=raw.get("key_words") or "",
+            path=raw.get("path") or "",
+            last_title=existing.get(profile_id, {}).get("last_title"),
+        ))
+    return profiles
+
+
 # -------------------------------
 # RSS API
 # -------------------------------
 @router.get("/rss")
 def list_rss(rss: RSSManager = Depends(get_rss_manager)):
-    return rss.list_rss()
+    return _json_response(rss.feeds.serialize())
 
 
 @router.post("/rss")
@@ -70,6 +165,10 @@ def manual_check(rss_id: str, rss: RSSManager = Depends(get_rss_manager)):
         rss.run_check_now(rss_id, trigger="manual")
     except KeyError:
         raise HTTPException(status_code=404, detail="Feed not found")
+    except TimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc))
+    except WorkerUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc))
     return {"ok": True}
@@ -93,7 +192,8 @@ def get_settings(rss: RSSManager = Depends(get_rss_manager)):
         "username": "",
         "password": "",
         "default_rss_interval": DEFAULT_RSS_INTERVAL,
-        "default_download_path": ""
+        "default_download_path": "",
+        "transmission_endpoints": []
     }
     return {**default_settings, **settings}
 
@@ -101,7 +201,12 @@ def get_settings(rss: RSSManager = Depends(get_rss_manager)):
 @router.post("/settings")
 def set_settings(s: Settings, rss: RSSManager = Depends(get_rss_manager)):
     # Pydantic模型会自动验证设置
-    rss.storage["settings"] = model_to_dict(s)
+    settings = model_to_dict(s)
+    fields_set = s.model_fields_set if hasattr(s, "model_fields_set") else s.__fields_set__
+    if "transmission_endpoints" not in fields_set:
+        # Clients that predate the endpoint pool must not wipe it
+        settings["transmission_endpoints"] = rss.storage.get("settings", {}).get("transmission_endpoints", [])
+    rss.storage["settings"] = settings
     rss.save_storage()
     return {"ok": True}
 
@@ -109,11 +214,72 @@ def set_settings(s: Settings, rss: RSSManager = Depends(get_rss_manager)):
 # -------------------------------
 # Frontend-compatible /api/feeds endpoints
 # -------------------------------
+def _feeds_etag(version: int, since: Optional[int] = None) -> str:
+    # The full list and each ?since= delta are different bodies for the same version
+    if since is None:
+        return f'"feeds-{version}"'
+    return f'"feeds-{version}-since-{since}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check per RFC 7232: "*", comma-separated lists and weak (W/) tags compare weakly."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
 @router.get("/feeds")
-def list_feeds(rss: RSSManager = Depends(get_rss_manager)):
-    rss_items = rss.list_rss()
-    feeds = [_convert_rss_to_feed(rss_id, rss_data) for rss_id, rss_data in rss_items.items()]
-    return feeds
+def list_feeds(
+    request: Request,
+    since: Optional[int] = None,
+    status: Optional[str] = None,
+    pt_site: Optional[str] = None,
+    q: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    rss: RSSManager = Depends(get_rss_manager),
+):
+    """List feeds.
+
+    - no parameters: every feed (legacy list)
+    - ?since=<version>: only feeds changed or deleted after that version
+    - ?status=&pt_site=&q=&sort=&order=&cursor=&limit=: one filtered, sorted page
+    """
+    if any(value is not None for value in (status, pt_site, q, sort, cursor, limit)):
+        if since is not None:
+            raise HTTPException(status_code=400, detail="since cannot be combined with query parameters")
+        page_size = min(max(limit or DEFAULT_FEED_PAGE_SIZE, 1), MAX_FEED_PAGE_SIZE)
+        try:
+            page, next_cursor, total = rss.query_feeds(
+                status=status, pt_site=pt_site, q=q, sort=sort or "name", order=order, cursor=cursor, limit=page_size,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        return _json_response({
+            "items": [_convert_rss_to_feed(rss_id, item) for rss_id, item in page],
+            "total": total,
+            "nextCursor": next_cursor,
+            "version": rss.storage_version,
+        })
+
+    if since is None:
+        version, _, rss_items, _ = rss.feed_changes_since(0)
+    else:
+        version, full, rss_items, deleted = rss.feed_changes_since(since)
+    etag = _feeds_etag(version, since)
+    headers = {"ETag": etag, "X-Feeds-Version": str(version), "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    feeds = [_convert_rss_to_feed(rss_id, item) for rss_id, item in rss_items.items()]
+    if since is None:
+        return _json_response(feeds, headers=headers)
+    return _json_response({"version": version, "full": full, "feeds": feeds, "deleted": deleted}, headers=headers)
 
 
 @router.post("/feeds")
@@ -124,25 +290,36 @@ def add_feed(feed_data: dict, rss: RSSManager = Depends(get_rss_manager)):
         raise HTTPException(status_code=400, detail="URL不能为空")
     
     # 检查现有feeds中是否有相同的URL
-    existing_feeds = rss.list_rss()
-    for feed_id, feed_info in existing_feeds.items():
-        if feed_info.get("url", "").strip() == feed_url:
-            raise HTTPException(status_code=400, detail=f"URL已存在：{feed_info.get('name', '未命名')}")
+    existing_id = rss.find_feed_by_url(feed_url)
+    if existing_id is not None:
+        feed_info = rss.feeds.get(existing_id)
+        raise HTTPException(status_code=400, detail=f"URL已存在：{(feed_info.name if feed_info else '') or '未命名'}")
     
     # 如果没有指定interval，使用默认值
     settings = rss.storage.get("settings", {})
     default_interval = settings.get("default_rss_interval", DEFAULT_RSS_INTERVAL)
     
     feed_id = str(uuid.uuid4())
-    rss_item = RSSItem(
-        id=feed_id,
-        name=feed_data.get("name", ""),
-        url=feed_url,
-        pt_site=feed_data.get("pt_site", DEFAULT_PT_SITE),
-        path=feed_data.get("path", ""),
-        key_words=feed_data.get("key_words", ""),
-        interval=feed_data.get("interval", default_interval)
-    )
+    try:
+        profiles = _build_profiles(feed_data.get("profiles"))
+        rules = _build_rules(feed_data)
+        rss_item = RSSItem(
+            id=feed_id,
+            name=feed_data.get("name", ""),
+            url=feed_url,
+            pt_site=feed_data.get("pt_site", DEFAULT_PT_SITE),
+            path=feed_data.get("path", ""),
+            key_words=feed_data.get("key_words", ""),
+            interval=feed_data.get("interval", default_interval),
+            max_response_bytes=feed_data.get("max_response_bytes"),
+            transmission_endpoint=feed_data.get("transmission_endpoint") or None,
+            profiles=profiles,
+            **rules,
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=_validation_message(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     
     try:
         rss.add_rss(rss_item)
@@ -152,58 +329,158 @@ def add_feed(feed_data: dict, rss: RSSManager = Depends(get_rss_manager)):
             rss.save_storage()
     except Exception as e:
         # 如果添加失败，确保不会留下部分数据
-        if feed_id in rss.storage["rss"]:
-            rss.storage["rss"].pop(feed_id, None)
-            rss.save_storage()
+        if feed_id in rss.feeds:
+            rss.delete_rss(feed_id)
         raise HTTPException(status_code=500, detail=f"添加RSS失败: {str(e)}")
     
     return {"ok": True, "id": feed_id}
 
 
+@router.get("/feeds/export")
+def export_feeds(format: str = feed_io.FORMAT_JSON, rss: RSSManager = Depends(get_rss_manager)):
+    feeds = rss.feeds.serialize()
+    if format == feed_io.FORMAT_OPML:
+        body = feed_io.feeds_to_opml(feeds, title="Media RSS Management feeds")
+        media_type = "text/x-opml"
+    elif format == feed_io.FORMAT_JSON:
+        body = feed_io.feeds_to_json(feeds)
+        media_type = "application/json"
+    else:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}")
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="feeds.{format}"'},
+    )
+
+
+@router.post("/feeds/import")
+async def import_feeds(request: Request, format: Optional[str] = None, rss: RSSManager = Depends(get_rss_manager)):
+    """Validate a whole JSON/OPML batch up front, skip duplicate URLs, then add everything in one write."""
+    import_format = feed_io.detect_format(request.headers.get("content-type", ""), format)
+    raw = await request.body()
+    try:
+        if import_format == feed_io.FORMAT_OPML:
+            records = feed_io.parse_opml_feeds(raw)
+        elif import_format == feed_io.FORMAT_JSON:
+            records = feed_io.parse_json_feeds(raw)
+        else:
+            raise ValueError(f"Unsupported import format: {import_format}")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    settings = rss.storage.get("settings", {})
+    default_interval = settings.get("default_rss_interval", DEFAULT_RSS_INTERVAL)
+    batch_urls = set()
+
+    items, skipped, errors = [], [], []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append({"index": index, "error": "feed must be an object"})
+            continue
+        feed_url = str(record.get("url") or "").strip()
+        if not feed_url:
+            errors.append({"index": index, "error": "URL不能为空"})
+            continue
+        normalized_url = rss.normalize_url(feed_url)
+        if normalized_url in batch_urls or rss.find_feed_by_url(normalized_url) is not None:
+            skipped.append({"index": index, "url": feed_url, "reason": "duplicate_url"})
+            continue
+        try:
+            rss_item = RSSItem(
+                id=str(uuid.uuid4()),
+                name=record.get("name") or "",
+                url=feed_url,
+                pt_site=record.get("pt_site") or DEFAULT_PT_SITE,
+                path=record.get("path") or "",
+                key_words=record.get("key_words") or "",
+                interval=record.get("interval") or default_interval,
+                max_response_bytes=record.get("max_response_bytes"),
+                transmission_endpoint=record.get("transmission_endpoint") or None,
+                profiles=_build_profiles(record.get("profiles")),
+                **_build_rules(record),
+            )
+        except ValidationError as exc:
+            errors.append({"index": index, "url": feed_url, "error": _validation_message(exc)})
+            continue
+        except ValueError as exc:
+            errors.append({"index": index, "url": feed_url, "error": str(exc)})
+            continue
+        batch_urls.add(normalized_url)
+        items.append(rss_item)
+
+    if errors:
+        # All-or-nothing: nothing is written when any record is invalid
+        raise HTTPException(status_code=400, detail={"message": "Import validation failed", "errors": errors})
+
+    if items:
+        await run_in_threadpool(rss.add_rss_bulk, items)
+    return {"ok": True, "added": len(items), "ids": [item.id for item in items], "skipped": skipped}
+
+
 @router.put("/feeds/{feed_id}")
 def update_feed(feed_id: str, feed_data: dict, rss: RSSManager = Depends(get_rss_manager)):
-    if feed_id not in rss.storage["rss"]:
+    if feed_id not in rss.feeds:
         raise HTTPException(status_code=404, detail="Feed not found")
-    existing = rss.storage["rss"][feed_id]
-    rss_item = RSSItem(
-        id=feed_id,
-        name=feed_data.get("name", existing.get("name", "")),
-        url=feed_data.get("url", existing.get("url", "")),
-        pt_site=feed_data.get("pt_site", existing.get("pt_site", DEFAULT_PT_SITE)),
-        key_words=feed_data.get("key_words", existing.get("key_words", "")),
-        path=feed_data.get("path", existing.get("path", "")),
-        interval=feed_data.get("interval", existing.get("interval", 10)),
-        last_fetch=existing.get("last_fetch"),
-        last_title=existing.get("last_title"),
-        last_status=existing.get("last_status"),
-        last_error=existing.get("last_error"),
-    )
+    existing = model_to_dict(rss.feeds.get(feed_id))
+    try:
+        if "profiles" in feed_data:
+            profiles = _build_profiles(feed_data["profiles"], existing.get("profiles"))
+        else:
+            profiles = _build_profiles(existing.get("profiles"), existing.get("profiles"))
+        rules = _build_rules(feed_data, existing)
+        # Runtime state (last_fetch, last_title, fetch counters, ...) is carried over from storage
+        rss_item = RSSItem(**{
+            **existing,
+            "id": feed_id,
+            "name": feed_data.get("name", existing.get("name", "")),
+            "url": feed_data.get("url", existing.get("url", "")),
+            "pt_site": feed_data.get("pt_site", existing.get("pt_site", DEFAULT_PT_SITE)),
+            "key_words": feed_data.get("key_words", existing.get("key_words", "")),
+            "path": feed_data.get("path", existing.get("path", "")),
+            "interval": feed_data.get("interval", existing.get("interval", 10)),
+            "max_response_bytes": feed_data.get("max_response_bytes", existing.get("max_response_bytes")),
+            "transmission_endpoint": feed_data.get("transmission_endpoint", existing.get("transmission_endpoint")) or None,
+            "profiles": profiles,
+            **rules,
+        })
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=_validation_message(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     rss.add_rss(rss_item)
     return {"ok": True}
 
 
 @router.delete("/feeds/{feed_id}")
 def delete_feed(feed_id: str, rss: RSSManager = Depends(get_rss_manager)):
-    if feed_id not in rss.storage["rss"]:
+    if feed_id not in rss.feeds:
         raise HTTPException(status_code=404, detail="Feed not found")
     rss.delete_rss(feed_id)
     return {"ok": True}
 
 
-@router.post("/feeds/{feed_id}/check")
-def check_feed(feed_id: str, rss: RSSManager = Depends(get_rss_manager)):
-    if feed_id not in rss.storage["rss"]:
-        raise HTTPException(status_code=404, detail="Feed not found")
+def _submit_check_job(feed_id: str, trigger: str, rss: RSSManager) -> dict:
     try:
-        rss.run_check_now(feed_id, trigger="manual")
+        job = rss.submit_check_job(feed_id, trigger=trigger)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Feed not found")
+    except WorkerUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc))
-    return {"ok": True, "newItems": []}  # TODO: Return actual new items count
+    return {"ok": True, "jobId": job["id"], "job": job}
+
+
+@router.post("/feeds/{feed_id}/check", status_code=202)
+def check_feed(feed_id: str, rss: RSSManager = Depends(get_rss_manager)):
+    # Runs in the background; poll GET /api/jobs/{jobId} for progress and new items
+    return _submit_check_job(feed_id, "manual", rss)
 
 
 @router.get("/feeds/{feed_id}/logs")
 def get_feed_logs(feed_id: str, rss: RSSManager = Depends(get_rss_manager)):
-    if feed_id not in rss.storage["rss"]:
+    if feed_id not in rss.feeds:
         raise HTTPException(status_code=404, detail="Feed not found")
     log_content = rss.get_logs(feed_id)
     # Convert log string to array format expected by frontend
@@ -219,14 +496,140 @@ def get_feed_logs(feed_id: str, rss: RSSManager = Depends(get_rss_manager)):
     return logs
 
 
-@router.post("/feeds/{feed_id}/send")
+@router.post("/feeds/{feed_id}/send", status_code=202)
 def send_to_transmission(feed_id: str, payload: dict, rss: RSSManager = Depends(get_rss_manager)):
     # This endpoint is for sending specific items to Transmission
     # For now, we'll trigger a check which will send new items automatically
-    if feed_id not in rss.storage["rss"]:
-        raise HTTPException(status_code=404, detail="Feed not found")
-    try:
-        rss.run_check_now(feed_id, trigger="manual-send")
-    except RuntimeError as exc:
-        raise HTTPException(status_code=409, detail=str(exc))
-    return {"ok": True}
+    return _submit_check_job(feed_id, "manual-send", rss)
+
+
+@router.get("/search")
+def search_torrents(
+    q: str,
+    feed_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    rss: RSSManager = Depends(get_rss_manager),
+):
+    """Keyword search over every feed's cached torrents ("a b" = both words, "a; b" = either)."""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="q is required")
+    total, hits = rss.search_torrents(q, feed_id=feed_id, limit=min(max(limit or DEFAULT_SEARCH_LIMIT, 1), MAX_SEARCH_LIMIT))
+    feeds = rss.list_rss()
+    for hit in hits:
+        item = feeds.get(hit["feedId"])
+        hit["feedName"] = item.name if item is not None else ""
+    return {"items": hits, "total": total}
+
+
+@router.post("/search/send")
+def send_search_results(payload: dict, rss: RSSManager = Depends(get_rss_manager)):
+    """Send cached entries picked from /api/search: {"items": [{"feedId", "title", "profileId"?}]}."""
+    items = payload.get("items")
+    if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+        raise HTTPException(status_code=400, detail="items must be a non-empty list of {feedId, title}")
+    return {"results": rss.send_backfill(items)}
+
+
+@router.get("/health")
+def health(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.health()
+
+
+@router.get("/breakers")
+def list_breakers(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.breakers.snapshot()
+
+
+@router.get("/transmission/endpoints")
+def list_transmission_endpoints(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.transmission_endpoints_status()
+
+
+@router.get("/runs/active")
+def get_active_runs(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.active_runs_status()
+
+
+@router.get("/runs/queue")
+def get_run_queue(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.run_queue_status()
+
+
+@router.get("/storage/usage")
+def get_storage_usage(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.storage_usage()
+
+
+@router.get("/cluster")
+def get_cluster(rss: RSSManager = Depends(get_rss_manager)):
+    return rss.cluster_status()
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str, rss: RSSManager = Depends(get_rss_manager)):
+    job = rss.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+# -------------------------------
+# Live event stream (SSE)
+# -------------------------------
+def _format_sse(event_id: int, event_type: str, data: dict) -> str:
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("/events")
+async def stream_events(
+    request: Request,
+    last_event_id: Optional[int] = None,
+    feedId: Optional[str] = None,
+    rss: RSSManager = Depends(get_rss_manager),
+):
+    """
+    Push run lifecycle and feed changes; resumes from Last-Event-ID after a reconnect.
+    ?feedId= narrows the stream to one feed and adds its log lines. Watchers are per process and a run
+    only publishes log lines while its own worker has one, so in cluster mode they only cover runs on
+    the worker serving the stream.
+    """
+    header_id = request.headers.get("last-event-id", "").strip()
+    if header_id.isdigit():
+        last_event_id = int(header_id)
+
+    def wanted(event) -> bool:
+        if feedId is None:
+            # Log lines of feeds watched by other clients are not for this stream
+            return event["type"] != "log"
+        return event["data"].get("feedId") == feedId
+
+    async def event_source():
+        cursor = last_event_id if last_event_id is not None else rss.events.last_id
+        if feedId is not None:
+            rss.watch_feed_logs(feedId)
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                events, missed = await rss.events.wait_for_events(cursor, EVENT_STREAM_HEARTBEAT_SECONDS)
+                if missed:
+                    # Buffer no longer covers the client's position: tell it to reload state
+                    cursor = rss.events.last_id
+                    yield _format_sse(cursor, "resync", {"reason": "event_buffer_overrun"})
+                    continue
+                sent = False
+                for event in events:
+                    cursor = event["id"]
+                    if wanted(event):
+                        yield _format_sse(event["id"], event["type"], event["data"])
+                        sent = True
+                if not sent:
+                    yield ": keep-alive\n\n"
+        finally:
+            if feedId is not None:
+                rss.unwatch_feed_logs(feedId)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
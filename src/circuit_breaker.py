@@ -0,0 +1,103 @@
+"""
+Circuit breakers for tracker hosts and Transmission endpoints
+"""
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    closed: calls pass; failure_threshold consecutive failures open the breaker.
+    open: calls are refused until reset_seconds have passed, then one probe is let through (half-open).
+    half-open: the probe's success closes the breaker, its failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self._clock() - self.opened_at >= self.reset_seconds:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self.last_error = None
+            self._probe_in_flight = False
+
+    def record_failure(self, error: str = ""):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error or None
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 when calls are allowed)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(self.reset_seconds - (self._clock() - self.opened_at), 0.0)
+
+    def snapshot(self) -> dict:
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "failures": self.failures,
+                "retryIn": round(retry_in, 1),
+                "lastError": self.last_error,
+            }
+
+
+class BreakerRegistry:
+    """Breakers created on first use, keyed by name (e.g. "host:tracker.example", "transmission:nas:9091")."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, self.failure_threshold, self.reset_seconds)
+                self._breakers[name] = breaker
+            return breaker
+
+    def peek(self, name: str):
+        with self._lock:
+            return self._breakers.get(name)
+
+    def snapshot(self) -> list:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.snapshot() for breaker in sorted(breakers, key=lambda breaker: breaker.name)]
@@ -0,0 +1,325 @@
+"""
+Multi-worker coordination: file locks, leader election, shard leases and the worker check RPC
+"""
+import bisect
+import hashlib
+import json
+import os
+import secrets
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+from src.general.lazy_import import lazy_import
+
+requests = lazy_import("requests")
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks (Windows): every process behaves as a single-worker deployment
+    fcntl = None
+
+WORKER_TOKEN_HEADER = "X-Worker-Token"
+
+
+class WorkerUnavailableError(RuntimeError):
+    """Raised when a check must go to the worker that schedules the feed but it is not reachable."""
+
+
+@contextmanager
+def file_lock(path: str):
+    """Exclusive inter-process lock held for the duration of the block."""
+    with open(path, "a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class LeaderElection:
+    """
+    Elect one scheduler per storage directory by holding a non-blocking flock on a lock file.
+
+    The kernel drops the lock when the holder exits, so a follower retrying every
+    retry_seconds takes over after the leader dies. The leader advertises its RPC
+    address in the lock file; followers read it to forward check requests.
+    """
+
+    def __init__(self, lock_path: str, on_elected, retry_seconds: float):
+        self.lock_path = lock_path
+        self.on_elected = on_elected
+        self.retry_seconds = retry_seconds
+        self.is_leader = False
+        self._handle = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def try_acquire(self) -> bool:
+        if self.is_leader:
+            return True
+        handle = open(self.lock_path, "a+")
+        if fcntl is not None:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                return False
+        self._handle = handle
+        self.is_leader = True
+        return True
+
+    def advertise(self, info: dict):
+        if self._handle is None:
+            return
+        self._handle.seek(0)
+        self._handle.truncate()
+        self._handle.write(json.dumps(info))
+        self._handle.flush()
+
+    def leader_info(self):
+        try:
+            with open(self.lock_path, "r", encoding="utf-8") as f:
+                raw = f.read()
+            return json.loads(raw) if raw else None
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def start(self):
+        if self.try_acquire():
+            self.on_elected()
+            return
+        self._thread = threading.Thread(target=self._campaign, daemon=True, name="leader-election")
+        self._thread.start()
+
+    def _campaign(self):
+        while not self._stop.wait(self.retry_seconds):
+            if self.try_acquire():
+                self.on_elected()
+                return
+
+    def stop(self):
+        self._stop.set()
+        if self._handle is not None:
+            if fcntl is not None:
+                fcntl.flock(self._handle, fcntl.LOCK_UN)
+            self._handle.close()
+            self._handle = None
+        self.is_leader = False
+
+
+class WorkerRPCServer:
+    """Loopback HTTP endpoint on a scheduling worker that accepts forwarded check jobs."""
+
+    def __init__(self, manager):
+        # Only scheduling workers serve RPC, so http.server is imported here rather than at startup
+        from http.server import ThreadingHTTPServer
+
+        self.manager = manager
+        self.token = secrets.token_hex(16)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name="worker-rpc")
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        from http.server import BaseHTTPRequestHandler
+
+        rpc = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                return None
+
+            def _reply(self, status: int, payload: dict):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _authorized(self) -> bool:
+                if self.headers.get(WORKER_TOKEN_HEADER) == rpc.token:
+                    return True
+                self._reply(403, {"detail": "invalid worker token"})
+                return False
+
+            def do_POST(self):
+                if not self._authorized():
+                    return
+                if self.path != "/check":
+                    self._reply(404, {"detail": "not found"})
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                    # The feed may have been created by the forwarding worker a moment ago
+                    rpc.manager.refresh_storage()
+                    job = rpc.manager.queue_local_check_job(body["feedId"], trigger=body.get("trigger", "manual"))
+                except KeyError:
+                    self._reply(404, {"detail": "Feed not found"})
+                except RuntimeError as exc:
+                    self._reply(409, {"detail": str(exc)})
+                except ValueError as exc:
+                    self._reply(400, {"detail": str(exc)})
+                else:
+                    self._reply(202, job)
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                if not self.path.startswith("/jobs/"):
+                    self._reply(404, {"detail": "not found"})
+                    return
+                job = rpc.manager.get_job(self.path[len("/jobs/"):])
+                if job is None:
+                    self._reply(404, {"detail": "Job not found"})
+                else:
+                    self._reply(200, job)
+
+        return Handler
+
+
+class WorkerClient:
+    """Caller side of the worker RPC; the target's advertisement is passed per call so failover is picked up."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+
+    def _request(self, info, method: str, path: str, **kwargs):
+        if not info or "address" not in info:
+            raise WorkerUnavailableError("scheduler worker is not available yet")
+        try:
+            return requests.request(
+                method,
+                f"{info['address']}{path}",
+                headers={WORKER_TOKEN_HEADER: info.get("token", "")},
+                timeout=self.timeout,
+                **kwargs,
+            )
+        except requests.RequestException as exc:
+            raise WorkerUnavailableError(f"scheduler worker unreachable: {exc}") from exc
+
+    def submit_check(self, info, rss_id: str, trigger: str) -> dict:
+        response = self._request(info, "POST", "/check", json={"feedId": rss_id, "trigger": trigger})
+        if response.status_code == 404:
+            raise KeyError(f"RSS feed not found: {rss_id}")
+        if response.status_code == 409:
+            raise RuntimeError(response.json().get("detail", "another check is already running"))
+        if response.status_code != 202:
+            raise WorkerUnavailableError(f"scheduler worker returned HTTP {response.status_code}")
+        return response.json()
+
+    def get_job(self, info, job_id: str):
+        try:
+            response = self._request(info, "GET", f"/jobs/{job_id}")
+        except WorkerUnavailableError:
+            return None
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+
+class HashRing:
+    """Consistent-hash ring with virtual nodes; md5 keeps placement identical in every process."""
+
+    def __init__(self, members, vnodes: int):
+        self.members = sorted(members)
+        self._points = sorted(
+            (self._hash(f"{member}#{index}"), member)
+            for member in self.members
+            for index in range(vnodes)
+        )
+        self._keys = [point for point, _ in self._points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    def owner(self, key: str):
+        if not self._points:
+            return None
+        index = bisect.bisect(self._keys, self._hash(key)) % len(self._points)
+        return self._points[index][1]
+
+
+class ShardMembership:
+    """
+    Worker leases for sharded scheduling: one JSON file per worker under lease_dir.
+
+    A lease is live while its heartbeat is newer than lease_ttl and, for workers on this
+    host, while its pid still exists; expired leases are removed by whoever sees them.
+    """
+
+    def __init__(self, lease_dir: str, worker_id: str, lease_ttl: float):
+        self.lease_dir = lease_dir
+        self.worker_id = worker_id
+        self.lease_ttl = lease_ttl
+        os.makedirs(lease_dir, exist_ok=True)
+
+    def _lease_path(self, worker_id: str) -> str:
+        return os.path.join(self.lease_dir, f"{worker_id}.json")
+
+    def heartbeat(self, info: dict):
+        lease = {**info, "workerId": self.worker_id, "host": socket.gethostname(), "heartbeat": time.time()}
+        tmp_path = f"{self._lease_path(self.worker_id)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(lease, f)
+        os.replace(tmp_path, self._lease_path(self.worker_id))
+
+    def leave(self):
+        try:
+            os.remove(self._lease_path(self.worker_id))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _pid_alive(pid) -> bool:
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except (PermissionError, TypeError, ValueError):
+            return True
+        return True
+
+    def live_members(self) -> dict:
+        now = time.time()
+        members = {}
+        for name in os.listdir(self.lease_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.lease_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    lease = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            expired = now - lease.get("heartbeat", 0) > self.lease_ttl
+            if lease.get("host") == socket.gethostname() and not self._pid_alive(lease.get("pid")):
+                expired = True
+            if expired and lease.get("workerId") != self.worker_id:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            members[lease["workerId"]] = lease
+        return members
@@ -0,0 +1,95 @@
+"""
+Size / category / freeleech metadata from RSS entries, and the per-feed pre-send rules that use it
+"""
+import re
+
+# Trackers print binary sizes with either suffix ("GB" and "GiB" both mean 1024^3)
+_SIZE_UNITS = {
+    "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4,
+    "kib": 1024, "mib": 1024 ** 2, "gib": 1024 ** 3, "tib": 1024 ** 4,
+}
+# "[12.3 GB]", "Size: 700MiB"; some trackers print the size in the title
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]i?B)\b", re.IGNORECASE)
+# Promotion tags in titles: "[Free]", "(2xFree)", "【免费】", "2xFree", "Freeleech". A bare "Free" is part
+# of too many release names ("Free Solo", "Born Free") to count
+_FREELEECH_TITLE_RE = re.compile(
+    r"[\[(【]\s*(?:2x\s*)?(?:free(?:leech)?|免费)\s*[\])】]|(?<![a-z0-9])(?:2x\s*(?:free|免费)|freeleech)(?![a-z])",
+    re.IGNORECASE,
+)
+# Categories/tags are promotion fields of their own, so a whole-term "Free" counts there
+_FREELEECH_TERM_RE = re.compile(r"^\s*(?:2x\s*)?(?:free(?:leech)?|免费)\s*$", re.IGNORECASE)
+
+BYTES_PER_MB = 1024 ** 2
+
+
+def entry_get(entry, key, default=None):
+    """Field of a raw feedparser entry (dict-like) or a compact one (attributes)."""
+    getter = getattr(entry, "get", None)
+    if getter is not None:
+        return getter(key, default)
+    return getattr(entry, key, default)
+
+
+def parse_size(text: str):
+    match = _SIZE_RE.search(text or "")
+    if not match:
+        return None
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+def entry_size(entry):
+    """Bytes from the enclosure length, a site "size" field, or a size printed in the title."""
+    for link in entry_get(entry, "links") or []:
+        length = link.get("length")
+        if length and str(length).isdigit() and int(length) > 0:
+            return int(length)
+    size = entry_get(entry, "size")
+    if size is not None:
+        if str(size).isdigit():
+            return int(size)
+        parsed = parse_size(str(size))
+        if parsed is not None:
+            return parsed
+    return parse_size(entry_get(entry, "title", ""))
+
+
+def entry_categories(entry) -> list:
+    categories = [tag.get("term") for tag in entry_get(entry, "tags") or [] if tag.get("term")]
+    category = entry_get(entry, "category")
+    if category and category not in categories:
+        categories.append(category)
+    return categories
+
+
+def entry_metadata(entry) -> dict:
+    """Rule inputs for a compact FeedEntry (size and categories were extracted when it was built)."""
+    categories = list(entry.categories)
+    freeleech = bool(_FREELEECH_TITLE_RE.search(entry.title or "")) or any(
+        _FREELEECH_TERM_RE.match(category) for category in categories
+    )
+    return {
+        "size": entry.size,
+        "categories": categories,
+        "freeleech": freeleech,
+    }
+
+
+def has_rules(item) -> bool:
+    return bool(item.min_size_mb or item.max_size_mb or item.categories or item.freeleech_only)
+
+
+def rejection_reason(meta: dict, item):
+    """Return why an entry fails the feed's rules (e.g. "max_size"), or None when it may be sent."""
+    size = meta.get("size")
+    # Entries without a known size pass the size rules: the tracker did not say, so do not guess
+    if item.min_size_mb and size is not None and size < item.min_size_mb * BYTES_PER_MB:
+        return "min_size"
+    if item.max_size_mb and size is not None and size > item.max_size_mb * BYTES_PER_MB:
+        return "max_size"
+    if item.categories:
+        allowed = {category.strip().lower() for category in item.categories.split(";") if category.strip()}
+        if allowed and not any(category.lower() in allowed for category in meta.get("categories") or []):
+            return "category"
+    if item.freeleech_only and not meta.get("freeleech"):
+        return "not_freeleech"
+    return None
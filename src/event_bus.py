@@ -0,0 +1,191 @@
+"""
+Event bus backing the /api/events server-sent event stream, optionally shared across workers
+"""
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+from src.cluster import file_lock
+
+
+class EventBus:
+    """
+    Recent events with increasing ids, kept in a ring buffer.
+
+    attach_journal() shares the id sequence between worker processes: every publish appends to
+    one journal file under an inter-process lock, and a tail thread in every worker reads what
+    the others appended, so a Last-Event-ID issued by one worker means the same position on all
+    of them and run events reach clients connected to any worker. The journal is compacted to the
+    buffer size once it holds twice as many events.
+
+    Journal I/O runs under its own lock, never under the buffer lock, so the async side
+    (events_after, wait_for_events) only ever waits for in-memory updates.
+    """
+
+    def __init__(self, max_events: int):
+        # Seed ids from wall-clock millis so a Last-Event-ID from a previous process is detected as stale
+        self._next_id = int(time.time() * 1000)
+        self._max_events = max_events
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()  # buffer and waiters
+        self._waiters = set()
+        self._journal_lock = threading.Lock()  # journal reads/appends and the offsets below
+        self._journal = None  # shared journal path once attached
+        self._journal_inode = None
+        self._journal_offset = 0  # bytes of the journal already read
+        self._journal_lines = 0
+        self._journal_last_id = None
+        self._closed = threading.Event()
+
+    @property
+    def last_id(self) -> int:
+        with self._lock:
+            return self._next_id - 1
+
+    def attach_journal(self, path: str, poll_seconds: float):
+        """Share ids and events with the other workers appending to path."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._journal_lock, file_lock(f"{path}.lock"):
+            with self._lock:
+                # Events published before joining used this process's own ids
+                self._events.clear()
+            self._journal = path
+            self._read_journal()
+            if self._journal_last_id is None:
+                # New journal: record where ids start, so workers joining later continue from there
+                self._append_journal({"id": self.last_id})
+        threading.Thread(target=self._tail_loop, args=(poll_seconds,), daemon=True, name="event-journal").start()
+
+    def close(self):
+        """Stop tailing the journal."""
+        self._closed.set()
+
+    def _tail_loop(self, poll_seconds: float):
+        while not self._closed.wait(poll_seconds):
+            self.poll()
+
+    def _read_journal(self) -> bool:
+        # Caller holds self._journal_lock. Only complete lines are consumed; a line being appended is read next time
+        try:
+            handle = open(self._journal, "rb")
+        except FileNotFoundError:
+            return False
+        with handle:
+            stat = os.fstat(handle.fileno())
+            if stat.st_ino != self._journal_inode or stat.st_size < self._journal_offset:
+                # Compacted by another worker: read it again, skipping the events already buffered
+                self._journal_inode = stat.st_ino
+                self._journal_offset = 0
+                self._journal_lines = 0
+            handle.seek(self._journal_offset)
+            chunk = handle.read()
+        end = chunk.rfind(b"\n") + 1
+        self._journal_offset += end
+        added = []
+        for line in chunk[:end].splitlines():
+            self._journal_lines += 1
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if self._journal_last_id is not None and event["id"] <= self._journal_last_id:
+                continue
+            self._journal_last_id = event["id"]
+            added.append(event)
+        if not added:
+            return False
+        with self._lock:
+            self._next_id = added[-1]["id"] + 1
+            # The start marker carries no type
+            self._events.extend(event for event in added if "type" in event)
+        return True
+
+    def _append_journal(self, event: dict):
+        # Caller holds self._journal_lock and the journal file lock, and has read the journal to its end
+        with open(self._journal, "ab") as f:
+            f.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._journal_offset = f.tell()
+            self._journal_inode = os.fstat(f.fileno()).st_ino
+        self._journal_lines += 1
+        self._journal_last_id = event["id"]
+        if self._journal_lines >= 2 * self._max_events:
+            with self._lock:
+                buffered = list(self._events)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._journal) or ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                for kept in buffered:
+                    f.write(json.dumps(kept, ensure_ascii=False).encode("utf-8") + b"\n")
+                self._journal_offset = f.tell()
+            os.replace(tmp_path, self._journal)
+            self._journal_inode = os.stat(self._journal).st_ino
+            self._journal_lines = len(buffered)
+
+    def poll(self) -> bool:
+        """Pick up events other workers appended to the journal; True when there were any."""
+        if self._journal is None:
+            return False
+        with self._journal_lock:
+            added = self._read_journal()
+        if added:
+            self._wake_waiters()
+        return added
+
+    def publish(self, event_type: str, data: dict) -> int:
+        if self._journal is None:
+            with self._lock:
+                event_id = self._next_id
+                self._next_id += 1
+                self._events.append({"id": event_id, "type": event_type, "data": data})
+        else:
+            with self._journal_lock, file_lock(f"{self._journal}.lock"):
+                self._read_journal()
+                with self._lock:
+                    event_id = self._next_id
+                    self._next_id += 1
+                    event = {"id": event_id, "type": event_type, "data": data}
+                    self._events.append(event)
+                self._append_journal(event)
+        self._wake_waiters()
+        return event_id
+
+    def _wake_waiters(self):
+        with self._lock:
+            waiters = list(self._waiters)
+        # Publishers and the tail thread run off the event loop; wake async subscribers on their own loops
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # Loop already closed (client went away during shutdown)
+                pass
+
+    def events_after(self, last_id: int):
+        """Return (events, missed); missed is True when last_id is no longer covered by the buffer."""
+        with self._lock:
+            newest = self._next_id - 1
+            oldest = self._events[0]["id"] if self._events else self._next_id
+            if last_id > newest or last_id < oldest - 1:
+                return [], True
+            return [event for event in self._events if event["id"] > last_id], False
+
+    async def wait_for_events(self, last_id: int, timeout: float):
+        loop = asyncio.get_running_loop()
+        waiter = (loop, asyncio.Event())
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            events, missed = self.events_after(last_id)
+            if events or missed:
+                return events, missed
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self.events_after(last_id)
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
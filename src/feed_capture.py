@@ -0,0 +1,162 @@
+"""
+Opt-in capture of raw feed responses, stored gzipped and content-addressed, for offline replay
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from src.cluster import file_lock
+from src.general.general_class import model_to_dict
+
+MANIFEST_FILE = "manifest.jsonl"
+MANIFEST_LOCK_FILE = "manifest.jsonl.lock"
+# Session/credential headers are never written to disk
+DROPPED_HEADERS = {"set-cookie", "cookie", "authorization", "proxy-authorization"}
+# Per-fetch counters and the URL (trackers put passkeys in it) are not part of a feed's replayable config
+NON_CONFIG_FIELDS = {"url", "last_wire_bytes", "last_decoded_bytes", "total_wire_bytes", "total_decoded_bytes"}
+
+
+def feed_config(item) -> dict:
+    """What a replay needs to rebuild the feed as it was when the response was fetched."""
+    return {name: value for name, value in model_to_dict(item).items() if name not in NON_CONFIG_FIELDS}
+
+
+class FeedCapture:
+    """
+    blobs/<sha256[:2]>/<sha256>.gz holds each distinct body once, so an unchanged feed costs one
+    manifest line per fetch. manifest.jsonl lists the fetches oldest first.
+
+    When the stored blobs exceed max_bytes, the oldest records are dropped together with the
+    blobs no remaining record uses. Writes hold an inter-process lock, and pruning starts from
+    the manifest on disk, so workers sharing the directory keep each other's records.
+    """
+
+    def __init__(self, capture_dir: str, max_bytes: int):
+        self.capture_dir = capture_dir
+        self.max_bytes = max_bytes
+        self.manifest_path = os.path.join(capture_dir, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._records = None  # loaded on first use
+        self._refs = Counter()
+        self._blob_bytes = {}
+
+    def _blob_path(self, sha: str) -> str:
+        return os.path.join(self.capture_dir, "blobs", sha[:2], f"{sha}.gz")
+
+    def _load(self):
+        if self._records is not None:
+            return
+        self._records = []
+        self._refs.clear()
+        self._blob_bytes.clear()
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line after a crash
+                    if os.path.exists(self._blob_path(record.get("sha256", ""))):
+                        self._records.append(record)
+        except FileNotFoundError:
+            pass
+        for record in self._records:
+            sha = record["sha256"]
+            self._refs[sha] += 1
+            self._blob_bytes.setdefault(sha, record.get("storedBytes", 0))
+
+    def record(self, rss_id: str, item, status_code: int, headers, body: bytes, elapsed: float = 0.0) -> str:
+        """Store one fetched body; returns its sha256."""
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(sha)
+        with self._lock:
+            self._load()
+            os.makedirs(self.capture_dir, exist_ok=True)
+            with file_lock(os.path.join(self.capture_dir, MANIFEST_LOCK_FILE)):
+                # Another worker may have pruned the blob since we loaded: check the disk, not our view of it
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                    # mtime=0 keeps identical bodies byte-identical on disk
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(gzip.compress(body, compresslevel=6, mtime=0))
+                    os.replace(tmp_path, path)
+                if sha not in self._blob_bytes:
+                    self._blob_bytes[sha] = os.path.getsize(path)
+                record = {
+                    "ts": time.time(),
+                    "feedId": rss_id,
+                    "host": urlsplit(item.url).hostname or "",
+                    "status": status_code,
+                    "headers": {key: value for key, value in dict(headers or {}).items() if key.lower() not in DROPPED_HEADERS},
+                    "sha256": sha,
+                    "bytes": len(body),
+                    "storedBytes": self._blob_bytes[sha],
+                    "elapsed": round(elapsed, 3),
+                    "feed": feed_config(item),
+                }
+                with open(self.manifest_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._records.append(record)
+                self._refs[sha] += 1
+                self._prune()
+        return sha
+
+    def _stored_bytes(self) -> int:
+        return sum(self._blob_bytes.values())
+
+    def _prune(self):
+        # Caller holds the manifest file lock
+        if self._stored_bytes() <= self.max_bytes:
+            return
+        # Other workers append to the same manifest: prune from the file, not from our records
+        self._records = None
+        self._load()
+        stored = self._stored_bytes()
+        dropped = 0
+        # Always keep the newest record so the capture just written survives
+        while stored > self.max_bytes and dropped < len(self._records) - 1:
+            sha = self._records[dropped]["sha256"]
+            dropped += 1
+            self._refs[sha] -= 1
+            if self._refs[sha] <= 0:
+                del self._refs[sha]
+                stored -= self._blob_bytes.pop(sha, 0)
+                try:
+                    os.remove(self._blob_path(sha))
+                except OSError:
+                    pass
+        self._records = self._records[dropped:]
+        fd, tmp_path = tempfile.mkstemp(dir=self.capture_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for record in self._records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.manifest_path)
+
+    def records(self, feed_ids=None) -> list:
+        """Fetch records oldest first, optionally only for the given feeds."""
+        with self._lock:
+            self._load()
+            wanted = set(feed_ids) if feed_ids else None
+            return [record for record in self._records if wanted is None or record["feedId"] in wanted]
+
+    def body(self, sha: str) -> bytes:
+        with open(self._blob_path(sha), "rb") as f:
+            return gzip.decompress(f.read())
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._load()
+            return {
+                "records": len(self._records),
+                "feeds": len({record["feedId"] for record in self._records}),
+                "blobs": len(self._blob_bytes),
+                "storedBytes": self._stored_bytes(),
+                "maxBytes": self.max_bytes,
+            }
@@ -0,0 +1,179 @@
+"""
+Feed parsing into compact entry records, optionally offloaded to a process pool for large documents
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from src.entry_metadata import entry_categories, entry_get, entry_size
+from src.general.lazy_import import lazy_import
+from src.transmission_snapshot import entry_infohash
+
+feedparser = lazy_import("feedparser")
+
+PARSE_INLINE = "inline"
+PARSE_PROCESS = "process"
+
+
+class FeedParseError(Exception):
+    """Stands in for the bozo exception of a document parsed in a worker process."""
+
+
+class FeedParseTimeout(Exception):
+    """A worker process did not finish parsing in time. Not a TimeoutError: the host answered, the document is the problem."""
+
+
+class FeedEntry:
+    """
+    What a run needs from one RSS entry, extracted once after parsing.
+
+    The feedparser tree (summary_detail, content HTML, every link dict) is dropped with it.
+    """
+
+    __slots__ = ("title", "guid", "link", "size", "published", "categories", "infohash")
+
+    def __init__(self, title, guid, link, size, published, categories, infohash):
+        self.title = title
+        self.guid = guid
+        self.link = link
+        self.size = size
+        self.published = published
+        self.categories = categories
+        self.infohash = infohash
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"FeedEntry(title={self.title!r}, link={self.link!r})"
+
+
+class ParsedFeed:
+    __slots__ = ("bozo", "bozo_exception", "entries")
+
+    def __init__(self, bozo, bozo_exception, entries):
+        self.bozo = bozo
+        self.bozo_exception = bozo_exception
+        self.entries = entries
+
+    def __getstate__(self):
+        return (self.bozo, self.bozo_exception, self.entries)
+
+    def __setstate__(self, state):
+        self.bozo, self.bozo_exception, self.entries = state
+
+
+def extract_torrent_link(entry):
+    """The enclosure / bittorrent link of a raw entry, else its first link."""
+    links = entry_get(entry, "links") or []
+    for link in links:
+        href = link.get("href")
+        rel = str(link.get("rel", "")).lower()
+        link_type = str(link.get("type", "")).lower()
+        if href and (rel == "enclosure" or "bittorrent" in link_type):
+            return href
+    for link in links:
+        href = link.get("href")
+        if href:
+            return href
+    return None
+
+
+def compact_entry(entry) -> FeedEntry:
+    return FeedEntry(
+        title=entry_get(entry, "title", "") or "",
+        guid=entry_get(entry, "id"),
+        link=extract_torrent_link(entry),
+        size=entry_size(entry),
+        published=entry_get(entry, "published") or entry_get(entry, "updated"),
+        categories=tuple(entry_categories(entry)),
+        infohash=entry_infohash(entry),
+    )
+
+
+def compact_feed(feed, portable: bool = False) -> ParsedFeed:
+    """
+    Convert a parse result into a ParsedFeed (already compact feeds are returned as-is).
+
+    portable=True replaces the bozo exception with a FeedParseError so the result pickles.
+    """
+    if isinstance(feed, ParsedFeed):
+        return feed
+    bozo_exception = entry_get(feed, "bozo_exception")
+    if portable and bozo_exception is not None:
+        bozo_exception = FeedParseError(str(bozo_exception))
+    return ParsedFeed(
+        bool(entry_get(feed, "bozo")),
+        bozo_exception,
+        [compact_entry(entry) for entry in entry_get(feed, "entries") or []],
+    )
+
+
+def parse_compact(content: bytes) -> ParsedFeed:
+    """Worker-side parse: only the compact records cross the process boundary."""
+    return compact_feed(feedparser.parse(content), portable=True)
+
+
+class FeedParsePool:
+    """
+    Parse documents of at least min_bytes in worker processes, smaller ones in the calling thread.
+
+    Worker processes are spawned lazily on the first large document; workers=0 disables the pool.
+    """
+
+    def __init__(self, workers: int, min_bytes: int, timeout: float):
+        self.workers = workers
+        self.min_bytes = min_bytes
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that holds scheduler threads and locks is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _reset_executor(self, executor, kill: bool = False):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # shutdown() alone waits for a hung worker forever; kill it so the pool's processes are freed
+        processes = list((getattr(executor, "_processes", None) or {}).values()) if kill else []
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+    def parse(self, content: bytes):
+        """Return (ParsedFeed, mode) where mode is PARSE_INLINE or PARSE_PROCESS."""
+        if self.workers <= 0 or len(content) < self.min_bytes:
+            return compact_feed(feedparser.parse(content)), PARSE_INLINE
+        executor = self._get_executor()
+        try:
+            feed = executor.submit(parse_compact, content).result(timeout=self.timeout)
+        except BrokenProcessPool:
+            # A worker died (OOM, killed); start a fresh pool next time and parse this one here
+            self._reset_executor(executor)
+            return compact_feed(feedparser.parse(content)), PARSE_INLINE
+        except FutureTimeoutError:
+            # The hung worker would hold its slot for good: replace the whole pool. Parses running
+            # in the other workers fail with BrokenProcessPool and fall back to inline parsing.
+            self._reset_executor(executor, kill=True)
+            raise FeedParseTimeout(f"feed parse exceeded timeout={self.timeout}s ({len(content)} bytes)")
+        return feed, PARSE_PROCESS
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,179 @@
+"""
+In-memory registry of typed feeds (RSSItem) with copy-on-write read snapshots
+"""
+import threading
+from types import MappingProxyType
+
+from pydantic import ValidationError
+
+from src.general.general_class import RSSItem, model_to_dict
+
+ALL_FIELDS = None  # dirty marker: re-serialize the whole feed
+
+
+class FeedRegistry:
+    """
+    rss_id -> RSSItem, validated once when loaded or written through the API.
+
+    Stored items are never mutated in place: update()/put() swap in a new object, so a
+    snapshot() handed to a reader stays consistent while the scheduler keeps writing.
+    Serialized dicts are cached per feed and only the fields written since the last
+    serialize() are dumped again.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._items = {}
+        self._snapshot = None
+        self._serialized = {}
+        self._dirty = {}  # rss_id -> set of field names, or ALL_FIELDS
+        self._invalid = {}  # rss_id -> raw dict that failed validation, written back untouched
+        self.version = 0
+
+    # ---------------------
+    # Loading
+    # ---------------------
+    def load(self, raw_feeds: dict):
+        """Replace every feed from storage dicts; returns the ids that failed validation."""
+        with self._lock:
+            self._items = {}
+            self._serialized = {}
+            self._dirty = {}
+            self._invalid = {}
+            for rss_id, raw in raw_feeds.items():
+                self._load_one(rss_id, raw)
+            self._changed()
+            return list(self._invalid)
+
+    def _load_one(self, rss_id: str, raw: dict):
+        try:
+            self._items[rss_id] = RSSItem(**raw)
+        except (TypeError, ValidationError):
+            self._items.pop(rss_id, None)
+            self._serialized.pop(rss_id, None)
+            self._invalid[rss_id] = raw
+            return False
+        self._serialized[rss_id] = raw
+        self._dirty.pop(rss_id, None)
+        self._invalid.pop(rss_id, None)
+        return True
+
+    def load_one(self, rss_id: str, raw: dict) -> bool:
+        """Adopt one feed as stored by another worker (already serialized, so not dirty)."""
+        with self._lock:
+            loaded = self._load_one(rss_id, raw)
+            self._changed()
+            return loaded
+
+    # ---------------------
+    # Reads
+    # ---------------------
+    def get(self, rss_id: str):
+        return self._items.get(rss_id)
+
+    def __contains__(self, rss_id) -> bool:
+        return rss_id in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def ids(self) -> list:
+        with self._lock:
+            return list(self._items)
+
+    def all_ids(self) -> list:
+        """Every stored feed id, including feeds kept raw because they failed validation."""
+        with self._lock:
+            return [*self._items, *self._invalid]
+
+    def snapshot(self):
+        """Read-only rss_id -> RSSItem view, shared by every reader until the next write."""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = MappingProxyType(dict(self._items))
+            return self._snapshot
+
+    def raw(self, rss_id: str):
+        """Storage dict for one feed (as it would be written by serialize())."""
+        with self._lock:
+            if rss_id in self._invalid:
+                return self._invalid[rss_id]
+            if rss_id not in self._items:
+                return None
+            self._flush_one(rss_id)
+            return self._serialized[rss_id]
+
+    # ---------------------
+    # Writes
+    # ---------------------
+    def _changed(self):
+        self._snapshot = None
+        self.version += 1
+
+    def _mark_dirty(self, rss_id: str, fields):
+        if fields is ALL_FIELDS or self._dirty.get(rss_id, set()) is ALL_FIELDS or rss_id not in self._serialized:
+            self._dirty[rss_id] = ALL_FIELDS
+        else:
+            self._dirty.setdefault(rss_id, set()).update(fields)
+
+    def put(self, item: RSSItem):
+        """Insert or replace a feed; only the fields that differ from the stored copy become dirty."""
+        with self._lock:
+            previous = self._items.get(item.id)
+            if previous is None:
+                fields = ALL_FIELDS
+            else:
+                fields = {name for name in RSSItem.model_fields if getattr(previous, name) != getattr(item, name)}
+                if not fields:
+                    return item
+            self._items[item.id] = item
+            self._invalid.pop(item.id, None)
+            self._mark_dirty(item.id, fields)
+            self._changed()
+            return item
+
+    def update(self, rss_id: str, **fields):
+        """Replace a feed with a copy carrying the given field values (no re-validation)."""
+        with self._lock:
+            item = self._items.get(rss_id)
+            if item is None:
+                return None
+            item = item.model_copy(update=fields)
+            self._items[rss_id] = item
+            self._mark_dirty(rss_id, set(fields))
+            self._changed()
+            return item
+
+    def remove(self, rss_id: str):
+        with self._lock:
+            removed = self._items.pop(rss_id, None)
+            self._serialized.pop(rss_id, None)
+            self._dirty.pop(rss_id, None)
+            self._invalid.pop(rss_id, None)
+            self._changed()
+            return removed
+
+    # ---------------------
+    # Serialization
+    # ---------------------
+    def _flush_one(self, rss_id: str):
+        if rss_id not in self._dirty:
+            return
+        fields = self._dirty.pop(rss_id)
+        item = self._items[rss_id]
+        if fields is ALL_FIELDS:
+            self._serialized[rss_id] = model_to_dict(item)
+            return
+        # The cached dict may still be referenced by an earlier serialize() result
+        data = dict(self._serialized[rss_id])
+        for name in fields:
+            value = getattr(item, name)
+            data[name] = [model_to_dict(profile) for profile in value] if name == "profiles" else value
+        self._serialized[rss_id] = data
+
+    def serialize(self) -> dict:
+        """rss_id -> storage dict for every feed, dumping only what changed since the last call."""
+        with self._lock:
+            for rss_id in list(self._dirty):
+                self._flush_one(rss_id)
+            return {**self._serialized, **self._invalid}
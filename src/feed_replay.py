@@ -0,0 +1,114 @@
+"""
+Replay captured feed responses through check_rss against an in-memory Transmission
+"""
+import hashlib
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+from src.general.general_class import RSSItem
+from src.run_pool import percentile
+from src.transmission_snapshot import link_infohash
+
+REPLAY_TRIGGER = "replay"
+
+
+class FakeTransmission:
+    """Just enough of transmission_rpc.Client for check_rss: add_torrent and get_torrents."""
+
+    def __init__(self):
+        self.torrents = {}  # hashString -> torrent
+        self.added = []
+
+    def add_torrent(self, link, download_dir=None):
+        infohash = link_infohash(link) or hashlib.sha1(link.encode("utf-8")).hexdigest()
+        torrent = self.torrents.get(infohash)
+        if torrent is None:
+            torrent = SimpleNamespace(hashString=infohash, name=link.rsplit("/", 1)[-1], status="downloading", download_dir=download_dir)
+            self.torrents[infohash] = torrent
+        self.added.append((link, download_dir))
+        return torrent
+
+    def get_torrents(self, arguments=None):
+        return list(self.torrents.values())
+
+
+class FeedReplay:
+    """
+    Drive a manager (normally one on a throwaway storage dir) with captured fetches, in capture order.
+
+    Each feed is created from the config captured with its first record and then keeps the state
+    its own replayed runs leave behind, so a sequence reproduces what the live runs saw.
+    No network: _fetch_feed returns the captured body, parsed by the manager's own parser.
+    """
+
+    def __init__(self, manager, capture, transmission=None):
+        self.manager = manager
+        self.capture = capture
+        self.transmission = transmission or FakeTransmission()
+        self._current = None
+
+    def install(self):
+        manager = self.manager
+        manager.feed_capture = None  # never re-capture replayed bodies
+        manager._fetch_feed = self._fetch_feed
+        manager._connect_transmission = self._connect_transmission
+        # Captures hold feed bodies only; fetching .torrent files would hit the live trackers
+        manager.torrent_files = None
+
+    def _fetch_feed(self, rss_id, item, run_id):
+        body = self.capture.body(self._current["sha256"])
+        item.last_wire_bytes = item.last_decoded_bytes = len(body)
+        item.total_wire_bytes = (item.total_wire_bytes or 0) + len(body)
+        item.total_decoded_bytes = (item.total_decoded_bytes or 0) + len(body)
+        feed, _ = self.manager.feed_parser.parse(body)
+        return feed
+
+    def _connect_transmission(self, rss_id, run_id, settings, affinity=None, exclude=()):
+        return self.transmission, self.manager.breakers.get("transmission:replay")
+
+    def _ensure_feed(self, record: dict):
+        if record["feedId"] in self.manager.feeds:
+            return
+        config = dict(record.get("feed") or {})
+        config.update(id=record["feedId"], url=f"replay://{record.get('host') or 'capture'}/{record['feedId']}")
+        self.manager.feeds.put(RSSItem(**config))
+
+    def run(self, feed_ids=None, limit: int | None = None) -> dict:
+        self.install()
+        records = self.capture.records(feed_ids)
+        if limit:
+            records = records[:limit]
+        statuses = Counter()
+        totals = Counter()
+        run_seconds = []
+        started = time.monotonic()
+        for record in records:
+            self._current = record
+            self._ensure_feed(record)
+            run_started = time.monotonic()
+            try:
+                result = self.manager.check_rss(record["feedId"], trigger=REPLAY_TRIGGER)
+            except Exception:
+                statuses["EXCEPTION"] += 1
+                continue
+            finally:
+                run_seconds.append(time.monotonic() - run_started)
+            statuses[result.get("status")] += 1
+            for key in ("newItems", "sent", "rejected", "skipped"):
+                totals[key] += len(result.get(key) or [])
+            totals["bytes"] += record.get("bytes", 0)
+        elapsed = time.monotonic() - started
+        return {
+            "runs": len(records),
+            "feeds": len({record["feedId"] for record in records}),
+            "statuses": dict(statuses),
+            **{key: totals[key] for key in ("newItems", "sent", "rejected", "skipped", "bytes")},
+            "elapsedSeconds": round(elapsed, 3),
+            "runsPerSecond": round(len(records) / elapsed, 1) if elapsed > 0 else None,
+            "runSeconds": {
+                "p50": percentile(run_seconds, 0.5, digits=4),
+                "p95": percentile(run_seconds, 0.95, digits=4),
+                "max": round(max(run_seconds), 4) if run_seconds else None,
+            },
+        }
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 try:
     # Pydantic v2
@@ -14,6 +14,15 @@ def model_to_dict(model: BaseModel) -> dict:
         return model.model_dump()
     return model.dict()
 
+class FilterProfile(BaseModel):
+    """An extra keyword set / download path fed from the same fetched RSS entries."""
+    id: str
+    name: str = ""
+    key_words: Optional[str] = None
+    path: str = ""
+    last_title: Optional[str] = None  # per-profile dedupe marker for direct sites
+
+
 class RSSItem(BaseModel):
     id: str
     name: str
@@ -26,6 +35,31 @@ class RSSItem(BaseModel):
     last_error: Optional[str] = None
     pt_site: str
     key_words: Optional[str] = None
+    profiles: List[FilterProfile] = []
+    max_response_bytes: Optional[int] = None  # per-feed cap, falls back to RSS_MAX_RESPONSE_BYTES
+    last_wire_bytes: Optional[int] = None
+    last_decoded_bytes: Optional[int] = None
+    total_wire_bytes: int = 0
+    total_decoded_bytes: int = 0
+    # Failed runs in a row; drives the failure backoff and resets on the next good run
+    consecutive_failures: int = 0
+    # Pre-send rules; entries that fail them are dropped before any Transmission RPC
+    min_size_mb: Optional[float] = None
+    max_size_mb: Optional[float] = None
+    categories: Optional[str] = None  # ";"-separated allow-list, matched against entry tags/category
+    freeleech_only: bool = False
+    # Transmission endpoint id this feed always sends to first; None lets the pool place each run
+    transmission_endpoint: Optional[str] = None
+
+
+class TransmissionEndpoint(BaseModel):
+    """An extra Transmission daemon in the delivery pool, next to transmission_url/port ("default")."""
+    id: str
+    url: str
+    port: int = 9091
+    username: str = ""
+    password: str = ""
+    enabled: bool = True
 
 
 class Settings(BaseModel):
@@ -35,6 +69,7 @@ class Settings(BaseModel):
     password: str = ""
     default_download_path: str = ""
     default_rss_interval: int = 10  # default interval is 10 minutes
+    transmission_endpoints: List[TransmissionEndpoint] = []
     
     @field_validator('default_rss_interval')
     def validate_interval(cls, v):
@@ -43,3 +78,12 @@ class Settings(BaseModel):
         if v > 1440:  # 24 hours
             raise ValueError("Default RSS interval cannot exceed 1440 minutes (24 hours)")
         return v
+
+    @field_validator('transmission_endpoints')
+    def validate_endpoints(cls, v):
+        ids = [endpoint.id for endpoint in v]
+        if "default" in ids:
+            raise ValueError('Endpoint id "default" is reserved for transmission_url')
+        if len(set(ids)) != len(ids):
+            raise ValueError("Transmission endpoint ids must be unique")
+        return v
@@ -41,6 +41,111 @@ APP_VERSION = get_app_version()
 RSS_REQUEST_CONNECT_TIMEOUT = 10
 RSS_REQUEST_READ_TIMEOUT = 60
 TRANSMISSION_RPC_TIMEOUT = 30
+# Transmission torrent-get snapshot (hash/name/status) reused for duplicate checks this long
+TRANSMISSION_SNAPSHOT_SECONDS = 60
+# Transmission pool placement: session-stats/free-space sampled this often per endpoint;
+# endpoints with less free space than this only get runs when nothing else is reachable
+TRANSMISSION_LOAD_SECONDS = 60
+TRANSMISSION_MIN_FREE_BYTES = 10 * 1024 * 1024 * 1024
+# RSS transfer: wall-clock budget for the whole download and the default decoded-size cap
+RSS_FETCH_DEADLINE = 90
+RSS_MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+RSS_STREAM_CHUNK_BYTES = 64 * 1024
+# Feed parsing: documents of at least FEED_PARSE_POOL_MIN_BYTES are parsed in a pool of
+# FEED_PARSE_WORKERS processes (0 keeps all parsing in-process)
+FEED_PARSE_WORKERS = 2
+FEED_PARSE_POOL_MIN_BYTES = 256 * 1024
+FEED_PARSE_TIMEOUT = 60
+# Feed capture (opt-in, RSS_FEED_CAPTURE=1): raw response bodies stored gzipped and content-addressed
+# under STORAGE_DIR for scripts/replay_captures.py; the oldest fetches are dropped past the byte cap
+FEED_CAPTURE = os.getenv("RSS_FEED_CAPTURE", "").strip().lower() in ("1", "true", "yes", "on")
+FEED_CAPTURE_DIR = "captures"
+FEED_CAPTURE_MAX_BYTES = 200 * 1024 * 1024
+# .torrent files are downloaded by the manager, cached by infohash (LRU, capped) and sent as
+# metainfo; RSS_TORRENT_FILE_CACHE=0 leaves the download to Transmission
+TORRENT_FILE_CACHE = os.getenv("RSS_TORRENT_FILE_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+TORRENT_FILE_CACHE_DIR = "torrents"
+TORRENT_FILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+TORRENT_FILE_MAX_BYTES = 10 * 1024 * 1024
+# Connections kept open per host by the shared HTTP session
+HTTP_POOL_CONNECTIONS = 16
+# Circuit breakers (per tracker host and per Transmission endpoint): consecutive failures that
+# open a breaker and seconds before an open breaker lets one probe through
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_SECONDS = 300
+# Failing feeds are re-armed at interval * 2^(failures-1), capped, with +/- jitter
+FAILURE_BACKOFF_MAX_SECONDS = 6 * 60 * 60
+FAILURE_BACKOFF_JITTER = 0.2
+# Logs (under LOG_DIR): the active <name>.log is gzipped into <name>.<stamp>.log.gz once it reaches
+# its size cap or its first line is LOG_MAX_AGE_SECONDS old; archives are kept per log by count and
+# age, and all logs together stay under LOG_TOTAL_MAX_BYTES (oldest archives go first)
+LOG_MAX_BYTES = 1024 * 1024
+LOG_MANAGER_MAX_BYTES = 10 * 1024 * 1024
+LOG_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+LOG_KEEP_ARCHIVES = 5
+LOG_RETENTION_SECONDS = 30 * 24 * 60 * 60
+LOG_TOTAL_MAX_BYTES = 512 * 1024 * 1024
+# /api/storage/usage: how many of the largest feeds to list
+STORAGE_USAGE_TOP_FEEDS = 10
+# Deleted-feed markers kept for /api/feeds?since= delta polling
+FEED_TOMBSTONE_LIMIT = 1000
+# /api/events stream: replay buffer for Last-Event-ID resume and keep-alive period
+EVENT_BUFFER_SIZE = 2000
+EVENT_STREAM_HEARTBEAT_SECONDS = 15
+# Finished manual-check jobs kept for GET /api/jobs/{id}
+JOB_HISTORY_LIMIT = 200
+# Bulk import: seconds between the first runs of newly imported feeds
+IMPORT_STAGGER_SECONDS = 3
+# Scheduler boot: seconds between the first runs of stored feeds
+STARTUP_STAGGER_SECONDS = 0.05
+# Feed runs: at most RUN_POOL_WORKERS checks run at once, the rest queue by priority
+# (manual > retry > timer > startup); queue waits kept for the p50/p95 metrics
+RUN_POOL_WORKERS = 8
+RUN_WAIT_SAMPLES = 512
+# Run watchdog: every RUN_WATCHDOG_SECONDS, a run whose current stage or whole run is past its deadline
+# is marked TIMEOUT and its feed released for rescheduling (the stuck thread's late results are dropped)
+RUN_STAGE_DEADLINES = {
+    "fetch": RSS_FETCH_DEADLINE + FEED_PARSE_TIMEOUT + 30,
+    "parse": 60,
+    "filter": 120,
+    "send": 600,
+}
+RUN_TOTAL_DEADLINE = 20 * 60
+RUN_WATCHDOG_SECONDS = 5
+RUN_TIMEOUT_HISTORY = 50
+# Shutdown waits this long for running checks before flushing and exiting
+SHUTDOWN_WAIT_SECONDS = 10
+# /api/feeds query mode page sizes
+DEFAULT_FEED_PAGE_SIZE = 50
+MAX_FEED_PAGE_SIZE = 500
+# Multi-worker deployments: "off" runs a single worker on its own, "leader" elects one scheduler,
+# "sharded" splits feeds across workers. Coordination is opt-in; set it when running --workers N
+CLUSTER_MODE_OFF = "off"
+CLUSTER_MODE_LEADER = "leader"
+CLUSTER_MODE_SHARDED = "sharded"
+CLUSTER_MODE = os.getenv("RSS_CLUSTER_MODE", CLUSTER_MODE_OFF).strip().lower()
+# Scheduler leader lock (under STORAGE_DIR), follower retry period, forwarded-check RPC timeout
+# and how often workers re-read storage written by others
+LEADER_LOCK_FILE = "scheduler.lock"
+LEADER_RETRY_SECONDS = 5
+WORKER_RPC_TIMEOUT = 10
+STORAGE_SYNC_SECONDS = 2
+# Multi-worker /api/events: shared event journal (under STORAGE_DIR) and how often workers tail it
+EVENT_JOURNAL_FILE = "events.jsonl"
+EVENT_JOURNAL_POLL_SECONDS = 0.5
+# Sharded mode: worker lease directory (under STORAGE_DIR), heartbeat period, lease expiry
+# and virtual nodes per worker on the consistent-hash ring
+SHARD_LEASE_DIR = "shards"
+SHARD_HEARTBEAT_SECONDS = 5
+SHARD_LEASE_TTL = 15
+SHARD_VNODES = 64
+# /api/search: inverted index over every {rss_id}_torrents_list.json (under STORAGE_DIR),
+# debounced index writes, how often cache files are re-scanned for outside changes, result page sizes
+SEARCH_INDEX_FILE = "search_index.json"
+SEARCH_INDEX_FLUSH_SECONDS = 30
+SEARCH_REFRESH_SECONDS = 10
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
 
 # PT site names
 HHCLUB = 'HHCLUB'
@@ -70,6 +175,9 @@ TIME_ZONE = "Asia/Shanghai"
 ### Frontend constants ### 
 ###########################
 
+# UI delivery: content-hashed URLs (constants.js?v=<hash>) are cached this long by browsers
+STATIC_MAX_AGE_SECONDS = 365 * 24 * 60 * 60
+
 # Frontend / shared defaults
 AUTO_REFRESH_MS = 15000
 UI_FONT_STORAGE_KEY = "mm_font"
@@ -81,6 +189,17 @@ STRINGS = {
 	'SETTINGS': 'Settings',
 	'ADD_FEED': 'Add Feed',
 	'REFRESH': 'Refresh',
+	'IMPORT': 'Import',
+	'EXPORT': 'Export',
+	'SEARCH_HEADER': 'Search cached torrents',
+	'SEARCH_PLACEHOLDER': 'Keywords, e.g. 1080p HEVC; 2160p',
+	'SEARCH_BUTTON': 'Search',
+	'SEARCH_NO_RESULTS': 'No cached entries match.',
+	'BTN_SEND': 'Send',
+	'SEND_DONE': 'Sent to Transmission',
+	'SEND_FAILED': 'Send failed',
+	'IMPORT_DONE': 'Imported feeds',
+	'IMPORT_FAILED': 'Import failed',
 	'FEEDS_HEADER': 'Feeds',
 	'AUTO_REFRESH_MSG': 'Auto-refresh every 15s',
 	'LOADING': 'Loading...',
@@ -89,6 +208,13 @@ STRINGS = {
 	'RSS_URL_LABEL': 'RSS URL',
 	'PATH_LABEL': 'Download Path',
 	'INTERVAL_LABEL': 'Interval (minutes)',
+	'PROFILES_LABEL': 'Extra filter profiles (same RSS fetch)',
+	'ADD_PROFILE': '+ Add profile',
+	'RULES_LABEL': 'Pre-send rules (checked before anything is sent)',
+	'MIN_SIZE_PLACEHOLDER': 'Min size (MB)',
+	'MAX_SIZE_PLACEHOLDER': 'Max size (MB)',
+	'CATEGORIES_PLACEHOLDER': 'Allowed categories, separated by semicolon',
+	'FREELEECH_ONLY_LABEL': 'Only send freeleech / promoted releases',
 	'SAVE_BUTTON': 'Save',
 	'CANCEL_BUTTON': 'Cancel',
 	'TRANSMISSION_RPC_LABEL': 'Transmission RPC URL',
@@ -115,6 +241,7 @@ STRINGS = {
 	'DELETED': 'Deleted',
 	'DELETE_FAILED': 'Delete failed',
 	'CONFIRM_DELETE': 'Delete this feed?',
+	'CHECK_QUEUED': 'Check started',
 	'CHECK_DONE': 'Check done, new items',
 	'CHECK_FAILED': 'Check failed',
 	'LOAD_LOGS_FAILED': 'Load logs failed'
@@ -0,0 +1,28 @@
+import importlib
+import importlib.util
+import sys
+from functools import lru_cache
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        # import_module is cached in sys.modules and guarded by the import lock, so this is thread-safe
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'>"
+
+
+def lazy_import(name: str):
+    return sys.modules.get(name) or LazyModule(name)
+
+
+@lru_cache(maxsize=None)
+def is_available(name: str) -> bool:
+    """Whether an optional dependency is installed, without importing it."""
+    return name in sys.modules or importlib.util.find_spec(name) is not None
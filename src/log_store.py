@@ -0,0 +1,214 @@
+"""
+Append-only log files with size/age rotation into gzip archives and retention caps
+"""
+import glob
+import gzip
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+
+ARCHIVE_SUFFIX = ".log.gz"
+# <name>.<YYYYmmdd-HHMMSS>[-n].log.gz; (stamp, n) sorts archives of one log oldest first
+_ARCHIVE_RE = re.compile(r"^(?P<name>.+)\.(?P<stamp>\d{8}-\d{6})(?:-(?P<counter>\d+))?\.log\.gz$")
+_ARCHIVE_STAMP = "%Y%m%d-%H%M%S"
+
+
+class LogStore:
+    """
+    <log_dir>/<name>.log is the active file; it is rotated once it reaches max_bytes or its
+    first line is older than max_age_seconds.
+
+    Rotation renames the active file first, so a concurrent writer (thread or worker process)
+    simply starts a new file; the renamed file is then gzipped next to it. Each log keeps at most
+    keep_archives archives, none older than retention_seconds, and all logs together stay under
+    total_max_bytes by dropping the oldest archives first.
+    """
+
+    def __init__(self, log_dir: str, max_bytes: int, max_age_seconds: float, keep_archives: int,
+                 retention_seconds: float, total_max_bytes: int, max_bytes_by_name: dict | None = None,
+                 first_line_time=None):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.keep_archives = keep_archives
+        self.retention_seconds = retention_seconds
+        self.total_max_bytes = total_max_bytes
+        self.max_bytes_by_name = max_bytes_by_name or {}
+        # Parses the timestamp of a log line (epoch seconds or None); used to age files written
+        # before this process started
+        self._first_line_time = first_line_time or (lambda line: None)
+        self._lock = threading.Lock()
+        self._started = {}  # name -> [inode, size last seen, epoch of the first line] of the active file
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.log_dir, f"{name}.log")
+
+    def archives(self, name: str) -> list:
+        """Archive paths of one log, oldest first."""
+        pattern = os.path.join(glob.escape(self.log_dir), f"{glob.escape(name)}.*{ARCHIVE_SUFFIX}")
+        found = []
+        for path in glob.glob(pattern):
+            match = _ARCHIVE_RE.match(os.path.basename(path))
+            if match and match.group("name") == name:
+                # Not by path: "<stamp>-1.log.gz" would sort before the older "<stamp>.log.gz"
+                found.append(((match.group("stamp"), int(match.group("counter") or 0)), path))
+        return [path for _, path in sorted(found)]
+
+    # ---------------------
+    # Writing
+    # ---------------------
+    def append(self, name: str, line: str):
+        path = self.path(name)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+            size = f.tell()
+            inode = os.fstat(f.fileno()).st_ino
+        if self._due(name, path, size, inode):
+            self.rotate(name)
+
+    def _started_at(self, name: str, path: str, inode: int, size: int) -> float:
+        cached = self._started.get(name)
+        # A shrunk file is a new one even if it reuses the rotated file's inode
+        if cached is not None and cached[0] == inode and size >= cached[1]:
+            cached[1] = size
+            return cached[2]
+        # First write here, or another worker rotated the file: age it by its own first line
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                started = self._first_line_time(f.readline())
+        except OSError:
+            started = None
+        started = started or time.time()
+        self._started[name] = [inode, size, started]
+        return started
+
+    def _due(self, name: str, path: str, size: int, inode: int) -> bool:
+        if size >= self.max_bytes_by_name.get(name, self.max_bytes):
+            return True
+        return bool(self.max_age_seconds) and time.time() - self._started_at(name, path, inode, size) >= self.max_age_seconds
+
+    def rotate(self, name: str):
+        """Archive the active file now; returns the archive path, or None when there was nothing to rotate."""
+        path = self.path(name)
+        with self._lock:
+            stamp = datetime.now().strftime(_ARCHIVE_STAMP)
+            archive = os.path.join(self.log_dir, f"{name}.{stamp}{ARCHIVE_SUFFIX}")
+            counter = 1
+            while os.path.exists(archive):
+                archive = os.path.join(self.log_dir, f"{name}.{stamp}-{counter}{ARCHIVE_SUFFIX}")
+                counter += 1
+            claimed = f"{archive}.rotating"
+            try:
+                # Claim the file atomically; whoever loses the race finds it gone
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                return None
+            self._started.pop(name, None)
+        with open(claimed, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(claimed)
+        self.enforce_retention(name)
+        return archive
+
+    # ---------------------
+    # Retention
+    # ---------------------
+    def enforce_retention(self, name: str | None = None):
+        """Apply the per-log caps (to one log, or all when name is None), then the global byte cap."""
+        names = [name] if name is not None else self._archived_names()
+        cutoff = time.time() - self.retention_seconds if self.retention_seconds else None
+        for log_name in names:
+            archives = self.archives(log_name)
+            excess = len(archives) - self.keep_archives
+            for index, archive in enumerate(archives):
+                if index < excess or (cutoff is not None and self._mtime(archive) < cutoff):
+                    self._remove(archive)
+        self._enforce_total()
+
+    def _archived_names(self) -> set:
+        names = set()
+        for path in glob.glob(os.path.join(glob.escape(self.log_dir), f"*{ARCHIVE_SUFFIX}")):
+            match = _ARCHIVE_RE.match(os.path.basename(path))
+            if match:
+                names.add(match.group("name"))
+        return names
+
+    def _enforce_total(self):
+        usage = self.usage()
+        total = usage["activeBytes"] + usage["archiveBytes"]
+        if total <= self.total_max_bytes:
+            return
+        archives = sorted(
+            glob.glob(os.path.join(glob.escape(self.log_dir), f"*{ARCHIVE_SUFFIX}")), key=self._mtime
+        )
+        for archive in archives:
+            if total <= self.total_max_bytes:
+                break
+            total -= self._size(archive)
+            self._remove(archive)
+
+    def delete(self, name: str):
+        """Remove a log and all of its archives (the feed is gone)."""
+        with self._lock:
+            self._started.pop(name, None)
+        for path in [self.path(name), *self.archives(name)]:
+            self._remove(path)
+
+    # ---------------------
+    # Usage
+    # ---------------------
+    def usage(self) -> dict:
+        active = archived = 0
+        active_files = archive_files = 0
+        by_name = {}
+        try:
+            entries = list(os.scandir(self.log_dir))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            match = _ARCHIVE_RE.match(entry.name)
+            if match:
+                archived += size
+                archive_files += 1
+                name = match.group("name")
+            elif entry.name.endswith(".log"):
+                active += size
+                active_files += 1
+                name = entry.name[:-len(".log")]
+            else:
+                continue
+            by_name[name] = by_name.get(name, 0) + size
+        return {
+            "activeBytes": active,
+            "archiveBytes": archived,
+            "activeFiles": active_files,
+            "archiveFiles": archive_files,
+            "byName": by_name,
+        }
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
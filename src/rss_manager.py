@@ -1,21 +1,48 @@
-import feedparser
 import threading
 import json
 import os
 import time
 import traceback
 import uuid
+import base64
+import copy
+import random
+import socket
+from collections import OrderedDict, deque
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
 from zoneinfo import ZoneInfo
-import requests
-from src.general.general_class import RSSItem, model_to_dict
+from src.general.general_class import RSSItem
 import src.general.general_constant as GC
+from src.general.lazy_import import is_available, lazy_import
+from src.event_bus import EventBus
+from src.circuit_breaker import CLOSED, OPEN, BreakerRegistry
+from src.feed_capture import FeedCapture
+from src.feed_parser import FeedParsePool, compact_feed
+from src.feed_registry import FeedRegistry
+from src.log_store import LogStore
+from src.search_index import CACHE_SUFFIX, SearchIndex
+from src.sorted_index import SortedIndex
+from src.entry_metadata import entry_metadata, has_rules, rejection_reason
+from src.torrent_files import TorrentFileCache
+from src.transmission_pool import TransmissionPool, configured_endpoints
+from src.transmission_snapshot import TorrentSnapshot, link_infohash
+from src.run_pool import RunPool, trigger_priority
+from src.cluster import HashRing, LeaderElection, ShardMembership, WorkerClient, WorkerRPCServer, file_lock
 
 try:
-    from transmission_rpc import Client
+    import orjson
 except ImportError:
-    # Keep app startup working even if transmission-rpc is missing
-    Client = None
+    # Fall back to the standard library decoder when orjson is not installed
+    orjson = None
+
+# Heavy dependencies are imported on first use so the API starts serving sooner
+requests = lazy_import("requests")
+# Optional: checks still run (without sending) when transmission-rpc is missing
+transmission_rpc = lazy_import("transmission_rpc")
+
+MANAGER_LOG = "manager"
+
 
 class RSSManager:
     def __init__(self):
@@ -23,10 +50,66 @@ class RSSManager:
         os.makedirs(GC.STORAGE_DIR, exist_ok=True)
         os.makedirs(GC.LOG_DIR, exist_ok=True)
         self.state_lock = threading.RLock()
+        self.logs = LogStore(
+            GC.LOG_DIR,
+            GC.LOG_MAX_BYTES,
+            GC.LOG_MAX_AGE_SECONDS,
+            GC.LOG_KEEP_ARCHIVES,
+            GC.LOG_RETENTION_SECONDS,
+            GC.LOG_TOTAL_MAX_BYTES,
+            max_bytes_by_name={MANAGER_LOG: GC.LOG_MANAGER_MAX_BYTES},
+            first_line_time=self._log_line_time,
+        )
+        self.events = EventBus(GC.EVENT_BUFFER_SIZE)
+        self.log_watchers = {}  # feed id -> open /api/events?feedId= streams
+        self.breakers = BreakerRegistry(GC.BREAKER_FAILURE_THRESHOLD, GC.BREAKER_RESET_SECONDS)
+        self.feed_parser = FeedParsePool(GC.FEED_PARSE_WORKERS, GC.FEED_PARSE_POOL_MIN_BYTES, GC.FEED_PARSE_TIMEOUT)
+        self.torrent_snapshot = TorrentSnapshot(GC.TRANSMISSION_SNAPSHOT_SECONDS)
+        self.transmission_pool = TransmissionPool(GC.TRANSMISSION_LOAD_SECONDS, GC.TRANSMISSION_MIN_FREE_BYTES)
+        self.run_pool = RunPool(GC.RUN_POOL_WORKERS, wait_samples=GC.RUN_WAIT_SAMPLES)
+        self.feed_capture = (
+            FeedCapture(os.path.join(GC.STORAGE_DIR, GC.FEED_CAPTURE_DIR), GC.FEED_CAPTURE_MAX_BYTES) if GC.FEED_CAPTURE else None
+        )
+        self.torrent_files = (
+            TorrentFileCache(os.path.join(GC.STORAGE_DIR, GC.TORRENT_FILE_CACHE_DIR), GC.TORRENT_FILE_CACHE_MAX_BYTES)
+            if GC.TORRENT_FILE_CACHE else None
+        )
+        self._http_session = None
+        self.search_index = SearchIndex(
+            GC.STORAGE_DIR,
+            os.path.join(GC.STORAGE_DIR, GC.SEARCH_INDEX_FILE),
+            GC.SEARCH_INDEX_FLUSH_SECONDS,
+            GC.SEARCH_REFRESH_SECONDS,
+        )
+        self.started_at = time.time()
+        # pending -> starting -> running (or standby on a follower waiting for leadership)
+        self.boot_state = "pending"
+        # Multi-worker state: set up by start_cluster(); a lone manager schedules every feed
+        self.cluster_mode = None
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.election = None
+        self.membership = None
+        self.shard_ring = None
+        self.shard_members = {}
+        self.worker_client = None
+        self.rpc_server = None
+        self._dirty_feeds = set()
+        self._storage_stamp = None
+        self._disk_settings = {}
+        self.feeds = FeedRegistry()
         self.load_storage()
         self.tasks = {}  # timer thread
         self.feed_run_locks = {}
         self.active_runs = {}
+        self.queued_runs = {}  # rss_id -> run waiting in run_pool (holds the feed's run lock)
+        self.evicted_runs = set()  # run ids the watchdog timed out whose threads have not returned yet
+        self.timed_out_runs = deque(maxlen=GC.RUN_TIMEOUT_HISTORY)
+        self._watchdog_thread = None
+        self._stopped = threading.Event()
+        self.jobs = OrderedDict()
+        self.jobs_changed = threading.Condition(self.state_lock)
+        self.next_run_at = {}
+        self._rebuild_indexes()
 
     # ---------------------
     # Storage
@@ -45,7 +128,8 @@ class RSSManager:
             raise ValueError("storage.rss must be an object")
         if not isinstance(settings, dict):
             raise ValueError("storage.settings must be an object")
-        return {"rss": rss, "settings": settings}
+        versions = raw_storage.get("versions")
+        return {"rss": rss, "settings": settings, "versions": versions if isinstance(versions, dict) else None}
 
     @staticmethod
     def _backup_broken_storage():
@@ -58,27 +142,387 @@ class RSSManager:
         except OSError as exc:
             print(f"[storage] Failed to backup invalid storage file: {exc}")
 
+    @staticmethod
+    def _storage_file_stamp():
+        try:
+            stat = os.stat(GC.STORAGE_PATH)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _adopt_storage(self, raw_storage: dict):
+        """Feeds go to the typed registry; self.storage keeps the settings."""
+        invalid = self.feeds.load(raw_storage["rss"])
+        for rss_id in invalid:
+            print(f"[storage] Feed {rss_id} failed validation; kept in storage but not scheduled")
+        self.storage = {"settings": raw_storage["settings"]}
+        self._reset_feed_versions(raw_storage.get("versions"))
+
+    def _read_storage_file(self):
+        if orjson is not None:
+            with open(GC.STORAGE_PATH, "rb") as f:
+                return self._normalize_storage(orjson.loads(f.read()))
+        with open(GC.STORAGE_PATH, "r", encoding="utf-8") as f:
+            return self._normalize_storage(json.load(f))
+
     def load_storage(self):
         default_storage = self._default_storage()
         if not os.path.exists(GC.STORAGE_PATH):
-            self.storage = default_storage
+            self._adopt_storage(default_storage)
             self.save_storage()
             return
 
         try:
-            with open(GC.STORAGE_PATH, "r", encoding="utf-8") as f:
-                raw_storage = json.load(f)
-            self.storage = self._normalize_storage(raw_storage)
+            stamp = self._storage_file_stamp()
+            self._adopt_storage(self._read_storage_file())
+            self._storage_stamp = stamp
+            self._disk_settings = copy.deepcopy(self.storage["settings"])
         except (json.JSONDecodeError, OSError, ValueError) as exc:
             print(f"[storage] Failed to load storage file, resetting to defaults: {exc}")
             self._backup_broken_storage()
-            self.storage = default_storage
+            self._adopt_storage(default_storage)
             self.save_storage()
 
+    # ---------------------
+    # Feed versions (delta polling)
+    # ---------------------
+    # Versions live in storage.json ("versions") and are renumbered under its file lock, so every
+    # worker sharing the file hands out the same ?since= versions and ETags
+    def _reset_feed_versions(self, saved: dict | None = None):
+        """Take the version counters saved in storage.json, or seed new ones."""
+        with self.state_lock:
+            try:
+                self.storage_version = int(saved["current"])
+                self.delta_floor = int(saved["floor"])
+                feed_versions = {rss_id: int(version) for rss_id, version in saved["feeds"].items()}
+                deleted_feeds = {rss_id: int(version) for rss_id, version in saved["deleted"].items()}
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # Storage written before versions were saved: seed from wall-clock millis so they
+                # keep increasing past anything handed out before
+                self.storage_version = int(time.time() * 1000)
+                self.delta_floor = self.storage_version
+                feed_versions, deleted_feeds = {}, {}
+            self.feed_versions = {rss_id: feed_versions.get(rss_id, self.storage_version) for rss_id in self.feeds.ids()}
+            self.deleted_feeds = deleted_feeds
+
+    def _saved_versions(self) -> dict:
+        return {
+            "current": self.storage_version,
+            "floor": self.delta_floor,
+            "feeds": self.feed_versions,
+            "deleted": self.deleted_feeds,
+        }
+
+    def _adopt_disk_versions(self, saved: dict | None):
+        """After merging another worker's storage: take its counters, then renumber our unsaved changes past them."""
+        if saved:
+            self.storage_version = max(self.storage_version, int(saved.get("current") or 0))
+            self.delta_floor = max(self.delta_floor, int(saved.get("floor") or 0))
+            for rss_id, version in (saved.get("deleted") or {}).items():
+                # Feeds we never loaded may still be known to clients of the worker that deleted them
+                if rss_id not in self.feeds and version > self.deleted_feeds.get(rss_id, 0):
+                    self.deleted_feeds[rss_id] = version
+            self._trim_tombstones()
+        # Our versions for unsaved changes were only provisional: the other worker may have used them
+        for rss_id in sorted(self._dirty_feeds):
+            self.storage_version += 1
+            if rss_id in self.feed_versions:
+                self.feed_versions[rss_id] = self.storage_version
+            elif rss_id in self.deleted_feeds:
+                self.deleted_feeds[rss_id] = self.storage_version
+
+    def _trim_tombstones(self):
+        while len(self.deleted_feeds) > GC.FEED_TOMBSTONE_LIMIT:
+            oldest_id = min(self.deleted_feeds, key=self.deleted_feeds.get)
+            self.delta_floor = max(self.delta_floor, self.deleted_feeds.pop(oldest_id))
+
+    def _bump_feed_version(self, rss_id: str, *, deleted: bool = False, dirty: bool = True, version: int | None = None):
+        """Record a feed change; version is given when adopting the version another worker saved."""
+        with self.state_lock:
+            if dirty:
+                # Local change that save_storage must carry over a newer file from another worker
+                self._dirty_feeds.add(rss_id)
+            if version is None:
+                self.storage_version += 1
+                version = self.storage_version
+            else:
+                self.storage_version = max(self.storage_version, version)
+            if deleted:
+                self.feed_versions.pop(rss_id, None)
+                self.deleted_feeds[rss_id] = version
+                self._trim_tombstones()
+            else:
+                self.deleted_feeds.pop(rss_id, None)
+                self.feed_versions[rss_id] = version
+            if deleted:
+                self._unindex_feed(rss_id)
+            else:
+                self._index_feed(rss_id)
+        self.events.publish("feed-changed", {"feedId": rss_id, "version": version, "deleted": deleted})
+        return version
+
+    def feed_changes_since(self, version: int):
+        """Return (version, full, changed feeds, deleted ids) relative to a client version."""
+        with self.state_lock:
+            current = self.storage_version
+            feeds = self.feeds.snapshot()
+            if version < self.delta_floor or version > current:
+                return current, True, feeds, []
+            changed = {
+                rss_id: feeds[rss_id]
+                for rss_id, feed_version in self.feed_versions.items()
+                if feed_version > version and rss_id in feeds
+            }
+            deleted = [rss_id for rss_id, deleted_version in self.deleted_feeds.items() if deleted_version > version]
+            return current, False, changed, deleted
+
+    # ---------------------
+    # Secondary indexes and queries
+    # ---------------------
+    QUERY_SORT_KEYS = ("name", "url", "pt_site", "status", "last_fetch", "next_run", "interval")
+
+    @staticmethod
+    def feed_status(item: RSSItem) -> str:
+        return item.last_status or ("OK" if item.last_fetch else "Never")
+
+    @staticmethod
+    def _sort_value(value) -> tuple:
+        # None sorts last in ascending order
+        return (value is None, value if value is not None else "")
+
+    def _rebuild_indexes(self):
+        with self.state_lock:
+            self.url_index = {}  # normalized url -> feed ids (update_feed may give two feeds one URL)
+            self.site_index = {}
+            self.status_index = {}
+            # Orders kept sorted for the common list sorts, so a page does not sort every feed
+            self.sorted_orders = {"name": SortedIndex(), "next_run": SortedIndex()}
+            self._indexed_keys = {}
+            for rss_id in self.feeds.ids():
+                self._index_feed(rss_id)
+
+    def _index_feed(self, rss_id: str):
+        item = self.feeds.get(rss_id)
+        if item is None:
+            self._unindex_feed(rss_id)
+            return
+        keys = (self.normalize_url(item.url), item.pt_site, self.feed_status(item), (item.name or "").lower())
+        if self._indexed_keys.get(rss_id) == keys:
+            return
+        self._unindex_feed(rss_id)
+        url_key, site_key, status_key, name_key = keys
+        for index, key in ((self.url_index, url_key), (self.site_index, site_key), (self.status_index, status_key)):
+            index.setdefault(key, set()).add(rss_id)
+        self.sorted_orders["name"].set(rss_id, self._sort_value(name_key))
+        self.sorted_orders["next_run"].set(rss_id, self._sort_value(self.next_run_at.get(rss_id)))
+        self._indexed_keys[rss_id] = keys
+
+    def _unindex_feed(self, rss_id: str):
+        keys = self._indexed_keys.pop(rss_id, None)
+        if keys is None:
+            return
+        url_key, site_key, status_key, _ = keys
+        for index, key in ((self.url_index, url_key), (self.site_index, site_key), (self.status_index, status_key)):
+            members = index.get(key)
+            if members is not None:
+                members.discard(rss_id)
+                if not members:
+                    index.pop(key, None)
+        for order in self.sorted_orders.values():
+            order.discard(rss_id)
+
+    def _set_next_run_at(self, rss_id: str, when: float | None):
+        with self.state_lock:
+            if when is None:
+                self.next_run_at.pop(rss_id, None)
+            else:
+                self.next_run_at[rss_id] = when
+            if rss_id in self._indexed_keys:
+                self.sorted_orders["next_run"].set(rss_id, self._sort_value(when))
+
+    def find_feeds_by_url(self, url: str) -> list:
+        with self.state_lock:
+            return sorted(self.url_index.get(self.normalize_url(url), ()))
+
+    def find_feed_by_url(self, url: str):
+        """One feed with this URL (the lowest id when several share it), else None."""
+        ids = self.find_feeds_by_url(url)
+        return ids[0] if ids else None
+
+    def _query_sort_value(self, rss_id: str, item: RSSItem, sort: str):
+        if sort == "status":
+            value = self.feed_status(item)
+        elif sort == "next_run":
+            value = self.next_run_at.get(rss_id)
+        elif sort == "name":
+            value = (item.name or "").lower()
+        else:
+            value = getattr(item, sort)
+        return self._sort_value(value)
+
+    @staticmethod
+    def _encode_cursor(sort: str, order: str, sort_key: tuple, rss_id: str) -> str:
+        raw = json.dumps([sort, order, list(sort_key), rss_id], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str, order: str):
+        try:
+            cursor_sort, cursor_order, sort_key, rss_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            missing, value = sort_key
+        except (ValueError, TypeError):
+            raise ValueError("invalid cursor")
+        if (cursor_sort, cursor_order) != (sort, order):
+            # Keys of another sort do not compare with this one's
+            raise ValueError("cursor belongs to a different sort or order")
+        if not isinstance(missing, bool) or not isinstance(value, (str, int, float)) or not isinstance(rss_id, str):
+            raise ValueError("invalid cursor")
+        return ((missing, value), rss_id)
+
+    def query_feeds(self, *, status: str | None = None, pt_site: str | None = None, q: str | None = None,
+                    sort: str = "name", order: str = "asc", cursor: str | None = None, limit: int = 50):
+        """
+        Filter via the secondary indexes and return one cursor page. Name and next-run pages walk
+        the kept-sorted orders from the cursor; other sorts sort the filtered feeds. A cursor only
+        continues the sort and order it was issued for.
+        """
+        if sort not in self.QUERY_SORT_KEYS:
+            raise ValueError(f"unsupported sort key: {sort}")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"unsupported order: {order}")
+        descending = order == "desc"
+        after = self._decode_cursor(cursor, sort, order) if cursor else None
+        needle = (q or "").strip().lower()
+
+        def matches(item) -> bool:
+            return not needle or needle in (item.name or "").lower() or needle in (item.url or "").lower()
+
+        with self.state_lock:
+            candidates = None
+            for index, key in ((self.status_index, status), (self.site_index, pt_site)):
+                if key is None:
+                    continue
+                members = index.get(key, set())
+                candidates = set(members) if candidates is None else candidates & members
+            feeds = self.feeds.snapshot()
+            if candidates is None:
+                candidates = feeds.keys()
+            if sort in self.sorted_orders:
+                page, last, total = self._query_sorted_order(self.sorted_orders[sort], feeds, candidates, matches,
+                                                             after, descending, limit)
+                next_cursor = self._encode_cursor(sort, order, *last) if last is not None else None
+                return page, next_cursor, total
+            rows = []
+            for rss_id in candidates:
+                item = feeds.get(rss_id)
+                if item is None or not matches(item):
+                    continue
+                rows.append(((self._query_sort_value(rss_id, item, sort), rss_id), item))
+
+        rows.sort(key=lambda row: row[0], reverse=descending)
+        start = 0
+        if after is not None:
+            # Resume strictly after the last row of the previous page
+            is_past = (lambda key: key < after) if descending else (lambda key: key > after)
+            start = next((i for i, row in enumerate(rows) if is_past(row[0])), len(rows))
+        page = rows[start:start + limit]
+        next_cursor = None
+        if start + limit < len(rows) and page:
+            next_cursor = self._encode_cursor(sort, order, *page[-1][0])
+        return [(rss_id, item) for (_, rss_id), item in page], next_cursor, len(rows)
+
+    def _query_sorted_order(self, ordered: SortedIndex, feeds, candidates, matches, after, descending: bool, limit: int):
+        # Caller holds state_lock. The page walk starts at the cursor; the total still visits every
+        # candidate, but only to filter them, not to sort them. Returns the page, the (key, id) entry
+        # to continue after when more rows follow, and the total
+        page, last = [], None
+        for entry in ordered.iter_after(after, descending):
+            rss_id = entry[1]
+            item = feeds.get(rss_id)
+            if rss_id not in candidates or item is None or not matches(item):
+                continue
+            if len(page) == limit:
+                last = page[-1][0]
+                break
+            page.append((entry, item))
+        total = sum(1 for rss_id in candidates if rss_id in feeds and matches(feeds[rss_id]))
+        return [(rss_id, item) for (_, rss_id), item in page], last, total
+
     def save_storage(self):
+        added = []
+        with self.state_lock, file_lock(f"{GC.STORAGE_PATH}.lock"):
+            if self._storage_stamp is not None and self._storage_file_stamp() != self._storage_stamp:
+                # Another worker wrote since our last sync: apply our changes on top of its copy
+                try:
+                    disk = self._read_storage_file()
+                    added = self._merge_disk_storage(disk)
+                    self._adopt_disk_versions(disk["versions"])
+                except (json.JSONDecodeError, OSError, ValueError) as exc:
+                    self.log_manager(f"storage-merge skipped error={self._safe_error_message(exc)}")
+            self._dirty_feeds.clear()
+            tmp_path = f"{GC.STORAGE_PATH}.tmp-{os.getpid()}"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                # Only feeds written since the last save are serialized again
+                json.dump({"rss": self.feeds.serialize(), "settings": self.storage["settings"], "versions": self._saved_versions()},
+                          f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, GC.STORAGE_PATH)
+            self._storage_stamp = self._storage_file_stamp()
+            self._disk_settings = copy.deepcopy(self.storage["settings"])
+        self._schedule_synced_feeds(added)
+
+    def _merge_disk_storage(self, disk: dict):
+        """Adopt another worker's storage, keeping unsaved local feed/settings changes. Returns added feed ids."""
+        with self.state_lock:
+            saved_versions = disk.get("versions") or {}
+            disk_feed_versions = saved_versions.get("feeds") or {}
+            disk_deleted = saved_versions.get("deleted") or {}
+            merged = dict(disk["rss"])
+            for rss_id in self._dirty_feeds:
+                local = self.feeds.raw(rss_id)
+                if local is not None:
+                    merged[rss_id] = local
+                else:
+                    merged.pop(rss_id, None)
+            added = [rss_id for rss_id in merged if self.feeds.raw(rss_id) is None]
+            for rss_id, rss_data in merged.items():
+                if self.feeds.raw(rss_id) != rss_data:
+                    self.feeds.load_one(rss_id, rss_data)
+                    self._bump_feed_version(rss_id, dirty=False, version=disk_feed_versions.get(rss_id))
+            for rss_id in [rss_id for rss_id in self.feeds.all_ids() if rss_id not in merged]:
+                self.feeds.remove(rss_id)
+                self._drop_feed_runtime(rss_id)
+                self._bump_feed_version(rss_id, deleted=True, dirty=False, version=disk_deleted.get(rss_id))
+            if self.storage["settings"] == self._disk_settings:
+                self.storage["settings"] = disk["settings"]
+            self._disk_settings = copy.deepcopy(disk["settings"])
+            return added
+
+    def refresh_storage(self):
+        """Pick up writes made by other worker processes sharing the storage file."""
+        if self.cluster_mode is None:
+            return
+        stamp = self._storage_file_stamp()
+        if stamp is None or stamp == self._storage_stamp:
+            return
         with self.state_lock:
-            with open(GC.STORAGE_PATH, "w", encoding="utf-8") as f:
-                json.dump(self.storage, f, indent=4, ensure_ascii=False)
+            try:
+                disk = self._read_storage_file()
+            except (json.JSONDecodeError, OSError, ValueError) as exc:
+                self.log_manager(f"storage-sync skipped error={self._safe_error_message(exc)}")
+                return
+            self._storage_stamp = stamp
+            added = self._merge_disk_storage(disk)
+            self._adopt_disk_versions(disk["versions"])
+        self._schedule_synced_feeds(added)
+
+    def _schedule_synced_feeds(self, rss_ids: list):
+        # Feeds created by another worker: arm them here, staggered like a bulk import
+        if not rss_ids or self.cluster_mode is None:
+            return
+        for index, rss_id in enumerate(rss_ids):
+            self._cancel_feed_timer(rss_id)
+            first_run_in = min(GC.IMPORT_STAGGER_SECONDS * (index + 1), self._interval_seconds(rss_id))
+            self._schedule_next_run(rss_id, delay_seconds=first_run_in, source="sync")
 
     @staticmethod
     def _now_str():
@@ -88,41 +532,118 @@ class RSSManager:
     def _safe_error_message(exc: Exception) -> str:
         return str(exc) or exc.__class__.__name__
 
+    # ---------------------
+    # Circuit breakers and failure backoff
+    # ---------------------
     @staticmethod
-    def _entry_title(entry, fallback: str) -> str:
-        return getattr(entry, "title", "") or fallback
+    def _host_breaker_name(url: str) -> str:
+        return f"host:{(urlsplit(url or '').hostname or '').lower()}"
 
     @staticmethod
-    def _extract_torrent_link(entry):
-        links = getattr(entry, "links", []) or []
-        for link in links:
-            href = link.get("href")
-            rel = str(link.get("rel", "")).lower()
-            link_type = str(link.get("type", "")).lower()
-            if href and (rel == "enclosure" or "bittorrent" in link_type):
-                return href
-        for link in links:
-            href = link.get("href")
-            if href:
-                return href
-        return None
+    def _is_host_outage(exc: Exception) -> bool:
+        # A 404 or an oversized feed means the host is answering; only outages count against it
+        if isinstance(exc, requests.HTTPError) and exc.response is not None:
+            return exc.response.status_code >= 500 or exc.response.status_code == 429
+        return isinstance(exc, (requests.RequestException, TimeoutError))
+
+    @staticmethod
+    def _is_transmission_outage(exc: Exception) -> bool:
+        return isinstance(exc, (transmission_rpc.TransmissionConnectError, transmission_rpc.TransmissionTimeoutError))
+
+    def host_circuit_state(self, url: str) -> str:
+        breaker = self.breakers.peek(self._host_breaker_name(url))
+        return breaker.state if breaker is not None else CLOSED
+
+    def _failure_backoff_seconds(self, rss_id: str, failures: int) -> float:
+        interval = self._interval_seconds(rss_id)
+        delay = min(interval * 2 ** min(failures - 1, 16), max(GC.FAILURE_BACKOFF_MAX_SECONDS, interval))
+        # Jitter keeps feeds that failed together (same host outage) from retrying together
+        return round(delay * random.uniform(1 - GC.FAILURE_BACKOFF_JITTER, 1 + GC.FAILURE_BACKOFF_JITTER), 1)
+
+    def _apply_failure_backoff(self, rss_id: str):
+        """Replace the fixed-interval timer of a failing feed with an exponential backoff."""
+        with self.state_lock:
+            item = self.feeds.get(rss_id)
+            failures = item.consecutive_failures if item is not None else 0
+        if failures < 1 or not self.owns_feed(rss_id):
+            return
+        delay = self._failure_backoff_seconds(rss_id, failures)
+        self._log_feed_event(rss_id, f"failure-backoff consecutive_failures={failures} next_run_in={delay}s")
+        self._cancel_feed_timer(rss_id)
+        self._schedule_next_run(rss_id, delay_seconds=delay, source="backoff")
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        # Scheme and host are case-insensitive; path and query (passkeys) are not
+        url = (url or "").strip()
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+
+    @staticmethod
+    def _match_keywords(title: str, key_words: str) -> bool:
+        # ';' separates alternative groups; every space-separated part of a group must appear
+        for key_word in (s.strip() for s in key_words.split(';')):
+            if key_word and all(part in title for part in key_word.split()):
+                return True
+        return False
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
         return f"{seconds:.2f}s"
 
     def _manager_log_path(self):
-        return os.path.join(GC.LOG_DIR, "manager.log")
+        return self.logs.path(MANAGER_LOG)
+
+    @staticmethod
+    def _log_line_time(line: str):
+        """Epoch seconds of a "[<DATETIME_FORMAT>] ..." log line, or None."""
+        if not line.startswith("[") or "]" not in line:
+            return None
+        try:
+            stamp = datetime.strptime(line[1:line.index("]")], GC.DATETIME_FORMAT)
+        except ValueError:
+            return None
+        return stamp.replace(tzinfo=ZoneInfo(GC.TIME_ZONE)).timestamp()
 
     def log_manager(self, text: str):
         ts = self._now_str()
-        with open(self._manager_log_path(), "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {text}\n")
+        self.logs.append(MANAGER_LOG, f"[{ts}] {text}\n")
 
     def _log_feed_event(self, rss_id: str, message: str, include_manager: bool = True):
         self.log(rss_id, message)
         if include_manager:
             self.log_manager(f"[{rss_id}] {message}")
+        # Log lines are only streamed for feeds a client is watching (/api/events?feedId=); publishing
+        # every line of every feed would push lifecycle events out of the buffer within seconds
+        if self.log_watchers.get(rss_id):
+            self.events.publish("log", {"feedId": rss_id, "ts": self._now_str(), "msg": message})
+
+    def watch_feed_logs(self, rss_id: str):
+        with self.state_lock:
+            self.log_watchers[rss_id] = self.log_watchers.get(rss_id, 0) + 1
+
+    def unwatch_feed_logs(self, rss_id: str):
+        with self.state_lock:
+            remaining = self.log_watchers.get(rss_id, 0) - 1
+            if remaining > 0:
+                self.log_watchers[rss_id] = remaining
+            else:
+                self.log_watchers.pop(rss_id, None)
+
+    def _publish_run_event(self, event_type: str, rss_id: str, run_id: str, **fields):
+        self.events.publish(event_type, {"feedId": rss_id, "runId": run_id, **fields})
+
+    def _set_run_stage(self, rss_id: str, run_id: str, stage: str):
+        with self.state_lock:
+            run_meta = self.active_runs.get(rss_id)
+            if not run_meta or run_meta.get("run_id") != run_id:
+                return
+            run_meta["stage"] = stage
+            run_meta["stage_started_monotonic"] = time.monotonic()
+        self._publish_run_event("run-stage", rss_id, run_id, stage=stage)
 
     def _get_run_lock(self, rss_id: str):
         with self.state_lock:
@@ -133,12 +654,28 @@ class RSSManager:
             return run_lock
 
     def _set_active_run(self, rss_id: str, run_meta: dict):
+        run_meta.setdefault("stage", "start")
+        run_meta.setdefault("stage_started_monotonic", run_meta["started_monotonic"])
         with self.state_lock:
             self.active_runs[rss_id] = run_meta
-
-    def _clear_active_run(self, rss_id: str):
+        self._publish_run_event("run-start", rss_id, run_meta["run_id"], trigger=run_meta["trigger"], startedAt=run_meta["started_at"])
+
+    def _finish_active_run(self, rss_id: str, run_id: str, started: float, error: str = ""):
+        item = self.feeds.get(rss_id)
+        fields = {
+            "status": "ERROR" if error else (item.last_status if item is not None else None),
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+        if error:
+            self._publish_run_event("run-error", rss_id, run_id, error=error)
+        self._clear_active_run(rss_id, run_id)
+        self._publish_run_event("run-finish", rss_id, run_id, **fields)
+
+    def _clear_active_run(self, rss_id: str, run_id: str | None = None):
         with self.state_lock:
-            self.active_runs.pop(rss_id, None)
+            run_meta = self.active_runs.get(rss_id)
+            if run_meta is not None and (run_id is None or run_meta.get("run_id") == run_id):
+                del self.active_runs[rss_id]
 
     def _get_active_run(self, rss_id: str):
         with self.state_lock:
@@ -149,8 +686,8 @@ class RSSManager:
         return uuid.uuid4().hex[:8]
 
     def _interval_seconds(self, rss_id: str) -> int:
-        rss_data = self.storage["rss"].get(rss_id, {})
-        interval = rss_data.get("interval", GC.DEFAULT_RSS_INTERVAL)
+        item = self.feeds.get(rss_id)
+        interval = item.interval if item is not None else GC.DEFAULT_RSS_INTERVAL
         try:
             return max(int(interval), 1) * 60
         except (TypeError, ValueError):
@@ -158,60 +695,143 @@ class RSSManager:
 
     def _fetch_feed(self, rss_id: str, item: RSSItem, run_id: str):
         timeout = (GC.RSS_REQUEST_CONNECT_TIMEOUT, GC.RSS_REQUEST_READ_TIMEOUT)
+        max_bytes = item.max_response_bytes or GC.RSS_MAX_RESPONSE_BYTES
         started = time.monotonic()
+        deadline = started + GC.RSS_FETCH_DEADLINE
         self._log_feed_event(
             rss_id,
-            f"run={run_id} rss-fetch-start timeout_connect={GC.RSS_REQUEST_CONNECT_TIMEOUT}s timeout_read={GC.RSS_REQUEST_READ_TIMEOUT}s url={item.url}",
+            f"run={run_id} rss-fetch-start timeout_connect={GC.RSS_REQUEST_CONNECT_TIMEOUT}s timeout_read={GC.RSS_REQUEST_READ_TIMEOUT}s deadline={GC.RSS_FETCH_DEADLINE}s max_bytes={max_bytes} url={item.url}",
         )
         response = requests.get(
             item.url,
             timeout=timeout,
-            headers={"User-Agent": "MediaRSSManagement/1.1"},
+            # gzip/deflate always; br (and zstd) only when urllib3 can decode them
+            headers={"User-Agent": "MediaRSSManagement/1.1", "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING},
+            stream=True,
         )
-        response.raise_for_status()
-        feed = feedparser.parse(response.content)
+        chunks = []
+        decoded_bytes = 0
+        try:
+            response.raise_for_status()
+            # Stream the body so an oversized or trickling response is cut off instead of buffered
+            for chunk in response.iter_content(chunk_size=GC.RSS_STREAM_CHUNK_BYTES):
+                decoded_bytes += len(chunk)
+                if decoded_bytes > max_bytes:
+                    raise ValueError(f"response exceeded max_bytes={max_bytes}")
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"fetch exceeded deadline={GC.RSS_FETCH_DEADLINE}s")
+                chunks.append(chunk)
+        finally:
+            raw_tell = getattr(response.raw, "tell", None)
+            wire_bytes = raw_tell() if callable(raw_tell) else decoded_bytes
+            response.close()
+            item.last_wire_bytes = wire_bytes
+            item.last_decoded_bytes = decoded_bytes
+            item.total_wire_bytes = (item.total_wire_bytes or 0) + wire_bytes
+            item.total_decoded_bytes = (item.total_decoded_bytes or 0) + decoded_bytes
+        body = b"".join(chunks)
+        if self.feed_capture is not None:
+            try:
+                self.feed_capture.record(rss_id, item, response.status_code, response.headers, body, time.monotonic() - started)
+            except OSError as exc:
+                # Capture is diagnostics only; a full disk must not fail the run
+                self._log_feed_event(rss_id, f"run={run_id} rss-capture-failed error={self._safe_error_message(exc)}")
+        parse_started = time.monotonic()
+        feed, parse_mode = self.feed_parser.parse(body)
         elapsed = time.monotonic() - started
         self._log_feed_event(
             rss_id,
-            f"run={run_id} rss-fetch-done status_code={response.status_code} bytes={len(response.content)} entries={len(getattr(feed, 'entries', []) or [])} elapsed={self._format_duration(elapsed)}",
+            f"run={run_id} rss-fetch-done status_code={response.status_code} encoding={response.headers.get('Content-Encoding', 'identity')} wire_bytes={wire_bytes} bytes={decoded_bytes} entries={len(getattr(feed, 'entries', []) or [])} parser={parse_mode} parse_elapsed={self._format_duration(time.monotonic() - parse_started)} elapsed={self._format_duration(elapsed)}",
         )
         return feed
 
-    def _persist_item(self, item: RSSItem):
+    def _persist_item(self, item: RSSItem, run_id: str | None = None):
         with self.state_lock:
-            if item.id not in self.storage["rss"]:
+            if item.id not in self.feeds:
                 return
-            self.storage["rss"][item.id] = model_to_dict(item)
+            if run_id is not None and run_id in self.evicted_runs:
+                # The watchdog already recorded TIMEOUT and a newer run may own the feed by now
+                return
+            self.feeds.put(item)
+            self._bump_feed_version(item.id)
             self.save_storage()
 
-    def _mark_feed_result(self, item: RSSItem, status: str, error: str = ""):
+    def _mark_feed_result(self, item: RSSItem, status: str, error: str = "", run_id: str | None = None):
+        if status in ("ERROR", "TIMEOUT"):
+            item.consecutive_failures = (item.consecutive_failures or 0) + 1
+        elif status != "CIRCUIT_OPEN":
+            # A skipped run says nothing about the feed, so it keeps its failure count
+            item.consecutive_failures = 0
         item.last_fetch = self._now_str()
         item.last_status = status
         item.last_error = error or None
-        self._persist_item(item)
+        self._persist_item(item, run_id)
 
     # ---------------------
     # RSS CRUD
     # ---------------------
     def add_rss(self, item: RSSItem):
         with self.state_lock:
-            self.storage["rss"][item.id] = model_to_dict(item)
+            self.feeds.put(item)
+            self._bump_feed_version(item.id)
             self.save_storage()
         self.start_task(item.id)
 
-    def delete_rss(self, rss_id: str):
+    def add_rss_bulk(self, items: list):
+        """Insert many feeds with a single storage write and stagger their first runs."""
+        with self.state_lock:
+            for item in items:
+                self.feeds.put(item)
+                self._bump_feed_version(item.id)
+            self.save_storage()
+        self.log_manager(f"rss-manager bulk-add feeds={len(items)} stagger={GC.IMPORT_STAGGER_SECONDS}s")
+        for index, item in enumerate(items):
+            with self.state_lock:
+                existing_timer = self.tasks.pop(item.id, None)
+                if existing_timer:
+                    existing_timer.cancel()
+            # No immediate fetch: the first run fires from the staggered timer
+            first_run_in = min(GC.IMPORT_STAGGER_SECONDS * (index + 1), self._interval_seconds(item.id))
+            self._schedule_next_run(item.id, delay_seconds=first_run_in, source="import")
+
+    def _cancel_feed_timer(self, rss_id: str):
         with self.state_lock:
             timer = self.tasks.pop(rss_id, None)
             if timer:
                 timer.cancel()
-            self.storage["rss"].pop(rss_id, None)
+            self._set_next_run_at(rss_id, None)
+
+    def _drop_feed_runtime(self, rss_id: str):
+        with self.state_lock:
+            self._drop_queued_run(rss_id, "feed deleted")
+            self._cancel_feed_timer(rss_id)
             self.feed_run_locks.pop(rss_id, None)
             self.active_runs.pop(rss_id, None)
+
+    def delete_rss(self, rss_id: str):
+        with self.state_lock:
+            self.feeds.remove(rss_id)
+            self._drop_feed_runtime(rss_id)
+            self._bump_feed_version(rss_id, deleted=True)
             self.save_storage()
+        self._delete_feed_files(rss_id)
+
+    def _torrent_cache_path(self, rss_id: str) -> str:
+        return os.path.join(GC.STORAGE_DIR, f"{rss_id}{CACHE_SUFFIX}")
+
+    def _delete_feed_files(self, rss_id: str):
+        """Remove what a deleted feed leaves on disk: its logs (with archives), torrent cache and index entries."""
+        self.logs.delete(rss_id)
+        try:
+            os.remove(self._torrent_cache_path(rss_id))
+        except FileNotFoundError:
+            pass
+        self.search_index.remove_feed(rss_id)
+        self.log_manager(f"[{rss_id}] feed-files-deleted")
 
     def list_rss(self):
-        with self.state_lock:
-            return dict(self.storage["rss"])
+        """Read-only rss_id -> RSSItem snapshot; no copy unless a feed changed since the last call."""
+        return self.feeds.snapshot()
 
     # ---------------------
     # Log helper
@@ -219,29 +839,243 @@ class RSSManager:
     def log(self, rss_id: str, text: str):
         # formatted timestamp using project constants
         ts = self._now_str()
-        log_path = os.path.join(GC.LOG_DIR, f"{rss_id}.log")
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {text}\n")
+        self.logs.append(rss_id, f"[{ts}] {text}\n")
 
     def get_logs(self, rss_id: str) -> str:
-        log_path = os.path.join(GC.LOG_DIR, f"{rss_id}.log")
+        # Only the active file; rotated history stays in the gzip archives next to it
+        log_path = self.logs.path(rss_id)
         if not os.path.exists(log_path):
             return ""
         with open(log_path, "r", encoding="utf-8") as f:
             return f.read()
 
+    # ---------------------
+    # Transmission
+    # ---------------------
+    def _connect_transmission(self, rss_id: str, run_id: str, settings: dict, affinity: str | None = None, exclude=()):
+        """
+        Return (client, breaker) for the best reachable endpoint: the feed's pinned one, else the
+        least loaded; the next one takes over when an endpoint is down. client is None when
+        sending is skipped or no endpoint could be reached. Endpoints named in exclude are not tried.
+        """
+        if not is_available("transmission_rpc"):
+            self._log_feed_event(rss_id, f"run={run_id} transmission-skipped reason=client_not_installed")
+            return None, None
+        endpoints = configured_endpoints(settings, GC.DEFAULT_TRANSMISSION_PORT)
+        # If Transmission settings are not configured, skip sending torrents
+        if not endpoints:
+            self._log_feed_event(rss_id, f"run={run_id} transmission-skipped reason=not_configured")
+            return None, None
+        if affinity is not None and affinity not in {endpoint["id"] for endpoint in endpoints}:
+            self._log_feed_event(rss_id, f"run={run_id} transmission-affinity-missing endpoint={affinity} placement=auto")
+        candidates = [
+            endpoint
+            for endpoint in self.transmission_pool.order(endpoints, affinity, lambda endpoint: self._probe_transmission(endpoint, settings))
+            if endpoint["name"] not in exclude
+        ]
+        tx_breaker = None
+        for attempt, endpoint in enumerate(candidates):
+            tx_url, tx_port = endpoint["url"], endpoint["port"]
+            tx_breaker = self.breakers.get(endpoint["name"])
+            if not tx_breaker.allow():
+                # Links are not marked as sent, so the next run after recovery picks them up again
+                self._log_feed_event(
+                    rss_id,
+                    f"run={run_id} transmission-skipped reason=circuit_open breaker={tx_breaker.name} retry_in={tx_breaker.retry_in():.0f}s",
+                )
+                continue
+            try:
+                client = self._open_transmission_client(endpoint)
+                tx_breaker.record_success()
+            except Exception as e:
+                # Log the connection failure but do not crash the whole application
+                tx_breaker.record_failure(self._safe_error_message(e))
+                self._log_feed_event(
+                    rss_id,
+                    f"run={run_id} transmission-connect-failed host={tx_url} port={tx_port} timeout={GC.TRANSMISSION_RPC_TIMEOUT}s error={self._safe_error_message(e)}",
+                )
+                continue
+            if len(endpoints) > 1 or attempt or exclude:
+                placement = "pinned" if endpoint["id"] == affinity else ("failover" if attempt or exclude else "auto")
+                self._log_feed_event(rss_id, f"run={run_id} transmission-endpoint id={endpoint['id']} host={tx_url} port={tx_port} placement={placement}")
+            return client, tx_breaker
+        return None, tx_breaker
+
+    @staticmethod
+    def _open_transmission_client(endpoint: dict):
+        return transmission_rpc.Client(host=endpoint["url"],
+                port=endpoint["port"],
+                username=endpoint["username"],
+                password=endpoint["password"],
+                timeout=GC.TRANSMISSION_RPC_TIMEOUT)
+
+    def _probe_transmission(self, endpoint: dict, settings: dict):
+        """Load sample for placement (session-stats + free-space); None while the endpoint's breaker is open."""
+        breaker = self.breakers.get(endpoint["name"])
+        if not breaker.allow():
+            return None
+        try:
+            client = self._open_transmission_client(endpoint)
+            stats = client.session_stats()
+            path = settings.get("default_download_path") or client.get_session().download_dir
+            free_bytes = client.free_space(path) if path else None
+        except Exception as e:
+            breaker.record_failure(self._safe_error_message(e))
+            raise
+        breaker.record_success()
+        return {"active": stats.active_torrent_count, "torrents": stats.torrent_count, "free_bytes": free_bytes}
+
+    def _record_transmission_add(self, endpoint_name: str, infohash, name: str):
+        self.torrent_snapshot.record_added(endpoint_name, infohash, name)
+        self.transmission_pool.record_added(endpoint_name)
+
+    def _http(self):
+        """Shared requests session: keep-alive connections to trackers are reused across runs."""
+        with self.state_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=GC.HTTP_POOL_CONNECTIONS, pool_maxsize=GC.RUN_POOL_WORKERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def _download_torrent_file(self, url: str) -> bytes:
+        timeout = (GC.RSS_REQUEST_CONNECT_TIMEOUT, GC.RSS_REQUEST_READ_TIMEOUT)
+        response = self._http().get(url, timeout=timeout, headers={"User-Agent": "MediaRSSManagement/1.1"}, stream=True)
+        try:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=GC.RSS_STREAM_CHUNK_BYTES):
+                size += len(chunk)
+                if size > GC.TORRENT_FILE_MAX_BYTES:
+                    raise ValueError(f"torrent file exceeded max_bytes={GC.TORRENT_FILE_MAX_BYTES}")
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            response.close()
+
+    def _torrent_metainfo(self, rss_id: str, run_id: str, link: str):
+        """
+        (infohash, .torrent bytes) for a torrent URL, from the file cache or downloaded into it.
+        (None, None) for magnets, with the cache off, or when the download fails; the link is then
+        sent as a URL for Transmission to fetch.
+        """
+        if self.torrent_files is None or not link or link.lower().startswith("magnet:"):
+            return None, None
+        cached = self.torrent_files.get(link)
+        if cached is not None:
+            self._log_feed_event(rss_id, f"run={run_id} torrent-file-cache-hit hash={cached[0]} torrent={link}")
+            return cached
+        started = time.monotonic()
+        try:
+            data = self._download_torrent_file(link)
+            infohash = self.torrent_files.put(link, data)
+        except Exception as e:
+            self._log_feed_event(rss_id, f"run={run_id} torrent-file-fetch-failed torrent={link} error={self._safe_error_message(e)}")
+            return None, None
+        self._log_feed_event(
+            rss_id,
+            f"run={run_id} torrent-file-fetched hash={infohash} bytes={len(data)} elapsed={self._format_duration(time.monotonic() - started)} torrent={link}",
+        )
+        return infohash, data
+
+    def transmission_endpoints_status(self) -> list:
+        """Configured endpoints with their last load sample and breaker state (no credentials)."""
+        endpoints = configured_endpoints(self.storage.get("settings", {}), GC.DEFAULT_TRANSMISSION_PORT)
+        status = self.transmission_pool.stats(endpoints)
+        for entry, endpoint in zip(status, endpoints):
+            breaker = self.breakers.peek(endpoint["name"])
+            entry["breaker"] = breaker.snapshot()["state"] if breaker is not None else CLOSED
+        return status
+
+    def _transmission_torrents(self, rss_id: str, run_id: str, client, tx_breaker) -> dict:
+        """Cached hash -> {name, status} for the endpoint; empty when the snapshot cannot be taken."""
+        try:
+            return self.torrent_snapshot.torrents(client, tx_breaker.name)
+        except Exception as e:
+            # Sending still works without the snapshot, it just cannot skip duplicates
+            self._log_feed_event(rss_id, f"run={run_id} transmission-snapshot-failed error={self._safe_error_message(e)}")
+            return {}
+
+    # ---------------------
+    # Search over torrent caches
+    # ---------------------
+    def search_torrents(self, query: str, feed_id: str | None = None, limit: int = GC.DEFAULT_SEARCH_LIMIT):
+        """Keyword search (feed keyword syntax) over every feed's cached titles; returns (total, hits)."""
+        with self.state_lock:
+            feed_ids = {feed_id} if feed_id is not None else set(self.feeds.ids())
+        return self.search_index.search(query, feed_ids=feed_ids, limit=limit)
+
+    def send_backfill(self, selections: list):
+        """Send cached entries picked from search results; each selection is {"feedId", "title"[, "profileId"]}."""
+        run_id = self._new_run_id()
+        settings = self.storage.get("settings", {})
+        sessions = {}  # feed affinity -> {"client", "breaker", "tried"}
+        results = []
+        for selection in selections:
+            rss_id = selection.get("feedId")
+            title = selection.get("title")
+            result = {"feedId": rss_id, "title": title}
+            results.append(result)
+            item = self.feeds.get(rss_id)
+            link = self.search_index.lookup(rss_id, title) if item is not None else None
+            if link is None:
+                result.update(status="NOT_FOUND", error="No cached entry with this title")
+                continue
+            target = next((profile for profile in item.profiles if profile.id == selection.get("profileId")), item)
+            # Selections placed alike share one connection, as profiles do within a run
+            session = sessions.setdefault(item.transmission_endpoint, {"client": None, "breaker": None, "tried": set()})
+            if session["client"] is None and "exhausted" not in session:
+                session["client"], session["breaker"] = self._connect_transmission(
+                    rss_id, run_id, settings, affinity=item.transmission_endpoint, exclude=session["tried"]
+                )
+                if session["client"] is None:
+                    session["exhausted"] = True
+            client = session["client"]
+            if client is None:
+                result.update(status="SKIPPED", error="Transmission unavailable")
+                continue
+            infohash = link_infohash(link)
+            metainfo = None
+            if infohash is None:
+                infohash, metainfo = self._torrent_metainfo(rss_id, run_id, link)
+            known = self._transmission_torrents(rss_id, run_id, client, session["breaker"]) if infohash else {}
+            if infohash in known:
+                self._log_feed_event(rss_id, f"run={run_id} backfill-skip-duplicate hash={infohash} torrent={link}")
+                result.update(status="DUPLICATE", link=link, hash=infohash)
+                continue
+            try:
+                added = client.add_torrent(metainfo if metainfo is not None else link, download_dir=target.path)
+                self._record_transmission_add(session["breaker"].name, getattr(added, "hashString", None) or infohash, title)
+                self._log_feed_event(rss_id, f"run={run_id} backfill-send-ok download_dir={target.path or '-'} torrent={link} title={title}")
+                result.update(status="SENT", link=link)
+            except Exception as e:
+                message = self._safe_error_message(e)
+                self._log_feed_event(rss_id, f"run={run_id} backfill-send-failed torrent={link} error={message}")
+                result.update(status="ERROR", error=message)
+                if self._is_transmission_outage(e):
+                    # Later selections fail over to the next endpoint
+                    session["breaker"].record_failure(message)
+                    session["tried"].add(session["breaker"].name)
+                    session["client"] = None
+        return results
+
     # ---------------------
     # Main RSS check logic
     # ---------------------
     def check_rss(self, rss_id: str, *, trigger: str = "manual", run_id: str | None = None):
-        if rss_id not in self.storage["rss"]:
+        if rss_id not in self.feeds:
             raise KeyError(f"RSS feed not found: {rss_id}")
         run_id = run_id or self._new_run_id()
+        new_items = []
+        sent_links = []
 
         def save_torrent_list():
 
             def load_torrent_list():
-                torrent_list_path = os.path.join(GC.STORAGE_DIR, f"{rss_id}_torrents_list.json")
+                torrent_list_path = self._torrent_cache_path(rss_id)
                 if not os.path.exists(torrent_list_path):
                     self.log(rss_id, f"No torrent list file found: {torrent_list_path}")
                     return {}
@@ -258,8 +1092,8 @@ class RSSManager:
 
             number_of_new = 0
             for entry in feed.entries:
-                title = self._entry_title(entry, f"entry-{len(torrent_dict) + number_of_new + 1}")
-                torrent_link = self._extract_torrent_link(entry)
+                title = entry.title or f"entry-{len(torrent_dict) + number_of_new + 1}"
+                torrent_link = entry.link
                 if not torrent_link:
                     self._log_feed_event(rss_id, f"run={run_id} entry-skipped reason=no_usable_torrent_link title={title}")
                     continue
@@ -267,142 +1101,247 @@ class RSSManager:
                     torrent_dict[title] = torrent_link
                     new_torrent_dict[title] = torrent_link
                     number_of_new += 1
-            with open(os.path.join(GC.STORAGE_DIR, f"{rss_id}_torrents_list.json"), "w", encoding="utf-8") as f:
+            with open(self._torrent_cache_path(rss_id), "w", encoding="utf-8") as f:
                 json.dump(torrent_dict, f, indent=4, ensure_ascii=False)
             self._log_feed_event(rss_id, f"run={run_id} torrent-cache-saved new_entries={number_of_new} file={rss_id}_torrents_list.json")
+            self.search_index.add_entries(rss_id, new_torrent_dict)
 
             return new_torrent_dict
 
 
-        def parse_rss():
+        def profile_tag(target):
+            return "" if target is item else f" profile={target.name or target.id}"
+
+        def rejected_by_rules(title):
+            # Feed-level rules, evaluated once per title and shared by every profile
+            if not rules_active:
+                return False
+            if title not in rejections:
+                meta = entry_meta.get(title)
+                rejections[title] = rejection_reason(meta, item) if meta else None
+                if rejections[title]:
+                    size = meta.get("size")
+                    self._log_feed_event(
+                        rss_id,
+                        f"run={run_id} entry-rejected reason={rejections[title]} size={size if size is not None else '-'} "
+                        f"categories={'|'.join(meta.get('categories')) or '-'} freeleech={meta.get('freeleech')} title={title}",
+                    )
+                    rejected_items.append({"title": title, "reason": rejections[title]})
+            return rejections[title] is not None
+
+        def record_new_item(target, title, link):
+            record = {"title": title, "link": link}
+            if target is not item:
+                record["profile"] = target.id
+            new_items.append(record)
+
+        def parse_rss(target):
 
             torrents_links = []
             number_of_new = 0
-            newest_title = self._entry_title(feed.entries[0], "")
+            newest_title = feed.entries[0].title
+            # Profiles on direct sites may narrow the feed further with their own keywords
+            key_words = target.key_words if target is not item else None
 
-            if item.last_title != newest_title:
+            if target.last_title != newest_title:
                 # RSS updated
-                self._log_feed_event(rss_id, f"run={run_id} new-torrent-detected")
+                self._log_feed_event(rss_id, f"run={run_id} new-torrent-detected{profile_tag(target)}")
 
                 for entry in feed.entries:
-                    title = self._entry_title(entry, "")
-                    if title != item.last_title:
-                        torrent_link = self._extract_torrent_link(entry)
+                    title = entry.title
+                    if title != target.last_title:
+                        if key_words and not self._match_keywords(title, key_words):
+                            continue
+                        if rejected_by_rules(title):
+                            continue
+                        torrent_link = entry.link
                         if not torrent_link:
                             self._log_feed_event(rss_id, f"run={run_id} entry-skipped reason=no_usable_torrent_link title={title or 'unknown'}")
                             continue
                         torrents_links.append(torrent_link)
+                        record_new_item(target, title, torrent_link)
                         number_of_new += 1
 
-                self._log_feed_event(rss_id, f"run={run_id} new-torrents-found count={number_of_new}")
+                self._log_feed_event(rss_id, f"run={run_id} new-torrents-found count={number_of_new}{profile_tag(target)}")
             return torrents_links
 
 
-        def search_by_keywords(torrent_dict):
+        def search_by_keywords(torrent_dict, target):
 
             torrent_links = []
 
-            if not item.key_words:
-                self._log_feed_event(rss_id, f"run={run_id} keyword-search-skipped reason=no_keywords")
+            if not target.key_words:
+                self._log_feed_event(rss_id, f"run={run_id} keyword-search-skipped reason=no_keywords{profile_tag(target)}")
                 return []
 
-            self._log_feed_event(rss_id, f"run={run_id} keyword-search-start keywords={item.key_words}")
+            self._log_feed_event(rss_id, f"run={run_id} keyword-search-start keywords={target.key_words}{profile_tag(target)}")
 
-            key_words = [s.strip() for s in item.key_words.split(';') if s.strip()]
+            key_words = [s.strip() for s in target.key_words.split(';') if s.strip()]
 
             for key_word in key_words:
 
                 parts = key_word.split()
 
                 for title, link in torrent_dict.items():
-                    if all(part in title for part in parts):
+                    if all(part in title for part in parts) and not rejected_by_rules(title):
                         torrent_links.append(link)
+                        record_new_item(target, title, link)
 
-            self._log_feed_event(rss_id, f"run={run_id} keyword-search-done matches={len(torrent_links)} keywords={item.key_words}")
+            self._log_feed_event(rss_id, f"run={run_id} keyword-search-done matches={len(torrent_links)} keywords={target.key_words}{profile_tag(target)}")
             return torrent_links
 
 
-        def send_links_to_transmission(links: list, new_title: str = ""):
-            # If Transmission settings are not configured, skip sending torrents
-            tx_url = settings.get("transmission_url")
-            tx_port = settings.get("transmission_port", GC.DEFAULT_TRANSMISSION_PORT)
-            if Client is None:
-                self._log_feed_event(rss_id, f"run={run_id} transmission-skipped reason=client_not_installed")
-            elif not tx_url:
-                self._log_feed_event(rss_id, f"run={run_id} transmission-skipped reason=not_configured")
-            else:
-                try:
-                    c = Client(host=tx_url,
-                            port=tx_port,
-                            username=settings.get("username", ""),
-                            password=settings.get("password", ""),
-                            timeout=GC.TRANSMISSION_RPC_TIMEOUT)
-                except Exception as e:
-                    # Log the connection failure but do not crash the whole application
-                    self._log_feed_event(
-                        rss_id,
-                        f"run={run_id} transmission-connect-failed host={tx_url} port={tx_port} timeout={GC.TRANSMISSION_RPC_TIMEOUT}s error={self._safe_error_message(e)}",
-                    )
-                    c = None
-
-                if c:
-                    for torrent_url in links:
-                        try:
-                            c.add_torrent(torrent_url, download_dir=item.path)
-                            self._log_feed_event(rss_id, f"run={run_id} transmission-send-ok download_dir={item.path or '-'} torrent={torrent_url}")
-                            # update last_title
-                            item.last_title = new_title
-                        except Exception as e:
-                            self._log_feed_event(rss_id, f"run={run_id} transmission-send-failed torrent={torrent_url} error={self._safe_error_message(e)}")
-
-        item = RSSItem(**self.storage["rss"][rss_id])
+        def connect_transmission():
+            # One connection per run, shared by every profile; after an outage the next endpoint takes over
+            if tx_state.get("client") is None and "exhausted" not in tx_state:
+                tx_state["client"], tx_state["breaker"] = self._connect_transmission(
+                    rss_id, run_id, settings, affinity=item.transmission_endpoint, exclude=tx_state.setdefault("tried", set())
+                )
+                if tx_state["client"] is None:
+                    tx_state["exhausted"] = True
+            return tx_state["client"]
+
+
+        def send_links_to_transmission(links: list, target, new_title: str = ""):
+            hashes = {torrent_url: infohash_by_link.get(torrent_url) or link_infohash(torrent_url) for torrent_url in links}
+            pending = list(links)
+            while pending:
+                c = connect_transmission()
+                if not c:
+                    return
+                for torrent_url in pending:
+                    if torrent_url not in metainfo_by_link:
+                        # .torrent files come from the file cache (or are downloaded into it) and also give the infohash
+                        infohash, metainfo_by_link[torrent_url] = self._torrent_metainfo(rss_id, run_id, torrent_url)
+                        hashes[torrent_url] = hashes[torrent_url] or infohash
+                # Only links with a known infohash can be matched, so skip the snapshot RPC otherwise
+                known = self._transmission_torrents(rss_id, run_id, c, tx_state["breaker"]) if any(hashes[torrent_url] for torrent_url in pending) else {}
+                remaining = []
+                for index, torrent_url in enumerate(pending):
+                    if run_id in self.evicted_runs:
+                        # Timed out by the watchdog: the next run re-sends whatever is left
+                        self._log_feed_event(rss_id, f"run={run_id} transmission-send-stopped reason=run_timed_out{profile_tag(target)}")
+                        return
+                    infohash = hashes[torrent_url]
+                    if infohash in known:
+                        self._log_feed_event(
+                            rss_id,
+                            f"run={run_id} transmission-skip-duplicate hash={infohash} name={known[infohash]['name']} torrent={torrent_url}{profile_tag(target)}",
+                        )
+                        skipped_links.append({"link": torrent_url, "hash": infohash, "name": known[infohash]["name"]})
+                        target.last_title = new_title
+                        continue
+                    try:
+                        metainfo = metainfo_by_link.get(torrent_url)
+                        added = c.add_torrent(metainfo if metainfo is not None else torrent_url, download_dir=target.path)
+                        self._record_transmission_add(tx_state["breaker"].name, getattr(added, "hashString", None) or infohash, getattr(added, "name", ""))
+                        self._log_feed_event(rss_id, f"run={run_id} transmission-send-ok download_dir={target.path or '-'} torrent={torrent_url}{profile_tag(target)}")
+                        sent_links.append(torrent_url)
+                        # update last_title
+                        target.last_title = new_title
+                    except Exception as e:
+                        self._log_feed_event(rss_id, f"run={run_id} transmission-send-failed torrent={torrent_url} error={self._safe_error_message(e)}{profile_tag(target)}")
+                        if self._is_transmission_outage(e):
+                            # Transmission went away mid-run: the rest goes to the next endpoint instead of
+                            # timing out on every link. A timed-out add may have landed, so only a refused
+                            # connection is retried elsewhere.
+                            tx_state["breaker"].record_failure(self._safe_error_message(e))
+                            tx_state["tried"].add(tx_state["breaker"].name)
+                            tx_state["client"] = None
+                            retry_failed = isinstance(e, transmission_rpc.TransmissionConnectError)
+                            remaining = pending[index if retry_failed else index + 1:]
+                            break
+                pending = remaining
+
+        # Run-private copy: the run updates fetch stats and profile last_title, then persists it
+        stored = self.feeds.get(rss_id)
+        item = stored.model_copy(update={"profiles": [profile.model_copy() for profile in stored.profiles]})
         settings = self.storage.get("settings", {})
+        tx_state = {}
+        rules_active = has_rules(item)
+        entry_meta = {}
+        rejections = {}
+        rejected_items = []
+        skipped_links = []
+        infohash_by_link = {}
+        metainfo_by_link = {}
 
         try:
             started = time.monotonic()
             self._log_feed_event(rss_id, f"run={run_id} check-start trigger={trigger} interval_min={item.interval}")
-            feed = self._fetch_feed(rss_id, item, run_id)
+            host_breaker = self.breakers.get(self._host_breaker_name(item.url))
+            if not host_breaker.allow():
+                message = f"circuit open for {host_breaker.name}, retry in {host_breaker.retry_in():.0f}s"
+                self._log_feed_event(
+                    rss_id,
+                    f"run={run_id} check-skipped reason=circuit_open breaker={host_breaker.name} retry_in={host_breaker.retry_in():.0f}s",
+                )
+                self._mark_feed_result(item, "CIRCUIT_OPEN", message, run_id)
+                return {"status": "CIRCUIT_OPEN", "error": message, "newItems": [], "sent": []}
+            self._set_run_stage(rss_id, run_id, "fetch")
+            try:
+                # Compact records only from here on; the raw parse tree is released
+                feed = compact_feed(self._fetch_feed(rss_id, item, run_id))
+            except Exception as exc:
+                if self._is_host_outage(exc):
+                    host_breaker.record_failure(self._safe_error_message(exc))
+                else:
+                    host_breaker.record_success()
+                raise
+            host_breaker.record_success()
+            self._set_run_stage(rss_id, run_id, "parse")
 
             # fetch failed
             if feed.bozo:
                 message = f"Fetch failed: {feed.bozo_exception}"
                 self._log_feed_event(rss_id, f"run={run_id} rss-parse-failed error={self._safe_error_message(feed.bozo_exception)}")
-                self._mark_feed_result(item, "ERROR", self._safe_error_message(feed.bozo_exception))
-                return
+                self._mark_feed_result(item, "ERROR", self._safe_error_message(feed.bozo_exception), run_id)
+                return {"status": "ERROR", "error": item.last_error, "newItems": [], "sent": []}
 
             # Check if feed has entries
             if not feed.entries or len(feed.entries) == 0:
                 message = "RSS feed has no entries"
                 self._log_feed_event(rss_id, f"run={run_id} rss-empty")
-                self._mark_feed_result(item, "EMPTY", message)
-                return
+                self._mark_feed_result(item, "EMPTY", message, run_id)
+                return {"status": "EMPTY", "error": message, "newItems": [], "sent": []}
 
             pt_site_type = GC.PT_SITE_TYPES.get(item.pt_site, GC.DIRECT)
             if item.pt_site not in GC.PT_SITE_TYPES:
                 self._log_feed_event(rss_id, f"run={run_id} pt-site-unknown pt_site={item.pt_site} fallback=direct")
 
+            self._set_run_stage(rss_id, run_id, "filter")
+            infohash_by_link = {entry.link: entry.infohash for entry in feed.entries if entry.infohash}
+            if rules_active:
+                entry_meta = {entry.title: entry_metadata(entry) for entry in feed.entries}
+            # Fetched and parsed once; the entries fan out to the feed itself and every extra profile
+            targets = [item, *item.profiles]
             if pt_site_type == GC.FILTER:
                 new_torrent_dict = save_torrent_list()
-                torrent_links = search_by_keywords(new_torrent_dict)
+                links_by_target = [search_by_keywords(new_torrent_dict, target) for target in targets]
             else:
-                torrent_links = parse_rss()
+                links_by_target = [parse_rss(target) for target in targets]
+            torrent_links = [link for links in links_by_target for link in links]
 
-            new_title = self._entry_title(feed.entries[0], item.last_title or "")
-            send_links_to_transmission(torrent_links, new_title=new_title)
+            self._set_run_stage(rss_id, run_id, "send")
+            for target, links in zip(targets, links_by_target):
+                new_title = feed.entries[0].title or target.last_title or ""
+                send_links_to_transmission(links, target, new_title=new_title)
 
             item.last_status = "OK"
             item.last_error = None
             item.last_fetch = self._now_str()
-            self._persist_item(item)
+            item.consecutive_failures = 0
+            self._persist_item(item, run_id)
             self._log_feed_event(
                 rss_id,
-                f"run={run_id} check-finish trigger={trigger} result=OK discovered_links={len(torrent_links)} elapsed={self._format_duration(time.monotonic() - started)}",
+                f"run={run_id} check-finish trigger={trigger} result=OK discovered_links={len(torrent_links)} skipped_duplicates={len(skipped_links)} elapsed={self._format_duration(time.monotonic() - started)}",
             )
+            return {"status": "OK", "error": None, "newItems": new_items, "sent": sent_links, "rejected": rejected_items, "skipped": skipped_links}
         except Exception as exc:
             error_message = self._safe_error_message(exc)
             trace = traceback.format_exc().strip().replace("\n", " | ")
             self._log_feed_event(rss_id, f"run={run_id} check-failed trigger={trigger} error={error_message} traceback={trace}")
-            self._mark_feed_result(item, "ERROR", error_message)
+            self._mark_feed_result(item, "ERROR", error_message, run_id)
             raise
 
 
@@ -410,16 +1349,20 @@ class RSSManager:
     # Scheduled polling
     # ---------------------
     def _schedule_next_run(self, rss_id: str, delay_seconds: int | None = None, *, source: str = "schedule"):
+        if self._stopped.is_set() or not self.owns_feed(rss_id):
+            return
         with self.state_lock:
-            rss_data = self.storage["rss"].get(rss_id)
-            if not rss_data:
+            if rss_id not in self.feeds:
                 timer = self.tasks.pop(rss_id, None)
                 if timer:
                     timer.cancel()
                 return
 
             interval_seconds = delay_seconds if delay_seconds is not None else self._interval_seconds(rss_id)
-            timer = threading.Timer(interval_seconds, self.schedule, args=[rss_id])
+            self._set_next_run_at(rss_id, time.time() + interval_seconds)
+            # A backoff timer re-runs a failing feed; it queues ahead of ordinary timer runs
+            trigger = "retry" if source == "backoff" else "timer"
+            timer = threading.Timer(interval_seconds, self.schedule, args=[rss_id], kwargs={"trigger": trigger})
             timer.daemon = True
             self.tasks[rss_id] = timer
             timer.start()
@@ -429,7 +1372,7 @@ class RSSManager:
             f"scheduler-armed source={source} next_run_in={interval_seconds}s next_interval_min={max(interval_seconds // 60, 1)}",
         )
 
-    def _run_check_with_lock(self, rss_id: str, trigger: str, run_id: str, run_lock: threading.Lock):
+    def _run_check_with_lock(self, rss_id: str, trigger: str, run_id: str, run_lock: threading.Lock, job_ids=()):
         started = time.monotonic()
         thread_name = threading.current_thread().name
         self._set_active_run(
@@ -442,12 +1385,17 @@ class RSSManager:
                 "thread_name": thread_name,
             },
         )
+        for job_id in job_ids:
+            self._update_job(job_id, status="running", runId=run_id, startedAt=self._now_str())
+        error = ""
+        result = None
         try:
-            self.check_rss(rss_id, trigger=trigger, run_id=run_id)
+            result = self.check_rss(rss_id, trigger=trigger, run_id=run_id)
         except Exception as exc:
+            error = self._safe_error_message(exc)
             self._log_feed_event(
                 rss_id,
-                f"run={run_id} worker-exit result=ERROR trigger={trigger} elapsed={self._format_duration(time.monotonic() - started)} error={self._safe_error_message(exc)}",
+                f"run={run_id} worker-exit result=ERROR trigger={trigger} elapsed={self._format_duration(time.monotonic() - started)} error={error}",
             )
         else:
             self._log_feed_event(
@@ -455,15 +1403,208 @@ class RSSManager:
                 f"run={run_id} worker-exit result=OK trigger={trigger} elapsed={self._format_duration(time.monotonic() - started)}",
             )
         finally:
-            self._clear_active_run(rss_id)
             run_lock.release()
+            if self._discard_evicted_run(run_id):
+                # Already reported as TIMEOUT; the feed has a fresh run lock and may be running again
+                self._log_feed_event(rss_id, f"run={run_id} worker-exit-after-timeout elapsed={self._format_duration(time.monotonic() - started)}")
+                job_ids = ()
+            else:
+                self._finish_active_run(rss_id, run_id, started, error)
+                self._apply_failure_backoff(rss_id)
+            for job_id in job_ids:
+                self._update_job(
+                    job_id,
+                    status="failed" if error else "succeeded",
+                    finishedAt=self._now_str(),
+                    result=result,
+                    error=error or None,
+                )
+
+    # ---------------------
+    # Run watchdog
+    # ---------------------
+    @staticmethod
+    def _overdue_reason(run_meta: dict, now: float):
+        age = now - run_meta["started_monotonic"]
+        if age > GC.RUN_TOTAL_DEADLINE:
+            return f"run_deadline={GC.RUN_TOTAL_DEADLINE}s"
+        stage = run_meta.get("stage")
+        stage_deadline = GC.RUN_STAGE_DEADLINES.get(stage)
+        if stage_deadline and now - run_meta["stage_started_monotonic"] > stage_deadline:
+            return f"stage_deadline={stage}:{stage_deadline}s"
+        return None
+
+    def check_overdue_runs(self) -> list:
+        """One watchdog pass: time out every run past a deadline; returns their run ids."""
+        now = time.monotonic()
+        with self.state_lock:
+            overdue = [
+                (rss_id, dict(run_meta), reason)
+                for rss_id, run_meta in self.active_runs.items()
+                if (reason := self._overdue_reason(run_meta, now))
+            ]
+        return [run_meta["run_id"] for rss_id, run_meta, reason in overdue if self._evict_run(rss_id, run_meta, reason)]
+
+    def _evict_run(self, rss_id: str, run_meta: dict, reason: str) -> bool:
+        run_id = run_meta["run_id"]
+        with self.state_lock:
+            current = self.active_runs.get(rss_id)
+            if current is None or current["run_id"] != run_id:
+                return False  # finished meanwhile
+            del self.active_runs[rss_id]
+            self.evicted_runs.add(run_id)
+            # Python threads cannot be killed: the stuck one keeps its lock, later runs take a new one,
+            # and run_pool replaces the worker it is blocking
+            self.feed_run_locks[rss_id] = threading.Lock()
+            self.run_pool.abandon(rss_id)
+            item = self.feeds.get(rss_id)
+            job_ids = [job["id"] for job in self.jobs.values() if job["runId"] == run_id and job["status"] == "running"]
+        elapsed = round(time.monotonic() - run_meta["started_monotonic"], 3)
+        message = f"run timed out in stage {run_meta.get('stage')} ({reason})"
+        self._log_feed_event(
+            rss_id,
+            f"run={run_id} run-timeout stage={run_meta.get('stage')} reason={reason} elapsed={self._format_duration(elapsed)} thread={run_meta.get('thread_name')}",
+        )
+        self.timed_out_runs.append({
+            "feedId": rss_id,
+            "runId": run_id,
+            "trigger": run_meta.get("trigger"),
+            "stage": run_meta.get("stage"),
+            "reason": reason,
+            "elapsedSeconds": elapsed,
+            "timedOutAt": self._now_str(),
+        })
+        if item is not None:
+            self._mark_feed_result(item.model_copy(), "TIMEOUT", message)
+        self._publish_run_event("run-error", rss_id, run_id, error=message)
+        self._publish_run_event("run-finish", rss_id, run_id, status="TIMEOUT", elapsed=elapsed)
+        for job_id in job_ids:
+            self._update_job(job_id, status="failed", finishedAt=self._now_str(), error=message)
+        self._apply_failure_backoff(rss_id)
+        return True
+
+    def _discard_evicted_run(self, run_id: str) -> bool:
+        with self.state_lock:
+            if run_id in self.evicted_runs:
+                self.evicted_runs.discard(run_id)
+                return True
+            return False
+
+    def _start_watchdog(self):
+        with self.state_lock:
+            if self._watchdog_thread is not None:
+                return
+            self._watchdog_thread = threading.Thread(target=self._watchdog_loop, daemon=True, name="run-watchdog")
+        self._watchdog_thread.start()
+
+    def _watchdog_loop(self):
+        while not self._stopped.wait(GC.RUN_WATCHDOG_SECONDS):
+            try:
+                self.check_overdue_runs()
+            except Exception as exc:
+                self.log_manager(f"run-watchdog failed error={self._safe_error_message(exc)}")
+
+    def active_runs_status(self) -> dict:
+        """Running checks (oldest first) with their ages and deadlines, plus recent timeouts."""
+        now = time.monotonic()
+        with self.state_lock:
+            runs = [
+                {
+                    "feedId": rss_id,
+                    "feedName": self.feeds.get(rss_id).name if rss_id in self.feeds else None,
+                    "runId": run_meta["run_id"],
+                    "trigger": run_meta["trigger"],
+                    "stage": run_meta.get("stage"),
+                    "startedAt": run_meta["started_at"],
+                    "ageSeconds": round(now - run_meta["started_monotonic"], 3),
+                    "stageAgeSeconds": round(now - run_meta["stage_started_monotonic"], 3),
+                    "stageDeadlineSeconds": GC.RUN_STAGE_DEADLINES.get(run_meta.get("stage")),
+                    "deadlineSeconds": GC.RUN_TOTAL_DEADLINE,
+                    "thread": run_meta.get("thread_name"),
+                }
+                for rss_id, run_meta in self.active_runs.items()
+            ]
+            timed_out = list(self.timed_out_runs)
+        runs.sort(key=lambda run: run["ageSeconds"], reverse=True)
+        return {"runs": runs, "timedOut": timed_out[::-1]}
+
+    def _spawn_check_worker(self, rss_id: str, trigger: str, run_lock: threading.Lock, job_id: str | None = None):
+        """Queue a run in run_pool; run_lock is already held and stays held until the run finishes."""
+        run_id = self._new_run_id()
+        with self.state_lock:
+            self.queued_runs[rss_id] = {
+                "run_id": run_id,
+                "trigger": trigger,
+                "run_lock": run_lock,
+                "job_ids": [job_id] if job_id else [],
+                "queued_monotonic": time.monotonic(),
+            }
+            self.run_pool.submit(rss_id, trigger_priority(trigger), lambda: self._run_queued_check(rss_id))
+        self._log_feed_event(rss_id, f"run={run_id} run-queued trigger={trigger} queue_depth={len(self.queued_runs)}")
+        return run_id
+
+    def _coalesce_queued_run(self, rss_id: str, trigger: str, job_id: str | None = None):
+        """
+        Fold a request into the feed's queued run (raising its priority). Caller holds state_lock and
+        passes the result to _log_coalesced_run once it has released it; None when nothing is queued.
+        """
+        queued = self.queued_runs.get(rss_id)
+        if queued is None:
+            return None
+        if trigger_priority(trigger) < trigger_priority(queued["trigger"]):
+            queued["trigger"] = trigger
+        if job_id:
+            queued["job_ids"].append(job_id)
+        self.run_pool.submit(rss_id, trigger_priority(trigger), lambda: self._run_queued_check(rss_id))
+        return queued["run_id"], queued["trigger"]
+
+    def _log_coalesced_run(self, rss_id: str, trigger: str, coalesced: tuple):
+        # Outside state_lock: the feed log write can rotate (and gzip) the log file
+        run_id, queued_trigger = coalesced
+        self._log_feed_event(rss_id, f"run={run_id} run-coalesced trigger={trigger} queued_trigger={queued_trigger}")
+
+    def _run_queued_check(self, rss_id: str):
+        with self.state_lock:
+            queued = self.queued_runs.pop(rss_id, None)
+        if queued is None:
+            return  # dropped while waiting (feed deleted)
+        if not self.owns_feed(rss_id):
+            # Leadership or the shard moved while the run waited; the new owner schedules it
+            self._abandon_queued_run(rss_id, queued, "another worker owns the feed now")
+            return
+        waited = time.monotonic() - queued["queued_monotonic"]
+        self._log_feed_event(
+            rss_id,
+            f"run={queued['run_id']} worker-start trigger={queued['trigger']} thread={threading.current_thread().name} queued_for={self._format_duration(waited)}",
+        )
+        self._run_check_with_lock(rss_id, queued["trigger"], queued["run_id"], queued["run_lock"], queued["job_ids"])
+
+    def _abandon_queued_run(self, rss_id: str, queued: dict, reason: str):
+        queued["run_lock"].release()
+        self._log_feed_event(rss_id, f"run={queued['run_id']} run-dropped reason={reason}")
+        for job_id in queued["job_ids"]:
+            self._update_job(job_id, status="failed", finishedAt=self._now_str(), error=f"check dropped before it started: {reason}")
+
+    def _drop_queued_run(self, rss_id: str, reason: str):
+        with self.state_lock:
+            queued = self.queued_runs.pop(rss_id, None)
+            self.run_pool.discard(rss_id)
+        if queued is not None:
+            self._abandon_queued_run(rss_id, queued, reason)
 
     def _start_check_thread(self, rss_id: str, trigger: str):
-        if rss_id not in self.storage["rss"]:
+        if rss_id not in self.feeds:
             return False
 
-        run_lock = self._get_run_lock(rss_id)
-        if not run_lock.acquire(blocking=False):
+        with self.state_lock:
+            coalesced = self._coalesce_queued_run(rss_id, trigger)
+            if coalesced is None:
+                run_lock = self._get_run_lock(rss_id)
+                acquired = run_lock.acquire(blocking=False)
+        if coalesced is not None:
+            self._log_coalesced_run(rss_id, trigger, coalesced)
+            return True
+        if not acquired:
             active_run = self._get_active_run(rss_id)
             if active_run:
                 active_for = time.monotonic() - active_run["started_monotonic"]
@@ -475,19 +1616,11 @@ class RSSManager:
                 self._log_feed_event(rss_id, f"scheduler-skip trigger={trigger} reason=previous_run_still_active")
             return False
 
-        run_id = self._new_run_id()
-        worker = threading.Thread(
-            target=self._run_check_with_lock,
-            args=(rss_id, trigger, run_id, run_lock),
-            daemon=True,
-            name=f"rss-check-{rss_id[:8]}",
-        )
-        worker.start()
-        self._log_feed_event(rss_id, f"run={run_id} worker-start trigger={trigger} thread={worker.name}")
+        self._spawn_check_worker(rss_id, trigger, run_lock)
         return True
 
-    def run_check_now(self, rss_id: str, trigger: str = "manual"):
-        if rss_id not in self.storage["rss"]:
+    def _acquire_manual_run_lock(self, rss_id: str):
+        if rss_id not in self.feeds:
             raise KeyError(f"RSS feed not found: {rss_id}")
 
         run_lock = self._get_run_lock(rss_id)
@@ -502,34 +1635,135 @@ class RSSManager:
                 )
             self._log_feed_event(rss_id, f"manual-check-skipped reason={active_message}")
             raise RuntimeError(active_message)
+        return run_lock
 
-        run_id = self._new_run_id()
-        self._set_active_run(
-            rss_id,
-            {
-                "run_id": run_id,
-                "trigger": trigger,
-                "started_at": self._now_str(),
-                "started_monotonic": time.monotonic(),
-                "thread_name": threading.current_thread().name,
-            },
-        )
+    def run_check_now(self, rss_id: str, trigger: str = "manual"):
+        if not self.owns_feed(rss_id):
+            owner = self._owner_info(rss_id)
+            return self._wait_for_remote_job(owner, self.worker_client.submit_check(owner, rss_id, trigger))
+
+        # Synchronous checks run in run_pool too (at manual priority); this thread only waits
+        job = self.queue_local_check_job(rss_id, trigger)
+        # The watchdog fails the job once the run passes RUN_TOTAL_DEADLINE; the extra watchdog
+        # period covers its polling, so this only expires when the job was never picked up
+        deadline = time.monotonic() + GC.RUN_TOTAL_DEADLINE + GC.RUN_WATCHDOG_SECONDS
+        with self.jobs_changed:
+            while True:
+                current = self.jobs.get(job["id"])
+                if current is None:
+                    # Pushed out of the job history by newer jobs: the run went ahead, its result is gone
+                    self.log_manager(f"rss-manager check-job-evicted job={job['id']} feed={rss_id} limit={GC.JOB_HISTORY_LIMIT}")
+                    return None
+                job = current
+                if job["status"] in ("succeeded", "failed"):
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"check did not finish within {GC.RUN_TOTAL_DEADLINE}s (job {job['id']} is {job['status']})")
+                self.jobs_changed.wait(remaining)
+        if job["status"] == "failed":
+            raise RuntimeError(job.get("error") or "check failed")
+        return job.get("result")
+
+    # ---------------------
+    # Manual check jobs
+    # ---------------------
+    def submit_check_job(self, rss_id: str, trigger: str = "manual"):
+        """Queue a manual check in the background and return its job record right away."""
+        if not self.owns_feed(rss_id):
+            # Only the worker that schedules the feed runs it; its run lock keeps checks exclusive
+            return self.worker_client.submit_check(self._owner_info(rss_id), rss_id, trigger)
+        return self.queue_local_check_job(rss_id, trigger)
+
+    def queue_local_check_job(self, rss_id: str, trigger: str = "manual"):
+        if rss_id not in self.feeds:
+            raise KeyError(f"RSS feed not found: {rss_id}")
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "feedId": rss_id,
+            "trigger": trigger,
+            "status": "queued",
+            "runId": None,
+            "createdAt": self._now_str(),
+            "startedAt": None,
+            "finishedAt": None,
+            "result": None,
+            "error": None,
+        }
+        with self.state_lock:
+            # A run still waiting in the queue takes this job along (and moves up to manual priority)
+            coalesced = self._coalesce_queued_run(rss_id, trigger, job_id)
+            if coalesced is None:
+                run_lock = self._acquire_manual_run_lock(rss_id)
+            self.jobs[job_id] = job
+            while len(self.jobs) > GC.JOB_HISTORY_LIMIT:
+                self.jobs.popitem(last=False)
+        if coalesced is not None:
+            self._log_coalesced_run(rss_id, trigger, coalesced)
+            return self.get_job(job_id)
         try:
-            self.check_rss(rss_id, trigger=trigger, run_id=run_id)
-        finally:
-            self._clear_active_run(rss_id)
+            self._spawn_check_worker(rss_id, trigger, run_lock, job_id)
+        except Exception as exc:
             run_lock.release()
+            self._update_job(job_id, status="failed", finishedAt=self._now_str(), error=self._safe_error_message(exc))
+            raise
+        return self.get_job(job_id)
 
-    def schedule(self, rss_id: str):
-        if rss_id not in self.storage["rss"]:
-            self._log_feed_event(rss_id, "scheduler-fire ignored because feed no longer exists")
+    def run_queue_status(self) -> dict:
+        """run_pool metrics plus the feeds waiting in it, oldest first."""
+        now = time.monotonic()
+        with self.state_lock:
+            waiting = sorted(self.queued_runs.items(), key=lambda pair: pair[1]["queued_monotonic"])
+            queued = [
+                {
+                    "feedId": rss_id,
+                    "runId": run["run_id"],
+                    "trigger": run["trigger"],
+                    "jobs": len(run["job_ids"]),
+                    "waitingSeconds": round(now - run["queued_monotonic"], 3),
+                }
+                for rss_id, run in waiting
+            ]
+        return {**self.run_pool.stats(), "feeds": queued}
+
+    def _update_job(self, job_id: str | None, **fields):
+        if job_id is None:
+            return
+        with self.state_lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+                self.jobs_changed.notify_all()
+
+    def get_job(self, job_id: str):
+        with self.state_lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return self._find_remote_job(job_id)
+            job = dict(job)
+            run_meta = self.active_runs.get(job["feedId"])
+            if job["status"] == "running" and run_meta and run_meta.get("run_id") == job["runId"]:
+                job["stage"] = run_meta.get("stage")
+                job["elapsed"] = round(time.monotonic() - run_meta["started_monotonic"], 3)
+            return job
+
+    def schedule(self, rss_id: str, trigger: str = "timer"):
+        if rss_id not in self.feeds:
+            # Manager log only: the feed's own log was deleted with it
+            self.log_manager(f"[{rss_id}] scheduler-fire ignored because feed no longer exists")
+            return
+        if not self.owns_feed(rss_id):
+            self._log_feed_event(rss_id, "scheduler-fire ignored because another worker owns the feed")
             return
 
-        self._log_feed_event(rss_id, "scheduler-fire trigger=timer")
+        self._log_feed_event(rss_id, f"scheduler-fire trigger={trigger}")
         self._schedule_next_run(rss_id, source="timer")
-        self._start_check_thread(rss_id, "timer")
+        self._start_check_thread(rss_id, trigger)
 
     def start_task(self, rss_id: str):
+        if not self.owns_feed(rss_id):
+            return
         with self.state_lock:
             existing_timer = self.tasks.pop(rss_id, None)
             if existing_timer:
@@ -539,7 +1773,296 @@ class RSSManager:
         self._start_check_thread(rss_id, "startup")
 
     def start_all(self):
+        self.boot_state = "starting"
+        started = time.monotonic()
         self.log_manager("rss-manager start_all begin")
-        for rss_id in list(self.storage["rss"].keys()):
-            self.start_task(rss_id)
-        self.log_manager(f"rss-manager start_all done feeds={len(self.storage['rss'])}")
+        self.logs.enforce_retention()
+        self._start_watchdog()
+        # Arm first runs a few ms apart instead of firing every feed at once; the offset wraps
+        # within each feed's interval so large inventories spread over one polling cycle
+        for index, rss_id in enumerate(self.feeds.ids()):
+            if not self.owns_feed(rss_id):
+                continue
+            self._cancel_feed_timer(rss_id)
+            first_run_in = round((index * GC.STARTUP_STAGGER_SECONDS) % self._interval_seconds(rss_id), 3)
+            self._schedule_next_run(rss_id, delay_seconds=first_run_in, source="start")
+        self.boot_state = "running"
+        self.log_manager(
+            f"rss-manager start_all done feeds={len(self.feeds)} elapsed={self._format_duration(time.monotonic() - started)}"
+        )
+
+    def storage_usage(self) -> dict:
+        """Bytes on disk by kind (logs, torrent caches, index, captures, .torrent files) plus the largest and orphaned feeds."""
+        logs = self.logs.usage()
+        log_bytes = logs.pop("byName")
+        log_bytes.pop(MANAGER_LOG, None)
+        cache_bytes = {}
+        for entry in os.scandir(GC.STORAGE_DIR):
+            if entry.is_file() and entry.name.endswith(CACHE_SUFFIX):
+                cache_bytes[entry.name[:-len(CACHE_SUFFIX)]] = entry.stat().st_size
+        capture_dir = os.path.join(GC.STORAGE_DIR, GC.FEED_CAPTURE_DIR)
+        capture_bytes = sum(
+            os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(capture_dir) for name in names
+        )
+
+        torrent_files = self.torrent_files.stats() if self.torrent_files is not None else None
+
+        def file_size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+
+        known = set(self.feeds.all_ids())
+        snapshot = self.feeds.snapshot()
+        feeds = [
+            {
+                "feedId": rss_id,
+                "name": snapshot[rss_id].name if rss_id in snapshot else None,
+                "logBytes": log_bytes.get(rss_id, 0),
+                "cacheBytes": cache_bytes.get(rss_id, 0),
+            }
+            for rss_id in set(log_bytes) | set(cache_bytes)
+        ]
+        storage_bytes = file_size(GC.STORAGE_PATH)
+        index_bytes = file_size(os.path.join(GC.STORAGE_DIR, GC.SEARCH_INDEX_FILE))
+        cache_total = sum(cache_bytes.values())
+        return {
+            "totalBytes": logs["activeBytes"] + logs["archiveBytes"] + cache_total + storage_bytes + index_bytes + capture_bytes
+            + (torrent_files["bytes"] if torrent_files else 0),
+            "logs": logs,
+            "torrentCaches": {"bytes": cache_total, "files": len(cache_bytes)},
+            "storageBytes": storage_bytes,
+            "searchIndexBytes": index_bytes,
+            "captureBytes": capture_bytes,
+            "torrentFiles": torrent_files,
+            "largestFeeds": sorted(
+                (feed for feed in feeds if feed["feedId"] in known),
+                key=lambda feed: feed["logBytes"] + feed["cacheBytes"],
+                reverse=True,
+            )[:GC.STORAGE_USAGE_TOP_FEEDS],
+            # Files of feeds that no longer exist (deleted before cleanup-on-delete, or by hand)
+            "orphanedFeeds": sorted(
+                (feed for feed in feeds if feed["feedId"] not in known), key=lambda feed: feed["feedId"]
+            ),
+        }
+
+    def health(self) -> dict:
+        # Cheap enough for container probes: no storage reads, no network
+        with self.state_lock:
+            feeds = len(self.feeds)
+        return {
+            "status": "ok",
+            "scheduler": self.boot_state,
+            "clusterMode": self.cluster_mode or "single",
+            "feeds": feeds,
+            "openBreakers": sum(1 for breaker in self.breakers.snapshot() if breaker["state"] == OPEN),
+            "queuedRuns": len(self.queued_runs),
+            "uptimeSeconds": round(time.time() - self.started_at, 3),
+        }
+
+    # ---------------------
+    # Multi-worker scheduling
+    # ---------------------
+    def owns_feed(self, rss_id: str) -> bool:
+        if self.cluster_mode is None:
+            return True
+        if self.cluster_mode == GC.CLUSTER_MODE_SHARDED:
+            return self.shard_ring is not None and self.shard_ring.owner(rss_id) == self.worker_id
+        return self.election.is_leader
+
+    def _owner_info(self, rss_id: str):
+        if self.cluster_mode == GC.CLUSTER_MODE_SHARDED:
+            owner = self.shard_ring.owner(rss_id) if self.shard_ring else None
+            return self.shard_members.get(owner)
+        return self.election.leader_info()
+
+    def _find_remote_job(self, job_id: str):
+        if self.cluster_mode is None:
+            return None
+        if self.cluster_mode == GC.CLUSTER_MODE_SHARDED:
+            candidates = [info for worker_id, info in self.shard_members.items() if worker_id != self.worker_id]
+        else:
+            candidates = [] if self.election.is_leader else [self.election.leader_info()]
+        for info in candidates:
+            job = self.worker_client.get_job(info, job_id)
+            if job is not None:
+                return job
+        return None
+
+    def start_cluster(self, mode: str = GC.CLUSTER_MODE):
+        """
+        Coordinate with the other worker processes sharing GC.STORAGE_DIR.
+
+        "leader": one elected worker schedules every feed. "sharded": every worker schedules
+        the feeds that hash to it. All workers serve the full API either way. "off": this is the
+        only process, so feeds are scheduled here with no lock files, RPC or shared event journal.
+        """
+        if mode == GC.CLUSTER_MODE_OFF:
+            self.start_all()
+            return
+        self.worker_client = WorkerClient(GC.WORKER_RPC_TIMEOUT)
+        self.events.attach_journal(os.path.join(GC.STORAGE_DIR, GC.EVENT_JOURNAL_FILE), GC.EVENT_JOURNAL_POLL_SECONDS)
+        threading.Thread(target=self._storage_sync_loop, daemon=True, name="storage-sync").start()
+        if mode == GC.CLUSTER_MODE_SHARDED:
+            self.rpc_server = WorkerRPCServer(self)
+            self.rpc_server.start()
+            self.membership = ShardMembership(
+                os.path.join(GC.STORAGE_DIR, GC.SHARD_LEASE_DIR), self.worker_id, GC.SHARD_LEASE_TTL
+            )
+            self.cluster_mode = mode
+            self._shard_heartbeat()
+            self.log_manager(
+                f"rss-manager shard-join worker={self.worker_id} members={len(self.shard_members)} rpc={self.rpc_server.address}"
+            )
+            threading.Thread(target=self._shard_heartbeat_loop, daemon=True, name="shard-heartbeat").start()
+            return
+
+        self.election = LeaderElection(
+            os.path.join(GC.STORAGE_DIR, GC.LEADER_LOCK_FILE), self._on_elected, GC.LEADER_RETRY_SECONDS
+        )
+        self.cluster_mode = GC.CLUSTER_MODE_LEADER
+        self.election.start()
+        if not self.election.is_leader:
+            self.boot_state = "standby"
+            self.log_manager(f"rss-manager follower pid={os.getpid()} waiting for scheduler leadership")
+
+    def stop_cluster(self):
+        # This worker schedules nothing from here on; pending timers would only fire into "not owner"
+        for rss_id in list(self.tasks):
+            self._cancel_feed_timer(rss_id)
+        if self.membership is not None:
+            self.membership.leave()
+        if self.election is not None:
+            self.election.stop()
+        if self.rpc_server is not None:
+            self.rpc_server.stop()
+        self.events.close()
+
+    def shutdown(self, wait_seconds: float = GC.SHUTDOWN_WAIT_SECONDS):
+        """
+        Stop scheduling, let running checks finish (up to wait_seconds), then flush the search
+        index and stop the parse pool. Nothing writes to storage afterwards unless a check is
+        still stuck past wait_seconds.
+        """
+        self._stopped.set()
+        self.stop_cluster()
+        self.run_pool.shutdown()
+        if not self.run_pool.join(wait_seconds):
+            self.log_manager(f"rss-manager shutdown runs-still-active={len(self.active_runs)} waited={wait_seconds}s")
+        if self._watchdog_thread is not None:
+            self._watchdog_thread.join(wait_seconds)
+        self.search_index.close()
+        self.feed_parser.shutdown()
+
+    def _on_elected(self):
+        self.refresh_storage()
+        self.rpc_server = WorkerRPCServer(self)
+        self.rpc_server.start()
+        self.election.advertise({
+            "pid": os.getpid(),
+            "address": self.rpc_server.address,
+            "token": self.rpc_server.token,
+            "elected_at": self._now_str(),
+        })
+        self.log_manager(f"rss-manager elected scheduler leader pid={os.getpid()} rpc={self.rpc_server.address}")
+        self.start_all()
+
+    def _shard_heartbeat(self):
+        self.membership.heartbeat({"pid": os.getpid(), "address": self.rpc_server.address, "token": self.rpc_server.token})
+        members = self.membership.live_members()
+        with self.state_lock:
+            previous = self.shard_ring
+            self.shard_members = members
+            if previous is not None and previous.members == sorted(members):
+                return
+            self.shard_ring = HashRing(members, GC.SHARD_VNODES)
+        if previous is not None:
+            self._rebalance_shards(previous)
+
+    def _shard_heartbeat_loop(self):
+        started = False
+        while True:
+            time.sleep(GC.SHARD_HEARTBEAT_SECONDS)
+            try:
+                self._shard_heartbeat()
+            except Exception as exc:
+                self.log_manager(f"shard-heartbeat failed error={self._safe_error_message(exc)}")
+            if not started:
+                # Workers launched together have seen each other's leases by now; start owned feeds once
+                started = True
+                self.start_all()
+
+    def _rebalance_shards(self, previous: HashRing):
+        gained, released = [], []
+        with self.state_lock:
+            for rss_id in self.feeds.ids():
+                was_owner = previous.owner(rss_id) == self.worker_id
+                if self.owns_feed(rss_id) and not was_owner:
+                    gained.append(rss_id)
+                elif was_owner and not self.owns_feed(rss_id):
+                    released.append(rss_id)
+            for rss_id in released:
+                # An in-flight run finishes here; the new owner arms its own timer
+                self._cancel_feed_timer(rss_id)
+        self.log_manager(
+            f"rss-manager shard-rebalance members={len(self.shard_members)} gained={len(gained)} released={len(released)}"
+        )
+        for index, rss_id in enumerate(gained):
+            self._cancel_feed_timer(rss_id)
+            first_run_in = min(GC.IMPORT_STAGGER_SECONDS * (index + 1), self._interval_seconds(rss_id))
+            self._schedule_next_run(rss_id, delay_seconds=first_run_in, source="rebalance")
+
+    def cluster_status(self) -> dict:
+        """Coordinator view: which worker schedules how many feeds."""
+        with self.state_lock:
+            feed_ids = self.feeds.ids()
+            members = dict(self.shard_members)
+            ring = self.shard_ring
+        status = {"mode": self.cluster_mode or "single", "workerId": self.worker_id, "workers": []}
+        if self.cluster_mode == GC.CLUSTER_MODE_SHARDED and ring is not None:
+            owned = {worker_id: 0 for worker_id in members}
+            for rss_id in feed_ids:
+                owner = ring.owner(rss_id)
+                owned[owner] = owned.get(owner, 0) + 1
+            now = time.time()
+            for worker_id, lease in sorted(members.items()):
+                status["workers"].append({
+                    "workerId": worker_id,
+                    "pid": lease.get("pid"),
+                    "host": lease.get("host"),
+                    "heartbeatAge": round(now - lease.get("heartbeat", now), 1),
+                    "feeds": owned.get(worker_id, 0),
+                })
+        elif self.cluster_mode == GC.CLUSTER_MODE_LEADER:
+            leader = self.election.leader_info() or {}
+            status["workers"].append({
+                "workerId": None,
+                "pid": leader.get("pid"),
+                "role": "leader",
+                "electedAt": leader.get("elected_at"),
+                "feeds": len(feed_ids),
+            })
+        else:
+            status["workers"].append({"workerId": self.worker_id, "pid": os.getpid(), "feeds": len(feed_ids)})
+        return status
+
+    def _storage_sync_loop(self):
+        while True:
+            time.sleep(GC.STORAGE_SYNC_SECONDS)
+            try:
+                self.refresh_storage()
+            except Exception as exc:
+                self.log_manager(f"storage-sync failed error={self._safe_error_message(exc)}")
+
+    def _wait_for_remote_job(self, owner, job: dict):
+        # Legacy synchronous check forwarded to another worker: wait for its job to finish
+        deadline = time.monotonic() + GC.RSS_FETCH_DEADLINE + GC.TRANSMISSION_RPC_TIMEOUT
+        while job.get("status") not in ("succeeded", "failed"):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"check still running on worker pid={owner.get('pid')} (job={job['id']})")
+            time.sleep(0.5)
+            job = self.worker_client.get_job(owner, job["id"]) or job
+        if job["status"] == "failed":
+            raise RuntimeError(job.get("error") or "check failed on the scheduling worker")
+        return job.get("result")
@@ -0,0 +1,195 @@
+"""
+Fixed-size worker pool for feed runs with a priority queue and per-feed coalescing
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+PRIORITY_MANUAL = 0
+PRIORITY_RETRY = 1
+PRIORITY_TIMER = 2
+PRIORITY_STARTUP = 3
+PRIORITY_NAMES = {PRIORITY_MANUAL: "manual", PRIORITY_RETRY: "retry", PRIORITY_TIMER: "timer", PRIORITY_STARTUP: "startup"}
+# Anything else ("manual", "manual-send", checks forwarded by another worker) was asked for by a user
+TRIGGER_PRIORITY = {"retry": PRIORITY_RETRY, "timer": PRIORITY_TIMER, "startup": PRIORITY_STARTUP}
+
+
+def trigger_priority(trigger: str) -> int:
+    return TRIGGER_PRIORITY.get(trigger, PRIORITY_MANUAL)
+
+
+def percentile(samples: list, fraction: float, digits: int = 3):
+    """Nearest-rank percentile of samples (fraction in 0..1), rounded; None when there are none."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(int(len(ordered) * fraction), len(ordered) - 1)], digits)
+
+
+class RunPool:
+    """
+    At most `workers` tasks run at once; the rest wait in a priority queue (lowest value first,
+    FIFO within a priority).
+
+    A key is queued at most once: submitting a key that is still waiting only raises its
+    priority. Worker threads start on the first submit.
+    """
+
+    def __init__(self, workers: int, name: str = "rss-run", wait_samples: int = 512, clock=time.monotonic):
+        self.workers = max(int(workers), 1)
+        self.name = name
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._heap = []  # (priority, seq, key); entries whose priority no longer matches are stale
+        self._queued = {}  # key -> {"priority", "seq", "task", "enqueued_at"}
+        self._seq = itertools.count()
+        self._names = itertools.count(1)
+        self._threads = []
+        self._running = {}  # thread ident -> key of the task it is running
+        self._abandoned = set()  # idents of workers replaced while stuck; they exit when their task returns
+        self._closed = False
+        self._busy = 0
+        self._waits = deque(maxlen=wait_samples)
+        self.submitted = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.errors = 0
+
+    def submit(self, key, priority: int, task) -> bool:
+        """Queue task() under key; returns False when key was already queued (and is left there)."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("run pool is shut down")
+            entry = self._queued.get(key)
+            if entry is not None:
+                self.coalesced += 1
+                if priority < entry["priority"]:
+                    # Keep the original sequence number: it goes ahead of later arrivals at its new priority
+                    entry["priority"] = priority
+                    heapq.heappush(self._heap, (priority, entry["seq"], key))
+                    self._cond.notify()
+                return False
+            entry = {"priority": priority, "seq": next(self._seq), "task": task, "enqueued_at": self._clock()}
+            self._queued[key] = entry
+            heapq.heappush(self._heap, (priority, entry["seq"], key))
+            self.submitted += 1
+            self._start_workers()
+            self._cond.notify()
+            return True
+
+    def discard(self, key) -> bool:
+        """Drop a queued (not yet running) task."""
+        with self._cond:
+            return self._queued.pop(key, None) is not None
+
+    def is_queued(self, key) -> bool:
+        with self._cond:
+            return key in self._queued
+
+    def _start_workers(self):
+        while len(self._threads) - len(self._abandoned) < self.workers:
+            thread = threading.Thread(target=self._work, daemon=True, name=f"{self.name}-{next(self._names)}")
+            self._threads.append(thread)
+            thread.start()
+
+    def abandon(self, key) -> bool:
+        """
+        Give up on the running task for key (it is stuck and cannot be interrupted): a replacement
+        worker starts now so the pool keeps its capacity, and the stuck worker exits once it returns.
+        """
+        with self._cond:
+            # A key can have several workers stuck on it (each eviction lets a new run start); take one not yet abandoned
+            ident = next(
+                (ident for ident, running in self._running.items() if running == key and ident not in self._abandoned), None
+            )
+            if ident is None or self._closed:
+                return False
+            self._abandoned.add(ident)
+            self._busy -= 1
+            self._start_workers()
+            return True
+
+    def _next_task(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                while self._heap:
+                    priority, seq, key = heapq.heappop(self._heap)
+                    entry = self._queued.get(key)
+                    if entry is None or entry["seq"] != seq or entry["priority"] != priority:
+                        continue
+                    del self._queued[key]
+                    self._busy += 1
+                    self._running[threading.get_ident()] = key
+                    self._waits.append(self._clock() - entry["enqueued_at"])
+                    return entry["task"]
+                self._cond.wait()
+
+    def _work(self):
+        ident = threading.get_ident()
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            failed = False
+            try:
+                task()
+            except Exception:
+                # Tasks report their own errors; a raising task must not shrink the pool
+                failed = True
+            with self._cond:
+                self._running.pop(ident, None)
+                self.completed += 1
+                self.errors += failed
+                if ident in self._abandoned:
+                    # Replaced while stuck; its replacement is already taking work
+                    self._abandoned.discard(ident)
+                    self._threads = [thread for thread in self._threads if thread.ident != ident]
+                    return
+                self._busy -= 1
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = self._clock()
+            by_priority = {name: 0 for name in PRIORITY_NAMES.values()}
+            for entry in self._queued.values():
+                by_priority[PRIORITY_NAMES.get(entry["priority"], str(entry["priority"]))] += 1
+            oldest = min((entry["enqueued_at"] for entry in self._queued.values()), default=None)
+            waits = list(self._waits)
+            return {
+                "workers": self.workers,
+                "busy": self._busy,
+                "abandoned": len(self._abandoned),
+                "queued": len(self._queued),
+                "queuedByPriority": by_priority,
+                "oldestQueuedSeconds": round(now - oldest, 3) if oldest is not None else None,
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "completed": self.completed,
+                "errors": self.errors,
+                "waitSeconds": {
+                    "p50": percentile(waits, 0.5),
+                    "p95": percentile(waits, 0.95),
+                    "max": round(max(waits), 3) if waits else None,
+                },
+            }
+
+    def shutdown(self):
+        """Stop the workers after their current task; queued tasks are dropped."""
+        with self._cond:
+            self._closed = True
+            self._queued.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+
+    def join(self, timeout: float) -> bool:
+        """Wait (after shutdown) for running tasks to return; False when some are still running at the timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        return not any(thread.is_alive() for thread in threads)
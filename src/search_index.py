@@ -0,0 +1,272 @@
+"""
+Inverted index over the per-feed torrent caches ({rss_id}_torrents_list.json)
+"""
+import bisect
+import json
+import os
+import re
+import threading
+import time
+
+CACHE_SUFFIX = "_torrents_list.json"
+INDEX_VERSION = 1
+
+# Latin words/numbers are tokens; CJK titles have no spaces, so each ideograph/kana/hangul is a token
+_TOKEN_RE = re.compile(r"[0-9a-z]+|[぀-ヿ㐀-䶿一-鿿가-힯]")
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+class SearchIndex:
+    """
+    token -> doc ids, with one doc per (feed, title, link) cache entry.
+
+    Queries use the feed keyword syntax: words in a group must all appear, groups are
+    separated by ";". Latin query words match token prefixes ("1080" finds "1080p") and
+    every hit is re-checked as a substring of the title.
+    """
+
+    def __init__(self, storage_dir: str, index_path: str, flush_seconds: float, refresh_seconds: float):
+        self.storage_dir = storage_dir
+        self.index_path = index_path
+        self.flush_seconds = flush_seconds
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._feeds = {}  # feed id -> {"mtime": float, "docs": [doc ids]}
+        self._docs = {}  # doc id -> (feed id, title, link)
+        self._postings = {}  # token -> set of doc ids
+        self._sorted_tokens = None
+        self._next_id = 1
+        self._dirty = False
+        self._flush_timer = None
+        self._refreshed_at = 0.0
+
+    # ---------------------
+    # Index maintenance
+    # ---------------------
+    def _add_doc(self, feed_id: str, title: str, link: str):
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = (feed_id, title, link)
+        self._feeds.setdefault(feed_id, {"mtime": 0.0, "docs": []})["docs"].append(doc_id)
+        for token in set(tokenize(title)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                self._sorted_tokens = None
+            postings.add(doc_id)
+
+    def _remove_doc(self, doc_id: int):
+        _, title, _ = self._docs.pop(doc_id)
+        for token in set(tokenize(title)):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+                self._sorted_tokens = None
+
+    def _remove_feed(self, feed_id: str):
+        feed = self._feeds.pop(feed_id, None)
+        if not feed:
+            return
+        for doc_id in feed["docs"]:
+            self._remove_doc(doc_id)
+
+    def _cache_path(self, feed_id: str) -> str:
+        return os.path.join(self.storage_dir, f"{feed_id}{CACHE_SUFFIX}")
+
+    def _index_cache_file(self, feed_id: str, mtime: float):
+        try:
+            with open(self._cache_path(feed_id), "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            entries = {}
+        entries = entries if isinstance(entries, dict) else {}
+        # Titles already indexed keep their doc id, so re-reading a changed file does not move
+        # old entries ahead of newer ones in the results
+        feed = self._feeds.setdefault(feed_id, {"mtime": mtime, "docs": []})
+        kept = []
+        for doc_id in feed["docs"]:
+            title = self._docs[doc_id][1]
+            if title in entries:
+                self._docs[doc_id] = (feed_id, title, entries[title])
+                kept.append(doc_id)
+            else:
+                self._remove_doc(doc_id)
+        feed["docs"] = kept
+        known = {self._docs[doc_id][1] for doc_id in kept}
+        for title, link in entries.items():
+            if title not in known:
+                self._add_doc(feed_id, title, link)
+        feed["mtime"] = mtime
+
+    def add_entries(self, feed_id: str, entries: dict):
+        """Index entries a run just appended to a feed's cache file."""
+        with self._lock:
+            self._ensure_loaded()
+            known = {self._docs[doc_id][1] for doc_id in self._feeds.get(feed_id, {}).get("docs", [])}
+            for title, link in entries.items():
+                if title not in known:
+                    self._add_doc(feed_id, title, link)
+            try:
+                mtime = os.path.getmtime(self._cache_path(feed_id))
+            except OSError:
+                mtime = 0.0
+            self._feeds.setdefault(feed_id, {"mtime": mtime, "docs": []})["mtime"] = mtime
+            self._mark_dirty()
+
+    def remove_feed(self, feed_id: str):
+        with self._lock:
+            self._ensure_loaded()
+            self._remove_feed(feed_id)
+            self._mark_dirty()
+
+    def refresh(self, force: bool = False):
+        """Re-index cache files changed outside this process (other workers, manual edits)."""
+        with self._lock:
+            self._ensure_loaded()
+            if not force and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+                return
+            self._refreshed_at = time.monotonic()
+            on_disk = {}
+            try:
+                names = os.listdir(self.storage_dir)
+            except OSError:
+                names = []
+            for name in names:
+                if name.endswith(CACHE_SUFFIX):
+                    feed_id = name[: -len(CACHE_SUFFIX)]
+                    try:
+                        on_disk[feed_id] = os.path.getmtime(os.path.join(self.storage_dir, name))
+                    except OSError:
+                        continue
+            changed = False
+            for feed_id in [feed_id for feed_id in self._feeds if feed_id not in on_disk]:
+                self._remove_feed(feed_id)
+                changed = True
+            for feed_id, mtime in on_disk.items():
+                if self._feeds.get(feed_id, {}).get("mtime") != mtime:
+                    self._index_cache_file(feed_id, mtime)
+                    changed = True
+            if changed:
+                self._mark_dirty()
+
+    # ---------------------
+    # Persistence
+    # ---------------------
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        for doc_id, (feed_id, title, link) in data.get("docs", {}).items():
+            doc_id = int(doc_id)
+            self._docs[doc_id] = (feed_id, title, link)
+            self._feeds.setdefault(feed_id, {"mtime": 0.0, "docs": []})["docs"].append(doc_id)
+        for feed_id, meta in data.get("feeds", {}).items():
+            self._feeds.setdefault(feed_id, {"mtime": 0.0, "docs": []})["mtime"] = meta.get("mtime", 0.0)
+        self._postings = {token: set(doc_ids) for token, doc_ids in data.get("postings", {}).items()}
+        self._next_id = max(self._docs, default=0) + 1
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._flush_timer is None:
+            # Batch writes: runs add a handful of entries each, the file holds every feed
+            self._flush_timer = threading.Timer(self.flush_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return
+            payload = {
+                "version": INDEX_VERSION,
+                "feeds": {feed_id: {"mtime": feed["mtime"]} for feed_id, feed in self._feeds.items()},
+                "docs": {str(doc_id): list(doc) for doc_id, doc in self._docs.items()},
+                "postings": {token: sorted(doc_ids) for token, doc_ids in self._postings.items()},
+            }
+            self._dirty = False
+        tmp_path = f"{self.index_path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        with self._lock:
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+
+    # ---------------------
+    # Queries
+    # ---------------------
+    def _docs_for_token(self, token: str) -> set:
+        if not token.isascii():
+            return set(self._postings.get(token, ()))
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        docs = set()
+        start = bisect.bisect_left(self._sorted_tokens, token)
+        for candidate in self._sorted_tokens[start:]:
+            if not candidate.startswith(token):
+                break
+            docs |= self._postings[candidate]
+        return docs
+
+    def _match_group(self, words: list) -> set:
+        tokens = [token for word in words for token in tokenize(word)]
+        if not tokens:
+            return set()
+        # Smallest posting list first keeps the intersection cheap
+        candidate_sets = sorted((self._docs_for_token(token) for token in set(tokens)), key=len)
+        docs = candidate_sets[0]
+        for other in candidate_sets[1:]:
+            docs = docs & other
+            if not docs:
+                break
+        return {doc_id for doc_id in docs if all(word in self._docs[doc_id][1].lower() for word in words)}
+
+    def search(self, query: str, feed_ids: set | None = None, limit: int = 50):
+        """Return (total, hits) with the most recently indexed entries first; feed_ids restricts the feeds searched."""
+        with self._lock:
+            self.refresh()
+            matched = set()
+            for group in (query or "").split(";"):
+                words = [word.lower() for word in group.split() if word]
+                if words:
+                    matched |= self._match_group(words)
+            if feed_ids is not None:
+                matched = {doc_id for doc_id in matched if self._docs[doc_id][0] in feed_ids}
+            ordered = sorted(matched, reverse=True)
+            hits = [
+                {"feedId": self._docs[doc_id][0], "title": self._docs[doc_id][1], "link": self._docs[doc_id][2]}
+                for doc_id in ordered[:limit]
+            ]
+            return len(ordered), hits
+
+    def lookup(self, feed_id: str, title: str):
+        with self._lock:
+            self._ensure_loaded()
+            for doc_id in self._feeds.get(feed_id, {}).get("docs", []):
+                if self._docs[doc_id][1] == title:
+                    return self._docs[doc_id][2]
+            return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_loaded()
+            return {"feeds": len(self._feeds), "entries": len(self._docs), "tokens": len(self._postings)}
@@ -0,0 +1,53 @@
+"""
+Members kept ordered by a sort key, so feed list pages are read without sorting every feed
+"""
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedIndex:
+    """
+    (key, member) pairs in a bisect-maintained list; ties order by member id.
+
+    Updates cost a binary search plus a list insert/delete. A page starts with a binary search
+    for the cursor and then walks only the rows it returns (and the ones a filter skips).
+    Not thread-safe: the owner serializes access.
+    """
+
+    def __init__(self):
+        self._entries = []  # sorted (key, member)
+        self._keys = {}  # member -> key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, member) -> bool:
+        return member in self._keys
+
+    def set(self, member, key):
+        if member in self._keys:
+            if self._keys[member] == key:
+                return
+            self.discard(member)
+        insort(self._entries, (key, member))
+        self._keys[member] = key
+
+    def discard(self, member):
+        if member not in self._keys:
+            return
+        entry = (self._keys.pop(member), member)
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def clear(self):
+        self._entries.clear()
+        self._keys.clear()
+
+    def iter_after(self, after=None, descending: bool = False):
+        """Yield (key, member) in order, starting strictly after the (key, member) pair `after`."""
+        if descending:
+            end = bisect_left(self._entries, after) if after is not None else len(self._entries)
+            for index in range(end - 1, -1, -1):
+                yield self._entries[index]
+        else:
+            start = bisect_right(self._entries, after) if after is not None else 0
+            for index in range(start, len(self._entries)):
+                yield self._entries[index]
@@ -0,0 +1,215 @@
+"""
+Downloaded .torrent files cached on disk by infohash, with LRU size eviction
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from src.cluster import file_lock
+
+INDEX_FILE = "index.json"
+INDEX_LOCK_FILE = "index.json.lock"
+TORRENT_SUFFIX = ".torrent"
+
+
+def _read_string(data: bytes, index: int):
+    """(end offset, bytes) of the bencoded string starting at index."""
+    colon = data.find(b":", index)
+    if colon < 0 or not data[index:colon].isdigit():
+        raise ValueError(f"invalid bencode string at offset {index}")
+    end = colon + 1 + int(data[index:colon])
+    if end > len(data):
+        raise ValueError("truncated bencode string")
+    return end, data[colon + 1:end]
+
+
+def _skip_value(data: bytes, index: int) -> int:
+    """End offset of the bencoded value starting at index (iterative, so nesting depth is not an issue)."""
+    depth = 0
+    while True:
+        token = data[index:index + 1]
+        if not token:
+            raise ValueError("truncated bencode")
+        if token in (b"d", b"l"):
+            depth += 1
+            index += 1
+            continue
+        if token == b"e":
+            if depth == 0:
+                raise ValueError(f"unexpected end marker at offset {index}")
+            depth -= 1
+            index += 1
+        elif token == b"i":
+            end = data.find(b"e", index)
+            if end < 0:
+                raise ValueError("truncated bencode integer")
+            int(data[index + 1:end])
+            index = end + 1
+        else:
+            index = _read_string(data, index)[0]
+        if depth == 0:
+            return index
+
+
+def metainfo_infohash(data: bytes) -> str:
+    """v1 infohash (SHA-1 of the raw bencoded info dictionary) of a .torrent file; ValueError when it is not one."""
+    if data[:1] != b"d":
+        raise ValueError("not a bencoded dictionary")
+    index = 1
+    while data[index:index + 1] != b"e":
+        key_end, key = _read_string(data, index)
+        value_end = _skip_value(data, key_end)
+        if key == b"info":
+            if data[key_end:key_end + 1] != b"d":
+                raise ValueError("metainfo info is not a dictionary")
+            return hashlib.sha1(data[key_end:value_end]).hexdigest()
+        index = value_end
+    raise ValueError("metainfo has no info dictionary")
+
+
+def _url_key(url: str) -> str:
+    # Torrent URLs usually carry a passkey; only their hash is written to disk
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class TorrentFileCache:
+    """
+    <cache_dir>/<hash[:2]>/<infohash>.torrent plus index.json mapping sha256(url) -> infohash.
+
+    A file is stored once however many URLs point at it. Reads refresh the file's mtime, which
+    orders the LRU across restarts; once the files exceed max_bytes the least recently used are
+    removed (with their URL entries).
+
+    Several workers can share one cache directory: writes re-read the files and index.json under
+    an inter-process lock, so size accounting and eviction cover every worker's files and no
+    worker drops URL entries another one added.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._urls = {}  # sha256(url) -> infohash
+        self._files = OrderedDict()  # infohash -> size, least recently used first
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, infohash: str) -> str:
+        return os.path.join(self.cache_dir, infohash[:2], f"{infohash}{TORRENT_SUFFIX}")
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        self._scan()
+
+    def _scan(self):
+        """Rebuild files, sizes and URL entries from disk (which other workers write to as well)."""
+        found = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith(TORRENT_SUFFIX):
+                    try:
+                        stat = os.stat(os.path.join(root, name))
+                    except FileNotFoundError:
+                        # Evicted by another worker while we were listing
+                        continue
+                    found.append((stat.st_mtime, name[:-len(TORRENT_SUFFIX)], stat.st_size))
+        self._files = OrderedDict((infohash, size) for _, infohash, size in sorted(found))
+        self._bytes = sum(self._files.values())
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+                urls = json.load(f)
+        except (OSError, ValueError):
+            urls = {}
+        if not isinstance(urls, dict):
+            urls = {}
+        self._urls = {key: infohash for key, infohash in urls.items() if infohash in self._files}
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._urls, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, INDEX_FILE))
+
+    def get(self, url: str):
+        """(infohash, metainfo bytes) for a URL downloaded before, else None."""
+        with self._lock:
+            self._load()
+            infohash = self._urls.get(_url_key(url))
+            data = None
+            if infohash is not None:
+                try:
+                    with open(self._path(infohash), "rb") as f:
+                        data = f.read()
+                    os.utime(self._path(infohash))
+                    self._files.move_to_end(infohash)
+                except OSError:
+                    # Removed behind our back; the next download stores it again
+                    self._forget(infohash)
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return infohash, data
+
+    def put(self, url: str, data: bytes) -> str:
+        """Store a downloaded .torrent file under its infohash; ValueError when data is not metainfo."""
+        infohash = metainfo_infohash(data)
+        with self._lock:
+            self._loaded = True
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with file_lock(os.path.join(self.cache_dir, INDEX_LOCK_FILE)):
+                self._scan()
+                path = self._path(infohash)
+                if infohash not in self._files:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+                    self._files[infohash] = len(data)
+                    self._bytes += len(data)
+                else:
+                    os.utime(path)
+                    self._files.move_to_end(infohash)
+                self._urls[_url_key(url)] = infohash
+                self._evict(keep=infohash)
+                self._save_index()
+        return infohash
+
+    def _evict(self, keep: str):
+        while self._bytes > self.max_bytes and len(self._files) > 1:
+            infohash = next(iter(self._files))
+            if infohash == keep:
+                break
+            try:
+                os.remove(self._path(infohash))
+            except FileNotFoundError:
+                pass
+            self._forget(infohash)
+            self.evictions += 1
+
+    def _forget(self, infohash: str):
+        self._bytes -= self._files.pop(infohash, 0)
+        self._urls = {key: value for key, value in self._urls.items() if value != infohash}
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._load()
+            return {
+                "files": len(self._files),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "urls": len(self._urls),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
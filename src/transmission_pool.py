@@ -0,0 +1,125 @@
+"""
+Transmission endpoints from settings, ordered for placement by queue length and free space
+"""
+import threading
+import time
+
+DEFAULT_ENDPOINT_ID = "default"
+
+
+def configured_endpoints(settings: dict, default_port: int) -> list:
+    """
+    The delivery pool: transmission_url/port (id "default") followed by the enabled
+    settings.transmission_endpoints, each as {"id", "url", "port", "username", "password", "name"}.
+    """
+    endpoints = []
+    if settings.get("transmission_url"):
+        endpoints.append({
+            "id": DEFAULT_ENDPOINT_ID,
+            "url": settings["transmission_url"],
+            "port": settings.get("transmission_port", default_port),
+            "username": settings.get("username", ""),
+            "password": settings.get("password", ""),
+        })
+    for raw in settings.get("transmission_endpoints") or []:
+        if not isinstance(raw, dict) or not raw.get("url") or not raw.get("enabled", True):
+            continue
+        endpoints.append({
+            "id": str(raw.get("id") or f"{raw['url']}:{raw.get('port', default_port)}"),
+            "url": raw["url"],
+            "port": raw.get("port", default_port),
+            "username": raw.get("username", ""),
+            "password": raw.get("password", ""),
+        })
+    for endpoint in endpoints:
+        # Also the breaker and torrent-snapshot key, unchanged from the single-endpoint setup
+        endpoint["name"] = f"transmission:{endpoint['url']}:{endpoint['port']}"
+    return endpoints
+
+
+class TransmissionPool:
+    """
+    Placement across Transmission endpoints.
+
+    order() puts a feed's pinned endpoint first and ranks the others by their last load sample:
+    endpoints with less than min_free_bytes free go last, then fewer active torrents, then more
+    free space. Samples come from probe(endpoint) (session-stats + free-space) at most every
+    ttl seconds per endpoint; torrents added through this process count towards the active
+    total right away, so a burst of runs spreads out before the next sample.
+    """
+
+    def __init__(self, ttl: float, min_free_bytes: int, clock=time.monotonic):
+        self.ttl = ttl
+        self.min_free_bytes = min_free_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load = {}  # endpoint name -> {"sampled_at", "active", "torrents", "free_bytes", "added", "error"}
+
+    def order(self, endpoints: list, affinity: str | None = None, probe=None) -> list:
+        """Endpoints to try, best first; probe(endpoint) -> load dict refreshes stale samples."""
+        pinned = [endpoint for endpoint in endpoints if endpoint["id"] == affinity]
+        rest = [endpoint for endpoint in endpoints if endpoint["id"] != affinity]
+        if probe is not None and len(rest) > 1:
+            for endpoint in rest:
+                if self._claim_sample(endpoint["name"]):
+                    self._sample(endpoint, probe)
+        with self._lock:
+            rest.sort(key=lambda endpoint: self._rank(endpoint["name"]))
+        return pinned + rest
+
+    def _claim_sample(self, name: str) -> bool:
+        # Mark the sample as taken before probing, so concurrent runs do not all probe the same endpoint
+        with self._lock:
+            load = self._load.get(name)
+            if load is not None and self._clock() - load["sampled_at"] < self.ttl:
+                return False
+            self._load[name] = {**(load or {"active": None, "torrents": None, "free_bytes": None, "error": None}),
+                                "sampled_at": self._clock(), "added": 0}
+            return True
+
+    def _sample(self, endpoint: dict, probe):
+        try:
+            sample, error = probe(endpoint), None
+        except Exception as e:
+            sample, error = None, str(e) or e.__class__.__name__
+        with self._lock:
+            load = self._load[endpoint["name"]]
+            if sample is None:
+                load.update(active=None, torrents=None, free_bytes=None, error=error or "unavailable")
+            else:
+                load.update(active=sample.get("active"), torrents=sample.get("torrents"), free_bytes=sample.get("free_bytes"), error=None)
+
+    def _rank(self, name: str) -> tuple:
+        load = self._load.get(name)
+        if load is None or load["active"] is None:
+            # Never sampled or probe failed: after every endpoint known to be healthy
+            return (2 if load is not None and load["error"] else 1, 0, 0)
+        free = load["free_bytes"]
+        low_disk = free is not None and free < self.min_free_bytes
+        return (3 if low_disk else 0, load["active"] + load["added"], -(free or 0))
+
+    def record_added(self, name: str):
+        with self._lock:
+            load = self._load.get(name)
+            if load is not None:
+                load["added"] += 1
+
+    def stats(self, endpoints: list) -> list:
+        with self._lock:
+            now = self._clock()
+            result = []
+            for endpoint in endpoints:
+                load = self._load.get(endpoint["name"])
+                result.append({
+                    "id": endpoint["id"],
+                    "url": endpoint["url"],
+                    "port": endpoint["port"],
+                    "activeTorrents": load["active"] if load else None,
+                    "addedSinceSample": load["added"] if load else 0,
+                    "torrents": load["torrents"] if load else None,
+                    "freeBytes": load["free_bytes"] if load else None,
+                    "lowDisk": bool(load and load["free_bytes"] is not None and load["free_bytes"] < self.min_free_bytes),
+                    "sampleAgeSeconds": round(now - load["sampled_at"], 1) if load else None,
+                    "error": load["error"] if load else None,
+                })
+            return result
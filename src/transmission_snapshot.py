@@ -0,0 +1,107 @@
+"""
+Cached view of the torrents a Transmission daemon already holds, keyed by infohash
+"""
+import base64
+import binascii
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+SNAPSHOT_FIELDS = ["hashString", "name", "status"]
+# Entry fields some trackers/indexers use for the infohash (feedparser flattens namespaced tags)
+INFOHASH_FIELDS = ("infohash", "info_hash", "torrent_infohash", "nyaa_infohash")
+
+
+def normalize_infohash(value):
+    """40-char lowercase hex for a v1 infohash given as hex or base32, else None."""
+    value = (value or "").strip()
+    if len(value) == 40:
+        try:
+            int(value, 16)
+        except ValueError:
+            return None
+        return value.lower()
+    if len(value) == 32:
+        try:
+            return binascii.hexlify(base64.b32decode(value.upper())).decode("ascii")
+        except (binascii.Error, ValueError):
+            return None
+    return None
+
+
+def link_infohash(link: str):
+    """Infohash carried by a magnet link (xt=urn:btih:...); .torrent URLs do not expose one."""
+    if not link or not link.lower().startswith("magnet:"):
+        return None
+    for xt in parse_qs(urlsplit(link).query).get("xt", []):
+        if xt.lower().startswith("urn:btih:"):
+            return normalize_infohash(xt[len("urn:btih:"):])
+    return None
+
+
+def entry_infohash(entry):
+    getter = getattr(entry, "get", None)
+    for field in INFOHASH_FIELDS:
+        value = getter(field) if getter is not None else getattr(entry, field, None)
+        infohash = normalize_infohash(value) if isinstance(value, str) else None
+        if infohash:
+            return infohash
+    return None
+
+
+class TorrentSnapshot:
+    """
+    One torrent-get (hash, name, status) per endpoint every ttl seconds, shared by all runs.
+
+    Torrents added through this process are recorded immediately, so later links in the same
+    window are skipped without waiting for the next refresh.
+    """
+
+    def __init__(self, ttl: float, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._endpoints = {}  # endpoint -> {"fetched_at": float, "torrents": {hash: {"name", "status"}}}
+
+    def _fresh(self, endpoint: str):
+        state = self._endpoints.get(endpoint)
+        if state is not None and self._clock() - state["fetched_at"] < self.ttl:
+            return state
+        return None
+
+    def torrents(self, client, endpoint: str) -> dict:
+        """Return hash -> {"name", "status"}; refreshes with a single torrent-get when stale."""
+        with self._lock:
+            state = self._fresh(endpoint)
+            if state is not None:
+                return state["torrents"]
+        # The RPC runs outside the lock; concurrent refreshes are harmless and rare
+        fetched = {}
+        for torrent in client.get_torrents(arguments=SNAPSHOT_FIELDS):
+            infohash = normalize_infohash(getattr(torrent, "hashString", ""))
+            if infohash:
+                fetched[infohash] = {"name": getattr(torrent, "name", ""), "status": str(getattr(torrent, "status", ""))}
+        with self._lock:
+            self._endpoints[endpoint] = {"fetched_at": self._clock(), "torrents": fetched}
+        return fetched
+
+    def record_added(self, endpoint: str, infohash, name: str = ""):
+        infohash = normalize_infohash(infohash)
+        if not infohash:
+            return
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is not None:
+                state["torrents"].setdefault(infohash, {"name": name, "status": "added"})
+
+    def invalidate(self, endpoint: str):
+        with self._lock:
+            self._endpoints.pop(endpoint, None)
+
+    def stats(self) -> list:
+        with self._lock:
+            now = self._clock()
+            return [
+                {"endpoint": endpoint, "torrents": len(state["torrents"]), "ageSeconds": round(now - state["fetched_at"], 1)}
+                for endpoint, state in sorted(self._endpoints.items())
+            ]
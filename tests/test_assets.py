@@ -0,0 +1,70 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from starlette.requests import Request
+
+from src.api import assets
+from src.api.assets import IMMUTABLE, REVALIDATE, FileAsset, StaticAsset, asset_response
+from src.api.constants import constants_asset, constants_js
+
+
+def _request(query: str = "", **headers) -> Request:
+    raw = [(name.replace("_", "-").encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": query.encode("ascii"), "headers": raw})
+
+
+class StaticAssetTests(unittest.TestCase):
+    def setUp(self):
+        self.body = ("<html>" + "feed " * 2000 + "</html>").encode("utf-8")
+        self.asset = StaticAsset(self.body, "text/html")
+
+    def test_negotiates_the_smallest_accepted_encoding(self):
+        gzipped = asset_response(_request(accept_encoding="gzip, deflate"), self.asset, REVALIDATE)
+        self.assertEqual(gzipped.headers["content-encoding"], "gzip")
+        self.assertEqual(gzip.decompress(gzipped.body), self.body)
+        self.assertEqual(gzipped.headers["vary"], "Accept-Encoding")
+
+        plain = asset_response(_request(accept_encoding="gzip;q=0"), self.asset, REVALIDATE)
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(plain.body, self.body)
+
+        if assets.brotli is not None:
+            self.assertEqual(asset_response(_request(accept_encoding="gzip, br"), self.asset, REVALIDATE).headers["content-encoding"], "br")
+
+    def test_conditional_requests_get_304_for_any_variant_tag(self):
+        first = asset_response(_request(accept_encoding="gzip"), self.asset, REVALIDATE)
+
+        again = asset_response(_request(accept_encoding="identity", if_none_match=first.headers["etag"]), self.asset, REVALIDATE)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.body, b"")
+        changed = asset_response(_request(if_none_match='"0000"'), self.asset, REVALIDATE)
+        self.assertEqual(changed.status_code, 200)
+
+    def test_file_asset_rebuilds_only_when_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "index.html"
+            path.write_bytes(b'<script src="/api/constants.js"></script>')
+            file_asset = FileAsset(str(path), "text/html", transform=lambda body: body.replace(b".js", b".js?v=1"))
+
+            first = file_asset.get()
+            self.assertIs(file_asset.get(), first)
+            self.assertIn(b"constants.js?v=1", first.variants["identity"])
+
+            path.write_bytes(b"<p>edited page</p>")
+            self.assertNotEqual(file_asset.get().version, first.version)
+            path.unlink()
+            self.assertIsNone(file_asset.get())
+
+    def test_constants_are_built_once_and_versioned_url_is_immutable(self):
+        asset = constants_asset()
+        self.assertIs(constants_asset(), asset)
+        self.assertTrue(asset.variants["identity"].startswith(b"window.GENERAL_CONSTANTS = "))
+
+        self.assertEqual(constants_js(_request(f"v={asset.version}")).headers["cache-control"], IMMUTABLE)
+        self.assertEqual(constants_js(_request("v=stale")).headers["cache-control"], REVALIDATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
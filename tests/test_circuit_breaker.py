@@ -0,0 +1,76 @@
+import unittest
+
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, BreakerRegistry, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker("host:tracker.example", failure_threshold=3, reset_seconds=60, clock=self.clock)
+
+    def test_opens_after_threshold_and_refuses_calls(self):
+        for _ in range(2):
+            self.breaker.record_failure("timeout")
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        self.breaker.record_failure("timeout")
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_in(), 60)
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.failures, 1)
+
+    def test_half_open_allows_one_probe_and_closes_on_success(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 61
+
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens_immediately(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 61
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure("still down")
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.snapshot()["lastError"], "still down")
+
+
+class BreakerRegistryTests(unittest.TestCase):
+    def test_breakers_are_created_once_per_name(self):
+        registry = BreakerRegistry(failure_threshold=2, reset_seconds=30)
+
+        self.assertIs(registry.get("host:a"), registry.get("host:a"))
+        self.assertIsNone(registry.peek("host:b"))
+        registry.get("transmission:nas:9091").record_failure()
+        self.assertEqual([row["name"] for row in registry.snapshot()], ["host:a", "transmission:nas:9091"])
+
+
+if __name__ == "__main__":
+    unittest.main()
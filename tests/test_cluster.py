@@ -0,0 +1,226 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import src.general.general_constant as GC
+from src.cluster import HashRing, LeaderElection, WorkerUnavailableError
+from src.general.general_class import RSSItem
+from src.rss_manager import RSSManager
+
+
+class LeaderElectionTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.lock_path = str(Path(self.temp_dir.name) / "scheduler.lock")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_one_candidate_wins_and_leadership_moves_on_release(self):
+        elected = []
+        first = LeaderElection(self.lock_path, lambda: elected.append("first"), retry_seconds=0.05)
+        second = LeaderElection(self.lock_path, lambda: elected.append("second"), retry_seconds=0.05)
+
+        first.start()
+        first.advertise({"pid": 1, "address": "http://127.0.0.1:1"})
+        second.start()
+        self.assertTrue(first.is_leader)
+        self.assertFalse(second.is_leader)
+        self.assertEqual(second.leader_info()["address"], "http://127.0.0.1:1")
+
+        first.stop()
+        second._thread.join(timeout=2)
+
+        self.assertTrue(second.is_leader)
+        self.assertEqual(elected, ["first", "second"])
+        second.stop()
+
+
+class SharedStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        storage_dir = Path(self.temp_dir.name) / "storage"
+        self.gc_patches = [
+            patch.object(GC, "STORAGE_DIR", str(storage_dir)),
+            patch.object(GC, "LOG_DIR", str(storage_dir / "logs")),
+            patch.object(GC, "STORAGE_PATH", str(storage_dir / "storage.json")),
+        ]
+        for gc_patch in self.gc_patches:
+            gc_patch.start()
+        # Two managers on one storage directory stand in for two uvicorn workers
+        with patch.object(RSSManager, "start_all"), patch.object(RSSManager, "_storage_sync_loop"):
+            self.leader = RSSManager()
+            self.leader.start_cluster(GC.CLUSTER_MODE_LEADER)
+            self.follower = RSSManager()
+            self.follower.start_cluster(GC.CLUSTER_MODE_LEADER)
+
+    def tearDown(self):
+        self.leader.stop_cluster()
+        self.follower.stop_cluster()
+        for gc_patch in reversed(self.gc_patches):
+            gc_patch.stop()
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _item(rss_id: str) -> RSSItem:
+        return RSSItem(id=rss_id, name=rss_id, url=f"https://example.com/{rss_id}", path="", pt_site=GC.DEFAULT_PT_SITE, interval=10)
+
+    def test_writes_from_both_workers_are_merged(self):
+        self.assertTrue(self.leader.owns_feed("from-leader"))
+        self.assertFalse(self.follower.owns_feed("from-leader"))
+
+        with patch.object(self.leader, "_schedule_next_run"):
+            self.follower.add_rss(self._item("from-follower"))
+            self.leader.add_rss(self._item("from-leader"))
+        self.follower.refresh_storage()
+
+        self.assertEqual(set(self.follower.list_rss()), {"from-follower", "from-leader"})
+        self.assertEqual(self.follower.tasks, {})
+
+    def test_feed_versions_are_shared_between_workers(self):
+        # No runs: their status writes would move the versions while the test compares them
+        with patch.object(self.leader, "_schedule_next_run"), patch.object(self.leader, "_start_check_thread"):
+            self.follower.add_rss(self._item("feed-1"))
+            self.leader.refresh_storage()
+            baseline = self.follower.storage_version
+            self.assertEqual(self.leader.storage_version, baseline)
+
+            # Both workers change a feed before either has read the other's write
+            self.leader.add_rss(self._item("feed-2"))
+            self.follower.add_rss(self._item("feed-3"))
+            self.follower.delete_rss("feed-1")
+            self.leader.refresh_storage()
+
+        self.assertEqual(self.leader.storage_version, self.follower.storage_version)
+        # A version issued by one worker reads the same delta on the other
+        for worker in (self.leader, self.follower):
+            version, full, changed, deleted = worker.feed_changes_since(baseline)
+            self.assertFalse(full)
+            self.assertEqual(sorted(changed), ["feed-2", "feed-3"])
+            self.assertEqual(deleted, ["feed-1"])
+            self.assertEqual(worker.feed_changes_since(version)[2:], ({}, []))
+        self.assertNotEqual(self.leader.feed_versions["feed-2"], self.leader.feed_versions["feed-3"])
+
+    def test_events_are_shared_between_workers(self):
+        cursor = self.leader.events.last_id
+        self.assertEqual(self.follower.events.last_id, cursor)
+
+        first = self.follower.events.publish("run-start", {"feedId": "feed-1"})
+        second = self.leader.events.publish("run-finish", {"feedId": "feed-1"})
+
+        self.assertEqual(second, first + 1)
+        for worker in (self.leader, self.follower):
+            worker.events.poll()
+            self.assertEqual([event["type"] for event in worker.events.events_after(cursor)[0]], ["run-start", "run-finish"])
+
+    def test_follower_forwards_checks_to_leader(self):
+        self.follower.add_rss(self._item("feed-1"))
+
+        with patch.object(self.leader, "_spawn_check_worker") as mock_spawn:
+            job = self.follower.submit_check_job("feed-1")
+
+        mock_spawn.assert_called_once()
+        self.assertEqual(job["feedId"], "feed-1")
+        self.assertEqual(self.follower.get_job(job["id"])["id"], job["id"])
+        with self.assertRaises(KeyError):
+            self.follower.submit_check_job("missing")
+
+    def test_follower_reports_unreachable_leader(self):
+        # Stale advertisement left behind by a leader that died
+        self.leader.election.advertise({"pid": -1, "address": "http://127.0.0.1:9", "token": "stale"})
+
+        with self.assertRaises(WorkerUnavailableError):
+            self.follower.submit_check_job("feed-1")
+
+
+class HashRingTests(unittest.TestCase):
+    def test_owner_is_stable_and_moves_only_keys_of_removed_member(self):
+        keys = [f"feed-{index}" for index in range(500)]
+        ring = HashRing(["a", "b", "c"], vnodes=64)
+        before = {key: ring.owner(key) for key in keys}
+
+        self.assertEqual(before, {key: HashRing(["c", "a", "b"], vnodes=64).owner(key) for key in keys})
+        self.assertEqual(set(before.values()), {"a", "b", "c"})
+
+        after = HashRing(["a", "b"], vnodes=64)
+        moved = [key for key in keys if after.owner(key) != before[key]]
+        self.assertTrue(moved)
+        self.assertTrue(all(before[key] == "c" for key in moved))
+        self.assertIsNone(HashRing([], vnodes=64).owner("feed-1"))
+
+
+class SingleWorkerTests(unittest.TestCase):
+    def test_off_mode_schedules_locally_without_shared_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_dir = Path(temp_dir) / "storage"
+            with patch.object(GC, "STORAGE_DIR", str(storage_dir)), \
+                    patch.object(GC, "LOG_DIR", str(storage_dir / "logs")), \
+                    patch.object(GC, "STORAGE_PATH", str(storage_dir / "storage.json")), \
+                    patch.object(RSSManager, "start_all") as start_all:
+                manager = RSSManager()
+                manager.start_cluster(GC.CLUSTER_MODE_OFF)
+                manager.events.publish("run", {"id": "feed-1"})
+
+                start_all.assert_called_once_with()
+                self.assertIsNone(manager.cluster_mode)
+                self.assertIsNone(manager.election)
+                self.assertIsNone(manager.rpc_server)
+                self.assertFalse((storage_dir / GC.EVENT_JOURNAL_FILE).exists())
+                self.assertTrue(manager.owns_feed("feed-1"))
+
+
+class ShardedSchedulingTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        storage_dir = Path(self.temp_dir.name) / "storage"
+        self.gc_patches = [
+            patch.object(GC, "STORAGE_DIR", str(storage_dir)),
+            patch.object(GC, "LOG_DIR", str(storage_dir / "logs")),
+            patch.object(GC, "STORAGE_PATH", str(storage_dir / "storage.json")),
+        ]
+        for gc_patch in self.gc_patches:
+            gc_patch.start()
+        self.workers = []
+        for worker_id in ("worker-a", "worker-b"):
+            with patch.object(RSSManager, "_storage_sync_loop"), patch.object(RSSManager, "_shard_heartbeat_loop"):
+                worker = RSSManager()
+                worker.worker_id = worker_id
+                worker.start_cluster(GC.CLUSTER_MODE_SHARDED)
+            self.workers.append(worker)
+        for worker in self.workers:
+            worker._shard_heartbeat()
+
+    def tearDown(self):
+        for worker in self.workers:
+            worker.stop_cluster()
+        for gc_patch in reversed(self.gc_patches):
+            gc_patch.stop()
+        self.temp_dir.cleanup()
+
+    def test_feeds_are_split_and_rebalanced_when_a_worker_leaves(self):
+        worker_a, worker_b = self.workers
+        feed_ids = [f"feed-{index}" for index in range(40)]
+        with patch.object(RSSManager, "_start_check_thread"), patch.object(RSSManager, "_schedule_next_run") as mock_arm:
+            worker_a.add_rss_bulk([SharedStorageTests._item(rss_id) for rss_id in feed_ids])
+            worker_b.refresh_storage()
+
+            owned_a = {rss_id for rss_id in feed_ids if worker_a.owns_feed(rss_id)}
+            owned_b = {rss_id for rss_id in feed_ids if worker_b.owns_feed(rss_id)}
+            self.assertEqual(owned_a | owned_b, set(feed_ids))
+            self.assertFalse(owned_a & owned_b)
+            self.assertTrue(owned_a and owned_b)
+
+            worker_b.stop_cluster()
+            mock_arm.reset_mock()
+            worker_a._shard_heartbeat()
+
+        self.assertTrue(all(worker_a.owns_feed(rss_id) for rss_id in feed_ids))
+        rearmed = {call.args[0] for call in mock_arm.call_args_list if call.kwargs.get("source") == "rebalance"}
+        self.assertEqual(rearmed, owned_b)
+        status = worker_a.cluster_status()
+        self.assertEqual([(worker["workerId"], worker["feeds"]) for worker in status["workers"]], [("worker-a", 40)])
+
+
+if __name__ == "__main__":
+    unittest.main()
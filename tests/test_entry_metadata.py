@@ -0,0 +1,66 @@
+import unittest
+from types import SimpleNamespace
+
+from src.entry_metadata import entry_metadata, parse_size, rejection_reason
+from src.feed_parser import parse_compact
+from src.general.general_class import RSSItem
+
+FEED_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Tracker</title>
+<item>
+  <title>Show S01E01 1080p [Free]</title>
+  <category>TV</category>
+  <enclosure url="https://example.com/1.torrent" length="2147483648" type="application/x-bittorrent"/>
+</item>
+<item><title>Movie 2160p [58.2 GB]</title><category>Movies</category><link>https://example.com/2.torrent</link></item>
+<item><title>Freedom 720p</title><link>https://example.com/3.torrent</link></item>
+</channel></rss>"""
+
+
+def _item(**rules):
+    return RSSItem(id="feed-1", name="Feed", url="https://example.com/rss", path="", interval=10, pt_site="Other", **rules)
+
+
+class EntryMetadataTests(unittest.TestCase):
+    def test_metadata_from_enclosure_title_and_category(self):
+        entries = parse_compact(FEED_XML).entries
+
+        first, second, third = (entry_metadata(entry) for entry in entries)
+        self.assertEqual(first, {"size": 2147483648, "categories": ["TV"], "freeleech": True})
+        self.assertEqual(second["size"], int(58.2 * 1024 ** 3))
+        self.assertEqual(second["categories"], ["Movies"])
+        self.assertFalse(second["freeleech"])
+        self.assertFalse(third["freeleech"])
+        self.assertIsNone(third["size"])
+
+    def test_freeleech_needs_a_promotion_tag_not_the_word_free(self):
+        def meta(title, categories=()):
+            return entry_metadata(SimpleNamespace(title=title, categories=list(categories), size=None))
+
+        for title in ("Show E01 [Free]", "Show E01 (2xFree)", "Show E01 2xFree 1080p", "Show E01 Freeleech", "剧集 【免费】"):
+            self.assertTrue(meta(title)["freeleech"], title)
+        for title in ("Free Solo 2018 1080p", "Born Free 1966", "Free.Guy.2021.2160p", "Freedom 720p", "Set It Free [1080p]"):
+            self.assertFalse(meta(title)["freeleech"], title)
+        self.assertTrue(meta("Born Free 1966", categories=["Movies", "Free"])["freeleech"])
+        self.assertFalse(meta("Movie", categories=["Free Films"])["freeleech"])
+
+    def test_parse_size_units(self):
+        self.assertEqual(parse_size("Size: 700 MB"), 700 * 1024 ** 2)
+        self.assertEqual(parse_size("[1.5GiB]"), int(1.5 * 1024 ** 3))
+        self.assertIsNone(parse_size("no size here"))
+
+    def test_rules_reject_by_size_category_and_promotion(self):
+        meta = {"size": 60 * 1024 ** 3, "categories": ["Movies"], "freeleech": False}
+
+        self.assertIsNone(rejection_reason(meta, _item()))
+        self.assertEqual(rejection_reason(meta, _item(max_size_mb=50 * 1024)), "max_size")
+        self.assertEqual(rejection_reason(meta, _item(min_size_mb=100 * 1024)), "min_size")
+        self.assertEqual(rejection_reason(meta, _item(categories="TV; Anime")), "category")
+        self.assertIsNone(rejection_reason(meta, _item(categories="movies")))
+        self.assertEqual(rejection_reason(meta, _item(freeleech_only=True)), "not_freeleech")
+        # Unknown sizes are not rejected by size rules
+        self.assertIsNone(rejection_reason({"size": None, "categories": []}, _item(max_size_mb=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
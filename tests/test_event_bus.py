@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from src.event_bus import EventBus
+
+
+class EventBusTests(unittest.TestCase):
+    def test_events_after_returns_only_newer_events(self):
+        bus = EventBus(max_events=10)
+        first = bus.publish("log", {"msg": "one"})
+        second = bus.publish("log", {"msg": "two"})
+
+        events, missed = bus.events_after(first)
+
+        self.assertFalse(missed)
+        self.assertEqual([event["id"] for event in events], [second])
+        self.assertEqual(bus.events_after(second), ([], False))
+
+    def test_events_after_flags_overrun_and_unknown_ids(self):
+        bus = EventBus(max_events=2)
+        first = bus.publish("log", {"msg": "one"})
+        for n in range(3):
+            bus.publish("log", {"msg": str(n)})
+
+        self.assertEqual(bus.events_after(first), ([], True))
+        self.assertEqual(bus.events_after(bus.last_id + 5), ([], True))
+
+    def test_wait_for_events_wakes_on_publish_from_thread(self):
+        bus = EventBus(max_events=10)
+        cursor = bus.last_id
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, lambda: loop.run_in_executor(None, bus.publish, "run-start", {"feedId": "feed-1"}))
+            return await bus.wait_for_events(cursor, timeout=5)
+
+        events, missed = asyncio.run(scenario())
+
+        self.assertFalse(missed)
+        self.assertEqual(events[0]["type"], "run-start")
+
+    def test_wait_for_events_times_out_quietly(self):
+        bus = EventBus(max_events=10)
+
+        events, missed = asyncio.run(bus.wait_for_events(bus.last_id, timeout=0.01))
+
+        self.assertEqual((events, missed), ([], False))
+
+    def test_workers_sharing_a_journal_share_ids_and_events(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal = os.path.join(temp_dir, "events.jsonl")
+            worker_a, worker_b = EventBus(max_events=3), EventBus(max_events=3)
+            worker_a.attach_journal(journal, poll_seconds=0.01)
+            worker_b.attach_journal(journal, poll_seconds=0.01)
+
+            ids = [(worker_a if n % 2 else worker_b).publish("run-start", {"n": n}) for n in range(7)]
+
+            self.assertEqual(ids, list(range(ids[0], ids[0] + 7)))
+            for bus in (worker_a, worker_b):
+                bus.poll()
+                self.assertEqual(bus.last_id, ids[-1])
+                self.assertEqual([event["data"]["n"] for event in bus.events_after(ids[3])[0]], [4, 5, 6])
+                self.assertTrue(bus.events_after(ids[0])[1])
+            # Compacted to the buffer size once it held twice as many events
+            with open(journal, encoding="utf-8") as f:
+                self.assertLess(len(f.readlines()), 6)
+
+            late = EventBus(max_events=3)
+            late.attach_journal(journal, poll_seconds=0.01)
+            self.assertEqual(late.last_id, ids[-1])
+            self.assertEqual(late.publish("run-finish", {}), ids[-1] + 1)
+            worker_a.poll()
+            self.assertEqual(worker_a.last_id, ids[-1] + 1)
+            for bus in (worker_a, worker_b, late):
+                bus.close()
+
+    def test_wait_for_events_picks_up_events_from_another_worker(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal = os.path.join(temp_dir, "events.jsonl")
+            worker_a, worker_b = EventBus(max_events=10), EventBus(max_events=10)
+            worker_a.attach_journal(journal, poll_seconds=0.01)
+            worker_b.attach_journal(journal, poll_seconds=0.01)
+            cursor = worker_a.last_id
+
+            async def scenario():
+                asyncio.get_running_loop().call_later(0.05, worker_b.publish, "run-start", {"feedId": "feed-1"})
+                return await worker_a.wait_for_events(cursor, timeout=5)
+
+            readers = []
+            read_journal = worker_a._read_journal
+
+            def recording_read():
+                readers.append(threading.current_thread())
+                return read_journal()
+
+            worker_a._read_journal = recording_read
+            events, missed = asyncio.run(scenario())
+            worker_a.close()
+            worker_b.close()
+
+        self.assertFalse(missed)
+        self.assertEqual(events[0]["data"], {"feedId": "feed-1"})
+        # The journal is read by the tail thread, never on the event loop
+        self.assertTrue(readers)
+        self.assertNotIn(threading.main_thread(), readers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import src.general.general_constant as GC
+from src.feed_capture import FeedCapture
+from src.feed_replay import FakeTransmission, FeedReplay
+from src.general.general_class import RSSItem
+from src.rss_manager import RSSManager
+from tests.test_rss_manager import FakeResponse
+
+
+def _rss(*titles) -> bytes:
+    items = "".join(
+        f'<item><title>{title}</title><enclosure url="https://tracker.example/t/{n}.torrent" type="application/x-bittorrent" length="1"/></item>'
+        for n, title in enumerate(titles)
+    )
+    return f"<rss version='2.0'><channel><title>t</title>{items}</channel></rss>".encode("utf-8")
+
+
+class FeedCaptureTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_dir = Path(self.temp_dir.name) / "storage"
+        self.gc_patches = [
+            patch.object(GC, "STORAGE_DIR", str(self.storage_dir)),
+            patch.object(GC, "LOG_DIR", str(self.storage_dir / "logs")),
+            patch.object(GC, "STORAGE_PATH", str(self.storage_dir / "storage.json")),
+            patch.object(GC, "FEED_CAPTURE", True),
+        ]
+        for gc_patch in self.gc_patches:
+            gc_patch.start()
+        self.manager = RSSManager()
+        self.item = RSSItem(
+            id="feed-1", name="Feed", url="https://tracker.example/rss?passkey=secret", path="/dl", interval=10, pt_site=GC.DEFAULT_PT_SITE
+        )
+        self.manager.feeds.put(self.item)
+
+    def tearDown(self):
+        self.manager.run_pool.shutdown()
+        for gc_patch in reversed(self.gc_patches):
+            gc_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _fetch(self, body: bytes):
+        response = FakeResponse(content=body)
+        response.headers = {"Content-Type": "application/rss+xml", "Set-Cookie": "session=1"}
+        with patch("src.rss_manager.requests.get", return_value=response):
+            return self.manager._fetch_feed(self.item.id, self.item.model_copy(), "testrun")
+
+    def test_fetches_are_captured_once_per_distinct_body_without_secrets(self):
+        self._fetch(_rss("Episode 1"))
+        self._fetch(_rss("Episode 1"))
+        self._fetch(_rss("Episode 2", "Episode 1"))
+
+        capture = self.manager.feed_capture
+        stats = capture.stats()
+        self.assertEqual((stats["records"], stats["blobs"]), (3, 2))
+        record = capture.records()[0]
+        self.assertEqual(capture.body(record["sha256"]), _rss("Episode 1"))
+        self.assertEqual(record["headers"], {"Content-Type": "application/rss+xml"})
+        self.assertEqual(record["host"], "tracker.example")
+        self.assertNotIn("secret", (self.storage_dir / GC.FEED_CAPTURE_DIR / "manifest.jsonl").read_text(encoding="utf-8"))
+
+    def test_retention_drops_oldest_fetches_and_their_blobs(self):
+        capture = FeedCapture(str(self.storage_dir / "small"), max_bytes=1)
+        for n in range(3):
+            capture.record("feed-1", self.item, 200, {}, _rss(f"Episode {n}"))
+
+        records = capture.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(capture.body(records[0]["sha256"]), _rss("Episode 2"))
+        self.assertEqual(len(list((self.storage_dir / "small" / "blobs").rglob("*.gz"))), 1)
+        # A fresh instance reads the pruned manifest back
+        self.assertEqual(FeedCapture(str(self.storage_dir / "small"), max_bytes=1).stats()["records"], 1)
+
+    def test_workers_sharing_the_directory_keep_each_others_records_when_pruning(self):
+        capture_dir = str(self.storage_dir / "shared")
+        blob_bytes = len(gzip.compress(_rss("Episode 0"), compresslevel=6, mtime=0))
+        worker_a = FeedCapture(capture_dir, max_bytes=int(blob_bytes * 2.5))
+        worker_b = FeedCapture(capture_dir, max_bytes=int(blob_bytes * 2.5))
+        worker_b.stats()  # loaded before worker_a's captures
+        worker_a.record("feed-1", self.item, 200, {}, _rss("Episode 0"))
+        worker_a.record("feed-1", self.item, 200, {}, _rss("Episode 1"))
+        worker_b.record("feed-2", self.item, 200, {}, _rss("Episode 2"))
+        worker_a.record("feed-1", self.item, 200, {}, _rss("Episode 3"))
+
+        records = FeedCapture(capture_dir, max_bytes=1 << 20).records()
+        self.assertEqual([record["feedId"] for record in records], ["feed-2", "feed-1"])
+        self.assertEqual(worker_a.body(records[0]["sha256"]), _rss("Episode 2"))
+        self.assertEqual(list(Path(capture_dir).rglob("*.tmp")), [])
+
+    def test_replay_runs_captured_sequence_through_check_rss(self):
+        self._fetch(_rss("Episode 1"))
+        self._fetch(_rss("Episode 2", "Episode 1"))
+        replay_dir = Path(self.temp_dir.name) / "replay"
+        capture = self.manager.feed_capture
+
+        with patch.object(GC, "STORAGE_DIR", str(replay_dir)), patch.object(GC, "LOG_DIR", str(replay_dir / "logs")), \
+                patch.object(GC, "STORAGE_PATH", str(replay_dir / "storage.json")):
+            replayed = RSSManager()
+            transmission = FakeTransmission()
+            summary = FeedReplay(replayed, capture, transmission).run()
+            replayed.run_pool.shutdown()
+
+        self.assertEqual(summary["runs"], 2)
+        self.assertEqual(summary["statuses"], {"OK": 2})
+        self.assertEqual(replayed.feeds.get("feed-1").last_title, "Episode 2")
+        self.assertTrue(replayed.feeds.get("feed-1").url.startswith("replay://tracker.example/"))
+        self.assertIn(("https://tracker.example/t/0.torrent", "/dl"), transmission.added)
+        self.assertEqual(len(capture.records()), 2)  # replay does not capture again
+        self.assertFalse((replay_dir / GC.FEED_CAPTURE_DIR).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+
+from src.api import feed_io
+
+
+FEEDS = {
+    "feed-1": {
+        "id": "feed-1",
+        "name": "Shows & Films",
+        "url": "https://example.com/rss?passkey=abc&cat=1",
+        "pt_site": "Audiences",
+        "key_words": "Episode 1080p;Movie",
+        "path": "/downloads/shows",
+        "interval": 15,
+        "last_status": "OK",
+    },
+}
+
+
+class FeedIOTests(unittest.TestCase):
+    def test_opml_round_trip_keeps_feed_fields(self):
+        opml = feed_io.feeds_to_opml(FEEDS, title="feeds")
+
+        records = feed_io.parse_opml_feeds(opml.encode("utf-8"))
+
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual(record["name"], "Shows & Films")
+        self.assertEqual(record["url"], FEEDS["feed-1"]["url"])
+        self.assertEqual(record["pt_site"], "Audiences")
+        self.assertEqual(record["key_words"], "Episode 1080p;Movie")
+        self.assertEqual(record["interval"], "15")
+
+    def test_opml_import_reads_nested_outlines_and_skips_folders(self):
+        raw = b"""<?xml version="1.0"?>
+        <opml version="1.0"><body>
+            <outline text="Trackers">
+                <outline text="A" xmlUrl="https://a.example/rss"/>
+                <outline text="B" title="Bee" xmlUrl="https://b.example/rss"/>
+            </outline>
+        </body></opml>"""
+
+        records = feed_io.parse_opml_feeds(raw)
+
+        self.assertEqual([(r["name"], r["url"]) for r in records], [("A", "https://a.example/rss"), ("Bee", "https://b.example/rss")])
+
+    def test_json_export_omits_runtime_state_and_reimports(self):
+        exported = feed_io.feeds_to_json(FEEDS)
+
+        records = feed_io.parse_json_feeds(exported.encode("utf-8"))
+
+        self.assertNotIn("last_status", json.loads(exported)["feeds"][0])
+        self.assertEqual(records[0]["url"], FEEDS["feed-1"]["url"])
+
+    def test_invalid_documents_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            feed_io.parse_json_feeds(b'{"feeds": 3}')
+        with self.assertRaises(ValueError):
+            feed_io.parse_opml_feeds(b"<opml><body>")
+
+    def test_detect_format_prefers_explicit_then_content_type(self):
+        self.assertEqual(feed_io.detect_format("application/json", "opml"), feed_io.FORMAT_OPML)
+        self.assertEqual(feed_io.detect_format("text/x-opml; charset=utf-8", None), feed_io.FORMAT_OPML)
+        self.assertEqual(feed_io.detect_format("", None), feed_io.FORMAT_JSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from src.feed_parser import (
+    PARSE_INLINE,
+    PARSE_PROCESS,
+    FeedEntry,
+    FeedParseError,
+    FeedParsePool,
+    FeedParseTimeout,
+    compact_feed,
+    parse_compact,
+)
+
+FEED_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Tracker</title>
+<item>
+  <title>Show S01E01 1080p</title>
+  <guid>guid-1</guid>
+  <pubDate>Mon, 19 Oct 2026 10:00:00 GMT</pubDate>
+  <link>https://example.com/details/1</link>
+  <enclosure url="https://example.com/1.torrent" length="123456" type="application/x-bittorrent"/>
+</item>
+<item><title>Show S01E02 1080p</title><guid>guid-2</guid><link>https://example.com/details/2</link></item>
+</channel></rss>"""
+
+
+class FeedParserTests(unittest.TestCase):
+    def test_compact_records_keep_fields_used_by_the_checker(self):
+        feed = parse_compact(FEED_XML)
+
+        self.assertFalse(feed.bozo)
+        first, second = feed.entries
+        self.assertIsInstance(first, FeedEntry)
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(first.title, "Show S01E01 1080p")
+        self.assertEqual(first.guid, "guid-1")
+        self.assertEqual(first.size, 123456)
+        self.assertTrue(first.published)
+        self.assertEqual(first.link, "https://example.com/1.torrent")
+        self.assertEqual(second.link, "https://example.com/details/2")
+
+    def test_compact_feed_round_trips_through_pickle(self):
+        feed = pickle.loads(pickle.dumps(parse_compact(FEED_XML)))
+
+        self.assertEqual([entry.title for entry in feed.entries], ["Show S01E01 1080p", "Show S01E02 1080p"])
+        self.assertIs(compact_feed(feed), feed)
+
+    def test_bozo_exception_survives_the_round_trip(self):
+        feed = pickle.loads(pickle.dumps(parse_compact(b"<rss><channel><item><title>broken")))
+
+        self.assertTrue(feed.bozo)
+        self.assertIsInstance(feed.bozo_exception, FeedParseError)
+        self.assertTrue(str(feed.bozo_exception))
+
+    def test_small_documents_stay_inline(self):
+        pool = FeedParsePool(workers=2, min_bytes=len(FEED_XML) + 1, timeout=30)
+
+        with patch("src.feed_parser.ProcessPoolExecutor") as mock_executor:
+            feed, mode = pool.parse(FEED_XML)
+
+        mock_executor.assert_not_called()
+        self.assertEqual(mode, PARSE_INLINE)
+        self.assertEqual(len(feed.entries), 2)
+
+    def test_large_documents_are_parsed_in_a_worker_process(self):
+        pool = FeedParsePool(workers=1, min_bytes=0, timeout=60)
+        try:
+            feed, mode = pool.parse(FEED_XML)
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(mode, PARSE_PROCESS)
+        self.assertEqual([entry.title for entry in feed.entries], ["Show S01E01 1080p", "Show S01E02 1080p"])
+
+
+    def test_a_parse_timeout_kills_the_pool_and_is_not_a_timeout_error(self):
+        # Spawning the worker alone takes longer than this
+        pool = FeedParsePool(workers=1, min_bytes=0, timeout=0.001)
+        try:
+            hung = pool._get_executor()
+            with patch.object(pool, "_reset_executor", wraps=pool._reset_executor) as mock_reset:
+                with self.assertRaises(FeedParseTimeout) as ctx:
+                    pool.parse(FEED_XML)
+            mock_reset.assert_called_once_with(hung, kill=True)
+            self.assertNotIsInstance(ctx.exception, TimeoutError)
+
+            pool.timeout = 60
+            feed, mode = pool.parse(FEED_XML)
+            self.assertIsNot(pool._executor, hung)
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(mode, PARSE_PROCESS)
+        self.assertEqual(len(feed.entries), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from src.feed_registry import FeedRegistry
+from src.general.general_class import FilterProfile, RSSItem
+
+
+def _raw(rss_id: str, **fields) -> dict:
+    raw = {"id": rss_id, "name": rss_id, "url": f"https://example.com/{rss_id}", "path": "", "interval": 10, "pt_site": "HHCLUB"}
+    raw.update(fields)
+    return raw
+
+
+class FeedRegistryTests(unittest.TestCase):
+    def test_load_validates_once_and_keeps_invalid_feeds_raw(self):
+        registry = FeedRegistry()
+        invalid = registry.load({"a": _raw("a"), "broken": {"id": "broken", "interval": "soon"}})
+
+        self.assertEqual(invalid, ["broken"])
+        self.assertIsInstance(registry.get("a"), RSSItem)
+        self.assertNotIn("broken", registry)
+        self.assertEqual(registry.serialize()["broken"], {"id": "broken", "interval": "soon"})
+
+    def test_snapshots_are_shared_until_a_write_and_never_change(self):
+        registry = FeedRegistry()
+        registry.load({"a": _raw("a")})
+
+        first = registry.snapshot()
+        self.assertIs(registry.snapshot(), first)
+        registry.update("a", last_status="OK")
+        second = registry.snapshot()
+
+        self.assertIsNot(second, first)
+        self.assertIsNone(first["a"].last_status)
+        self.assertEqual(second["a"].last_status, "OK")
+        with self.assertRaises(TypeError):
+            second["b"] = None
+
+    def test_serialize_only_dumps_dirty_fields(self):
+        registry = FeedRegistry()
+        registry.load({"a": _raw("a"), "b": _raw("b")})
+        registry.serialize()
+
+        item = registry.get("a").model_copy(update={"last_title": "E01", "profiles": [FilterProfile(id="p1", path="/x")]})
+        registry.put(item)
+        with patch("src.feed_registry.model_to_dict", wraps=lambda model: model.model_dump()) as dump:
+            data = registry.serialize()
+
+        # Only the profile is dumped; the untouched feed and unchanged fields come from the cache
+        self.assertEqual(dump.call_count, 1)
+        self.assertEqual(data["a"]["last_title"], "E01")
+        self.assertEqual(data["a"]["profiles"][0]["path"], "/x")
+        self.assertEqual(data["b"], _raw("b"))
+
+    def test_put_without_changes_is_not_a_write(self):
+        registry = FeedRegistry()
+        registry.load({"a": _raw("a")})
+        version = registry.version
+
+        registry.put(registry.get("a").model_copy())
+
+        self.assertEqual(registry.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import src.general.general_constant as GC
+from src.api import routes
+from src.general.general_class import RSSItem
+from src.rss_manager import RSSManager
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/api/feeds", "query_string": b"", "headers": raw})
+
+
+class FeedRoutesTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        storage_dir = Path(self.temp_dir.name) / "storage"
+        self.gc_patches = [
+            patch.object(GC, "STORAGE_DIR", str(storage_dir)),
+            patch.object(GC, "LOG_DIR", str(storage_dir / "logs")),
+            patch.object(GC, "STORAGE_PATH", str(storage_dir / "storage.json")),
+            patch.object(GC, "TORRENT_FILE_CACHE", False),
+        ]
+        for gc_patch in self.gc_patches:
+            gc_patch.start()
+        self.manager = RSSManager()
+        for index in range(2):
+            self.manager.feeds.put(RSSItem(
+                id=f"feed-{index}", name=f"Feed {index}", url=f"https://example.com/{index}", path="", interval=10,
+                pt_site=GC.DEFAULT_PT_SITE,
+            ))
+            self.manager._bump_feed_version(f"feed-{index}")
+
+    def tearDown(self):
+        self.manager.shutdown(wait_seconds=5)
+        for gc_patch in reversed(self.gc_patches):
+            gc_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _list(self, request=None, since=None):
+        return routes.list_feeds(request or _request(), since=since, rss=self.manager)
+
+    def test_full_list_and_delta_have_different_etags(self):
+        full = self._list()
+        since = self.manager.storage_version - 1
+        delta = self._list(since=since)
+        self.assertNotEqual(full.headers["etag"], delta.headers["etag"])
+
+        # A tag stored for one representation does not validate the other
+        self.assertEqual(self._list(_request(if_none_match=full.headers["etag"]), since=since).status_code, 200)
+        self.assertEqual(self._list(_request(if_none_match=delta.headers["etag"])).status_code, 200)
+        self.assertEqual(self._list(_request(if_none_match=delta.headers["etag"]), since=since).status_code, 304)
+        self.assertEqual(len(json.loads(delta.body)["feeds"]), 1)
+
+    def test_if_none_match_accepts_lists_weak_tags_and_star(self):
+        since = self.manager.storage_version
+        etag = self._list(since=since).headers["etag"]
+        for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            self.assertEqual(self._list(_request(if_none_match=header), since=since).status_code, 304, header)
+        self.assertEqual(self._list(_request(if_none_match='"other", W/"feeds-0"'), since=since).status_code, 200)
+
+    def test_cursor_from_another_sort_is_rejected_with_400(self):
+        page = json.loads(routes.list_feeds(_request(), sort="name", limit=1, rss=self.manager).body)
+        with self.assertRaises(HTTPException) as resumed:
+            routes.list_feeds(_request(), sort="interval", cursor=page["nextCursor"], limit=1, rss=self.manager)
+        self.assertEqual(resumed.exception.status_code, 400)
+
+    def test_breaker_changes_do_not_leave_stale_state_in_versioned_feeds(self):
+        since = self.manager.storage_version
+        etag = self._list(since=since).headers["etag"]
+        breaker = self.manager.breakers.get(self.manager._host_breaker_name("https://example.com/0"))
+        for _ in range(GC.BREAKER_FAILURE_THRESHOLD):
+            breaker.record_failure("down")
+
+        # Breaker state is served by /api/breakers, so a 304 for the feed list is still accurate
+        self.assertEqual(self._list(_request(if_none_match=etag), since=since).status_code, 304)
+        self.assertNotIn("circuit", json.loads(self._list().body)[0])
+        self.assertEqual(routes.list_breakers(rss=self.manager)[0]["state"], "open")
+
+    def _import(self, body: bytes):
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        request = Request({"type": "http", "method": "POST", "path": "/api/feeds/import", "query_string": b"",
+                           "headers": [(b"content-type", b"application/json")]}, receive)
+        return asyncio.run(routes.import_feeds(request, rss=self.manager))
+
+    def test_json_export_round_trips_rules_and_fetch_settings(self):
+        fields = {
+            "max_response_bytes": 2048, "transmission_endpoint": "nas", "min_size_mb": 1.5,
+            "max_size_mb": 40.0, "categories": "TV", "freeleech_only": True,
+        }
+        self.manager.feeds.update("feed-0", **fields)
+        exported = routes.export_feeds(rss=self.manager).body
+        for rss_id in ("feed-0", "feed-1"):
+            self.manager.delete_rss(rss_id)
+
+        with patch.object(self.manager, "start_task"):
+            result = self._import(exported)
+
+        self.assertEqual(result["added"], 2)
+        imported = next(item for item in self.manager.feeds.snapshot().values() if item.url.endswith("/0"))
+        self.assertEqual({key: getattr(imported, key) for key in fields}, fields)
+
+        # Imported rules go through the same checks as POST /api/feeds
+        with self.assertRaises(HTTPException) as rejected:
+            self._import(json.dumps([{"url": "https://example.com/new", "min_size_mb": 5, "max_size_mb": 1}]).encode())
+        self.assertEqual(rejected.exception.status_code, 400)
+        self.assertIn("min_size_mb", rejected.exception.detail["errors"][0]["error"])
+
+    def test_invalid_feed_fields_are_rejected_with_400(self):
+        with self.assertRaises(HTTPException) as added:
+            routes.add_feed({"url": "https://example.com/new", "max_response_bytes": "lots"}, rss=self.manager)
+        self.assertEqual(added.exception.status_code, 400)
+        with self.assertRaises(HTTPException) as updated:
+            routes.update_feed("feed-0", {"interval": "often"}, rss=self.manager)
+        self.assertEqual(updated.exception.status_code, 400)
+        self.assertEqual(len(self.manager.feeds), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
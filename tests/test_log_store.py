@@ -0,0 +1,110 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.log_store import LogStore
+
+
+class LogStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _store(self, **overrides):
+        options = dict(
+            max_bytes=100, max_age_seconds=0, keep_archives=2, retention_seconds=0, total_max_bytes=10 ** 9,
+        )
+        options.update(overrides)
+        return LogStore(str(self.log_dir), **options)
+
+    def test_size_rotation_gzips_the_active_file(self):
+        store = self._store()
+        lines = [f"[ts] line {n:03d} {'x' * 20}\n" for n in range(4)]
+        for line in lines:
+            store.append("feed-1", line)
+
+        archives = store.archives("feed-1")
+        self.assertEqual(len(archives), 1)
+        # The third line crossed max_bytes; the fourth starts a new active file
+        with gzip.open(archives[0], "rt", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "".join(lines[:3]))
+        self.assertEqual(Path(store.path("feed-1")).read_text(encoding="utf-8"), lines[3])
+
+    def test_archives_are_capped_per_log_and_globally(self):
+        store = self._store(keep_archives=2)
+        for _ in range(4):
+            store.append("feed-1", "x" * 120 + "\n")
+        self.assertEqual(len(store.archives("feed-1")), 2)
+
+        oldest, newer = store.archives("feed-1")
+        os.utime(oldest, (time.time() - 20, time.time() - 20))
+        os.utime(newer, (time.time() - 10, time.time() - 10))
+        store.total_max_bytes = os.path.getsize(oldest) + os.path.getsize(newer)
+        store.append("feed-2", "x" * 120 + "\n")
+        # The oldest archive of any log goes first
+        self.assertEqual(store.archives("feed-1"), [newer])
+        self.assertEqual(len(store.archives("feed-2")), 1)
+
+    def test_age_rotation_uses_the_first_line_of_files_from_earlier_runs(self):
+        store = self._store(max_bytes=10 ** 6, max_age_seconds=3600, first_line_time=lambda line: float(line.split()[0]))
+        store.path("feed-1")
+        Path(store.path("feed-1")).write_text(f"{time.time() - 7200} old\n", encoding="utf-8")
+
+        store.append("feed-1", f"{time.time()} new\n")
+
+        self.assertEqual(len(store.archives("feed-1")), 1)
+        store.append("feed-1", f"{time.time()} next\n")
+        self.assertEqual(len(store.archives("feed-1")), 1)
+
+    def test_archives_sort_by_stamp_then_counter_so_the_newest_is_kept(self):
+        names = ["feed-1.20260101-000000.log.gz", "feed-1.20260101-000000-1.log.gz",
+                 "feed-1.20260101-000000-2.log.gz", "feed-1.20260101-000001.log.gz"]
+        for name in reversed(names):
+            (self.log_dir / name).write_bytes(b"")
+        store = self._store(keep_archives=2)
+
+        self.assertEqual([os.path.basename(path) for path in store.archives("feed-1")], names)
+        store.enforce_retention("feed-1")
+        self.assertEqual([os.path.basename(path) for path in store.archives("feed-1")], names[2:])
+
+    def test_age_rotation_rereads_the_first_line_after_another_worker_rotates(self):
+        options = dict(max_bytes=10 ** 6, max_age_seconds=3600, first_line_time=lambda line: float(line.split()[0]))
+        worker_a, worker_b = self._store(**options), self._store(**options)
+        now = time.time()
+        Path(worker_a.path("feed-1")).write_text(f"{now - 3000} {'x' * 200}\n", encoding="utf-8")
+        worker_a.append("feed-1", f"{now} a\n")
+        worker_b.rotate("feed-1")
+        worker_b.append("feed-1", f"{now} b\n")
+
+        # 4000s after worker_a's file started, but only 1000s after the current one did
+        with patch("src.log_store.time.time", return_value=now + 1000):
+            worker_a.append("feed-1", f"{now + 1000} a\n")
+        self.assertEqual(len(worker_a.archives("feed-1")), 1)
+        self.assertEqual(len(Path(worker_a.path("feed-1")).read_text(encoding="utf-8").splitlines()), 2)
+
+    def test_retention_drops_expired_archives_and_delete_removes_everything(self):
+        store = self._store(retention_seconds=60)
+        store.append("feed-1", "x" * 120 + "\n")
+        [archive] = store.archives("feed-1")
+        os.utime(archive, (time.time() - 120, time.time() - 120))
+        store.append("feed-1", "still active\n")
+
+        store.enforce_retention()
+        self.assertEqual(store.archives("feed-1"), [])
+
+        store.append("feed-2", "x" * 120 + "\n")
+        store.append("feed-2", "active\n")
+        store.delete("feed-2")
+        self.assertEqual(sorted(os.listdir(self.log_dir)), ["feed-1.log"])
+        self.assertEqual(store.usage()["activeFiles"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
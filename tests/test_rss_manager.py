@@ -1,22 +1,37 @@
 import json
 import tempfile
+import threading
 import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import requests
+
 import src.general.general_constant as GC
-from src.general.general_class import RSSItem, model_to_dict
+from src.feed_parser import FeedParseTimeout
+from src.general.general_class import FilterProfile, RSSItem
 from src.rss_manager import RSSManager
+from src.torrent_files import TorrentFileCache
 
 
 class FakeResponse:
-    def __init__(self, content: bytes = b"", status_code: int = 200):
+    def __init__(self, content: bytes = b"", status_code: int = 200, wire_bytes: int | None = None):
         self.content = content
         self.status_code = status_code
+        self.headers = {}
+        self.raw = SimpleNamespace(tell=lambda: len(content) if wire_bytes is None else wire_bytes)
 
     def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
         return None
 
 
@@ -32,6 +47,8 @@ class RSSManagerRobustnessTests(unittest.TestCase):
             patch.object(GC, "STORAGE_DIR", str(self.storage_dir)),
             patch.object(GC, "LOG_DIR", str(self.logs_dir)),
             patch.object(GC, "STORAGE_PATH", str(self.storage_path)),
+            # Sends pass torrent URLs through unless a test sets up the file cache
+            patch.object(GC, "TORRENT_FILE_CACHE", False),
         ]
         for gc_patch in self.gc_patches:
             gc_patch.start()
@@ -39,6 +56,7 @@ class RSSManagerRobustnessTests(unittest.TestCase):
         self.manager = RSSManager()
 
     def tearDown(self):
+        self.manager.shutdown(wait_seconds=5)
         for gc_patch in reversed(self.gc_patches):
             gc_patch.stop()
         self.temp_dir.cleanup()
@@ -56,11 +74,22 @@ class RSSManagerRobustnessTests(unittest.TestCase):
             last_fetch=overrides.get("last_fetch"),
             last_status=overrides.get("last_status"),
             last_error=overrides.get("last_error"),
+            profiles=overrides.get("profiles", []),
         )
-        self.manager.storage["rss"][item.id] = model_to_dict(item)
+        self.manager.feeds.put(item)
         self.manager.save_storage()
         return item
 
+    def _wait_for_active_run(self, rss_id: str):
+        deadline = time.monotonic() + 5
+        while self.manager._get_active_run(rss_id) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _wait_for_idle_pool(self):
+        deadline = time.monotonic() + 5
+        while (self.manager.run_pool.stats()["busy"] or self.manager.queued_runs) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
     def test_schedule_arms_next_run_and_dispatches_worker(self):
         self._add_item()
 
@@ -103,9 +132,9 @@ class RSSManagerRobustnessTests(unittest.TestCase):
         with patch.object(self.manager, "_fetch_feed", return_value=feed):
             self.manager.check_rss(item.id, run_id="testrun")
 
-        saved = self.manager.storage["rss"][item.id]
-        self.assertEqual(saved["last_status"], "OK")
-        self.assertIsNone(saved.get("last_error"))
+        saved = self.manager.feeds.get(item.id)
+        self.assertEqual(saved.last_status, "OK")
+        self.assertIsNone(saved.last_error)
 
     def test_check_rss_tolerates_invalid_filter_cache_json(self):
         item = self._add_item(pt_site=GC.AUDIENCES, key_words="Episode")
@@ -127,8 +156,8 @@ class RSSManagerRobustnessTests(unittest.TestCase):
         with patch.object(self.manager, "_fetch_feed", return_value=feed):
             self.manager.check_rss(item.id, run_id="testrun")
 
-        saved = self.manager.storage["rss"][item.id]
-        self.assertEqual(saved["last_status"], "OK")
+        saved = self.manager.feeds.get(item.id)
+        self.assertEqual(saved.last_status, "OK")
         self.assertTrue(broken_cache.exists())
         cache_data = json.loads(broken_cache.read_text(encoding="utf-8"))
         self.assertIn("Episode 1", cache_data)
@@ -138,15 +167,611 @@ class RSSManagerRobustnessTests(unittest.TestCase):
         response = FakeResponse(content=b"<rss><channel></channel></rss>", status_code=200)
 
         with patch("src.rss_manager.requests.get", return_value=response) as mock_get:
-            with patch("src.rss_manager.feedparser.parse", return_value=SimpleNamespace(entries=[], bozo=False)):
+            with patch("src.feed_parser.feedparser.parse", return_value=SimpleNamespace(entries=[], bozo=False)):
                 self.manager._fetch_feed(item.id, item, "testrun")
 
         mock_get.assert_called_once_with(
             item.url,
             timeout=(GC.RSS_REQUEST_CONNECT_TIMEOUT, GC.RSS_REQUEST_READ_TIMEOUT),
-            headers={"User-Agent": "MediaRSSManagement/1.1"},
+            headers={"User-Agent": "MediaRSSManagement/1.1", "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING},
+            stream=True,
+        )
+
+    def test_fetch_feed_records_wire_and_decoded_bytes(self):
+        item = self._add_item()
+        response = FakeResponse(content=b"x" * 1000, wire_bytes=120)
+
+        with patch("src.rss_manager.requests.get", return_value=response):
+            with patch("src.feed_parser.feedparser.parse", return_value=SimpleNamespace(entries=[], bozo=False)) as mock_parse:
+                self.manager._fetch_feed(item.id, item, "testrun")
+
+        mock_parse.assert_called_once_with(b"x" * 1000)
+        self.assertEqual((item.last_wire_bytes, item.last_decoded_bytes), (120, 1000))
+        self.assertEqual((item.total_wire_bytes, item.total_decoded_bytes), (120, 1000))
+
+    def test_fetch_feed_enforces_per_feed_byte_cap(self):
+        item = self._add_item()
+        item.max_response_bytes = 100
+        response = FakeResponse(content=b"x" * (GC.RSS_STREAM_CHUNK_BYTES + 1))
+
+        with patch("src.rss_manager.requests.get", return_value=response):
+            with patch("src.feed_parser.feedparser.parse") as mock_parse:
+                with self.assertRaises(ValueError):
+                    self.manager._fetch_feed(item.id, item, "testrun")
+
+        mock_parse.assert_not_called()
+        self.assertEqual(item.last_decoded_bytes, GC.RSS_STREAM_CHUNK_BYTES)
+
+    def test_feed_changes_since_reports_updates_and_deletes(self):
+        first = self._add_item(id="feed-1")
+        self._add_item(id="feed-2", url="https://example.com/rss2")
+        with patch.object(self.manager, "start_task"):
+            self.manager.add_rss(first)
+        baseline, full, _, _ = self.manager.feed_changes_since(0)
+        self.assertTrue(full)
+
+        self.manager._mark_feed_result(first, "OK")
+        self.manager.delete_rss("feed-2")
+        version, full, changed, deleted = self.manager.feed_changes_since(baseline)
+
+        self.assertFalse(full)
+        self.assertGreater(version, baseline)
+        self.assertEqual(list(changed), ["feed-1"])
+        self.assertEqual(deleted, ["feed-2"])
+        self.assertEqual(self.manager.feed_changes_since(version)[2:], ({}, []))
+
+    def test_feed_log_lines_are_published_only_while_watched(self):
+        def log_events():
+            events, _ = self.manager.events.events_after(cursor)
+            return [event["data"]["msg"] for event in events if event["type"] == "log"]
+
+        cursor = self.manager.events.last_id
+        self.manager._log_feed_event("feed-1", "unwatched")
+        self.manager.watch_feed_logs("feed-1")
+        self.manager.watch_feed_logs("feed-1")
+        self.manager._log_feed_event("feed-1", "watched")
+        self.manager._log_feed_event("feed-2", "other feed")
+        self.manager.unwatch_feed_logs("feed-1")
+        self.manager._log_feed_event("feed-1", "one watcher left")
+        self.manager.unwatch_feed_logs("feed-1")
+        self.manager._log_feed_event("feed-1", "closed")
+
+        self.assertEqual(log_events(), ["watched", "one watcher left"])
+        self.assertEqual(self.manager.log_watchers, {})
+
+    def test_submit_check_job_runs_in_background_and_reports_new_items(self):
+        item = self._add_item()
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[SimpleNamespace(title="Episode 2", links=[{"rel": "enclosure", "href": "https://example.com/2.torrent"}])],
+        )
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            job = self.manager.submit_check_job(item.id)
+            deadline = time.monotonic() + 5
+            while self.manager.get_job(job["id"])["status"] in ("queued", "running") and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        finished = self.manager.get_job(job["id"])
+        self.assertEqual(finished["status"], "succeeded")
+        self.assertEqual(finished["result"]["newItems"], [{"title": "Episode 2", "link": "https://example.com/2.torrent"}])
+        self.assertTrue(self.manager._get_run_lock(item.id).acquire(blocking=False))
+
+    def test_queued_timer_run_takes_manual_job_along_at_manual_priority(self):
+        self._add_item(id="busy", url="https://example.com/busy")
+        item = self._add_item()
+        release = threading.Event()
+        self.manager.run_pool.workers = 1
+        feed = SimpleNamespace(bozo=False, entries=[])
+
+        def fetch(rss_id, *args):
+            if rss_id == "busy":
+                release.wait(5)
+            return feed
+
+        log_feed_event = self.manager._log_feed_event
+        coalesce_logged_under_lock = []
+
+        def record_log(rss_id, message, *args, **kwargs):
+            if "run-coalesced" in message:
+                coalesce_logged_under_lock.append(self.manager.state_lock._is_owned())
+            return log_feed_event(rss_id, message, *args, **kwargs)
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=fetch), \
+                patch.object(self.manager, "_log_feed_event", side_effect=record_log):
+            self.manager._start_check_thread("busy", "manual")
+            self._wait_for_active_run("busy")
+            self.manager._start_check_thread(item.id, "startup")
+            job = self.manager.submit_check_job(item.id)
+            self.assertTrue(self.manager._start_check_thread(item.id, "timer"))
+
+            queue = self.manager.run_queue_status()
+            self.assertEqual(queue["queued"], 1)
+            self.assertEqual(queue["queuedByPriority"]["manual"], 1)
+            self.assertEqual(queue["feeds"][0]["trigger"], "manual")
+            self.assertEqual(queue["coalesced"], 2)
+            # Log writes (and the rotation they may trigger) happen after state_lock is released
+            self.assertEqual(coalesce_logged_under_lock, [False, False])
+
+            release.set()
+            deadline = time.monotonic() + 5
+            while self.manager.get_job(job["id"])["status"] in ("queued", "running") and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self._wait_for_idle_pool()
+        self.assertEqual(self.manager.get_job(job["id"])["status"], "succeeded")
+        self.assertEqual(self.manager.run_queue_status()["queued"], 0)
+
+    def test_deleting_a_feed_drops_its_queued_run(self):
+        self._add_item(id="busy", url="https://example.com/busy")
+        item = self._add_item()
+        release = threading.Event()
+        self.manager.run_pool.workers = 1
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=lambda *args: release.wait(5)):
+            self.manager._start_check_thread("busy", "manual")
+            self._wait_for_active_run("busy")
+            job = self.manager.submit_check_job(item.id)
+            self.manager.delete_rss(item.id)
+            release.set()
+            self._wait_for_idle_pool()
+
+        finished = self.manager.get_job(job["id"])
+        self.assertEqual(finished["status"], "failed")
+        self.assertIn("feed deleted", finished["error"])
+        self.assertEqual(self.manager.queued_runs, {})
+
+    def test_delete_rss_removes_logs_caches_and_index_entries(self):
+        item = self._add_item()
+        self.manager.log(item.id, "run=1 check-start")
+        self.manager.logs.rotate(item.id)
+        self.manager.log(item.id, "run=2 check-start")
+        (self.storage_dir / f"{item.id}_torrents_list.json").write_text('{"Episode 1": "https://example.com/1"}', encoding="utf-8")
+        (self.storage_dir / "gone_torrents_list.json").write_text("{}", encoding="utf-8")
+        self.manager.search_index.add_entries(item.id, {"Episode 1": "https://example.com/1"})
+
+        usage = self.manager.storage_usage()
+        self.assertEqual(usage["largestFeeds"][0]["feedId"], item.id)
+        self.assertEqual([feed["feedId"] for feed in usage["orphanedFeeds"]], ["gone"])
+
+        self.manager.delete_rss(item.id)
+
+        leftovers = [path.name for path in self.storage_dir.rglob(f"{item.id}*")]
+        self.assertEqual(leftovers, [])
+        self.assertEqual(self.manager.search_torrents("Episode")[0], 0)
+        self.assertEqual(self.manager.storage_usage()["largestFeeds"], [])
+
+    def test_run_check_now_gives_up_after_the_run_deadline(self):
+        item = self._add_item()
+        release = threading.Event()
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=lambda *args: release.wait(5)):
+            with patch.object(GC, "RUN_TOTAL_DEADLINE", 0.05), patch.object(GC, "RUN_WATCHDOG_SECONDS", 0):
+                with self.assertRaises(TimeoutError):
+                    self.manager.run_check_now(item.id)
+            release.set()
+            self._wait_for_idle_pool()
+
+    def test_run_check_now_returns_when_its_job_leaves_the_history(self):
+        item = self._add_item()
+        other = self._add_item(id="feed-2", url="https://example.com/2")
+        release = threading.Event()
+        outcome = {}
+
+        def check():
+            outcome["result"] = self.manager.run_check_now(item.id)
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=lambda *args: release.wait(5)):
+            with patch.object(GC, "JOB_HISTORY_LIMIT", 1):
+                waiter = threading.Thread(target=check)
+                waiter.start()
+                self._wait_for_active_run(item.id)
+                self.manager.submit_check_job(other.id)
+                waiter.join(5)
+            release.set()
+            self._wait_for_idle_pool()
+
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(outcome, {"result": None})
+
+    def test_shutdown_waits_for_runs_and_stops_scheduling(self):
+        item = self._add_item()
+        release = threading.Event()
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=lambda *args: release.wait(5) and None):
+            self.manager.start_task(item.id)
+            self._wait_for_active_run(item.id)
+            threading.Timer(0.05, release.set).start()
+            self.manager.shutdown(wait_seconds=5)
+
+        self.assertEqual(self.manager.run_pool.stats()["busy"], 0)
+        self.assertEqual(self.manager.tasks, {})
+        self.manager._schedule_next_run(item.id)
+        self.assertEqual(self.manager.tasks, {})
+
+    def test_submit_check_job_rejects_unknown_feed(self):
+        with self.assertRaises(KeyError):
+            self.manager.submit_check_job("missing")
+
+    def test_add_rss_bulk_writes_once_and_staggers_first_runs(self):
+        items = [
+            RSSItem(id=f"bulk-{n}", name="Bulk", url=f"https://example.com/rss/{n}", path="", interval=10, pt_site=GC.DEFAULT_PT_SITE)
+            for n in range(3)
+        ]
+
+        with patch.object(self.manager, "save_storage") as mock_save:
+            with patch.object(self.manager, "_schedule_next_run") as mock_schedule_next:
+                with patch.object(self.manager, "_start_check_thread") as mock_start_worker:
+                    self.manager.add_rss_bulk(items)
+
+        mock_save.assert_called_once()
+        mock_start_worker.assert_not_called()
+        delays = [c.kwargs["delay_seconds"] for c in mock_schedule_next.call_args_list]
+        self.assertEqual(delays, [GC.IMPORT_STAGGER_SECONDS * n for n in (1, 2, 3)])
+        self.assertEqual(set(self.manager.feeds.ids()), {"bulk-0", "bulk-1", "bulk-2"})
+
+    def test_normalize_url_ignores_host_case_and_whitespace(self):
+        self.assertEqual(
+            RSSManager.normalize_url("  HTTPS://Tracker.Example/rss?passkey=AbC "),
+            "https://tracker.example/rss?passkey=AbC",
+        )
+
+    def test_indexes_follow_add_update_and_delete(self):
+        item = self._add_item(url="https://Example.com/rss")
+        with patch.object(self.manager, "start_task"):
+            self.manager.add_rss(item)
+        self.assertEqual(self.manager.find_feed_by_url("https://example.com/rss "), item.id)
+
+        self.manager._mark_feed_result(item, "ERROR", "boom")
+        self.assertEqual(self.manager.status_index, {"ERROR": {item.id}})
+
+        self.manager.delete_rss(item.id)
+        self.assertIsNone(self.manager.find_feed_by_url(item.url))
+        self.assertEqual((self.manager.site_index, self.manager.status_index), ({}, {}))
+
+    def test_query_feeds_filters_sorts_and_paginates(self):
+        with patch.object(self.manager, "start_task"):
+            for n, status in enumerate(["ERROR", "OK", "ERROR", "ERROR"]):
+                item = self._add_item(id=f"feed-{n}", name=f"Feed {n}", url=f"https://example.com/{n}", last_status=status)
+                self.manager.add_rss(item)
+
+        first_page, cursor, total = self.manager.query_feeds(status="ERROR", sort="name", order="desc", limit=2)
+        second_page, last_cursor, _ = self.manager.query_feeds(status="ERROR", sort="name", order="desc", limit=2, cursor=cursor)
+
+        self.assertEqual(total, 3)
+        self.assertEqual([rss_id for rss_id, _ in first_page], ["feed-3", "feed-2"])
+        self.assertEqual([rss_id for rss_id, _ in second_page], ["feed-0"])
+        self.assertIsNone(last_cursor)
+        with self.assertRaises(ValueError):
+            self.manager.query_feeds(sort="password")
+        with self.assertRaises(ValueError):
+            self.manager.query_feeds(order="sideways")
+        # A cursor only continues the sort and order it came from
+        for sort, order in (("interval", "desc"), ("name", "asc")):
+            with self.assertRaisesRegex(ValueError, "different sort"):
+                self.manager.query_feeds(status="ERROR", sort=sort, order=order, limit=2, cursor=cursor)
+
+    def test_feeds_sharing_a_url_are_all_indexed(self):
+        with patch.object(self.manager, "start_task"):
+            for n in range(2):
+                self.manager.add_rss(self._add_item(id=f"feed-{n}", url=f"https://example.com/{n}"))
+        self.manager.feeds.update("feed-1", url="https://Example.com/0")
+        self.manager._bump_feed_version("feed-1")
+
+        self.assertEqual(self.manager.find_feeds_by_url("https://example.com/0"), ["feed-0", "feed-1"])
+        self.manager.delete_rss("feed-0")
+        self.assertEqual(self.manager.find_feed_by_url("https://example.com/0"), "feed-1")
+        self.assertIsNone(self.manager.find_feed_by_url("https://example.com/1"))
+
+    def test_next_run_pages_follow_rescheduling(self):
+        with patch.object(self.manager, "start_task"):
+            for n in range(4):
+                self.manager.add_rss(self._add_item(id=f"feed-{n}", name=f"Feed {n}", url=f"https://example.com/{n}"))
+        for n, when in enumerate([300, 100, None, 200]):
+            self.manager._set_next_run_at(f"feed-{n}", when)
+
+        first_page, cursor, total = self.manager.query_feeds(sort="next_run", limit=2)
+        self.manager._set_next_run_at("feed-0", 50)
+        second_page, last_cursor, _ = self.manager.query_feeds(sort="next_run", limit=2, cursor=cursor)
+
+        self.assertEqual(total, 4)
+        self.assertEqual([rss_id for rss_id, _ in first_page], ["feed-1", "feed-3"])
+        self.assertEqual([rss_id for rss_id, _ in second_page], ["feed-2"])
+        self.assertIsNone(last_cursor)
+        self.assertEqual([rss_id for rss_id, _ in self.manager.query_feeds(sort="next_run", order="desc")[0]],
+                         ["feed-2", "feed-3", "feed-1", "feed-0"])
+
+    def test_check_rss_fetches_once_and_fans_out_to_profiles(self):
+        item = self._add_item(
+            pt_site=GC.AUDIENCES,
+            key_words="Show A",
+            path="/tv/a",
+            profiles=[FilterProfile(id="p1", name="B", key_words="Show B", path="/tv/b")],
+        )
+        self.manager.storage["settings"] = {"transmission_url": "localhost"}
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[
+                SimpleNamespace(title="Show A E01", links=[{"rel": "enclosure", "href": "https://example.com/a.torrent"}]),
+                SimpleNamespace(title="Show B E01", links=[{"rel": "enclosure", "href": "https://example.com/b.torrent"}]),
+            ],
         )
+        client = SimpleNamespace(added=[])
+        client.add_torrent = lambda url, download_dir=None: client.added.append((url, download_dir))
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed) as mock_fetch:
+            with patch("src.rss_manager.transmission_rpc.Client", return_value=client):
+                result = self.manager.check_rss(item.id, run_id="testrun")
+
+        mock_fetch.assert_called_once()
+        self.assertEqual(client.added, [("https://example.com/a.torrent", "/tv/a"), ("https://example.com/b.torrent", "/tv/b")])
+        self.assertEqual(result["newItems"][1], {"title": "Show B E01", "link": "https://example.com/b.torrent", "profile": "p1"})
+
+    def test_start_all_staggers_first_runs_without_spawning_checks(self):
+        for index in range(3):
+            self._add_item(id=f"feed-{index}", url=f"https://example.com/{index}")
+
+        with patch.object(self.manager, "_schedule_next_run") as mock_arm:
+            with patch.object(self.manager, "_start_check_thread") as mock_start_worker:
+                self.manager.start_all()
+
+        mock_start_worker.assert_not_called()
+        delays = [call.kwargs["delay_seconds"] for call in mock_arm.call_args_list]
+        self.assertEqual(delays, [0, GC.STARTUP_STAGGER_SECONDS, 2 * GC.STARTUP_STAGGER_SECONDS])
+        self.assertEqual(self.manager.health()["scheduler"], "running")
+        self.assertEqual(self.manager.health()["feeds"], 3)
+
+    def test_host_outages_open_the_breaker_and_skip_fetches(self):
+        for index in range(GC.BREAKER_FAILURE_THRESHOLD + 1):
+            self._add_item(id=f"feed-{index}", url=f"https://tracker.example/rss/{index}")
+
+        with patch("src.rss_manager.requests.get", side_effect=requests.ConnectionError("refused")) as mock_get:
+            for index in range(GC.BREAKER_FAILURE_THRESHOLD):
+                with self.assertRaises(requests.ConnectionError):
+                    self.manager.check_rss(f"feed-{index}", run_id="testrun")
+            result = self.manager.check_rss(f"feed-{GC.BREAKER_FAILURE_THRESHOLD}", run_id="testrun")
+
+        self.assertEqual(mock_get.call_count, GC.BREAKER_FAILURE_THRESHOLD)
+        self.assertEqual(result["status"], "CIRCUIT_OPEN")
+        self.assertEqual(self.manager.host_circuit_state("https://tracker.example/other"), "open")
+        self.assertEqual(self.manager.feeds.get("feed-0").consecutive_failures, 1)
+
+    def test_http_not_found_does_not_count_against_the_host(self):
+        item = self._add_item()
+        response = FakeResponse(status_code=404)
+
+        with patch("src.rss_manager.requests.get", return_value=response):
+            for _ in range(GC.BREAKER_FAILURE_THRESHOLD):
+                with self.assertRaises(requests.HTTPError):
+                    self.manager.check_rss(item.id, run_id="testrun")
+
+        self.assertEqual(self.manager.host_circuit_state(item.url), "closed")
+        self.assertEqual(self.manager.feeds.get(item.id).consecutive_failures, GC.BREAKER_FAILURE_THRESHOLD)
+
+    def test_parse_timeouts_do_not_count_against_the_host(self):
+        item = self._add_item()
+
+        with patch.object(self.manager.feed_parser, "parse", side_effect=FeedParseTimeout("slow parse")):
+            with patch("src.rss_manager.requests.get", return_value=FakeResponse(b"<rss/>")):
+                for _ in range(GC.BREAKER_FAILURE_THRESHOLD):
+                    with self.assertRaises(FeedParseTimeout):
+                        self.manager.check_rss(item.id, run_id="testrun")
+
+        self.assertEqual(self.manager.host_circuit_state(item.url), "closed")
+
+    def test_watchdog_times_out_stuck_run_and_discards_its_late_result(self):
+        item = self._add_item()
+        release = threading.Event()
+        feed = SimpleNamespace(bozo=False, entries=[])
+
+        def fetch(*args):
+            release.wait(5)
+            return feed
+
+        with patch.object(self.manager, "_fetch_feed", side_effect=fetch):
+            with patch.object(self.manager, "_apply_failure_backoff") as mock_backoff:
+                job = self.manager.submit_check_job(item.id)
+                self._wait_for_active_run(item.id)
+                self.assertEqual(self.manager.check_overdue_runs(), [])
+
+                time.sleep(0.02)
+                with patch.dict(GC.RUN_STAGE_DEADLINES, {"fetch": 0.01}):
+                    timed_out = self.manager.check_overdue_runs()
+
+                self.assertEqual(len(timed_out), 1)
+                mock_backoff.assert_called_once_with(item.id)
+                self.assertEqual(self.manager.get_job(job["id"])["status"], "failed")
+                self.assertEqual(self.manager.feeds.get(item.id).last_status, "TIMEOUT")
+                self.assertTrue(self.manager._get_run_lock(item.id).acquire(blocking=False))
+                self.manager._get_run_lock(item.id).release()
+                status = self.manager.active_runs_status()
+                self.assertEqual(status["runs"], [])
+                self.assertEqual(status["timedOut"][0]["stage"], "fetch")
+                self.assertEqual(self.manager.run_pool.stats()["abandoned"], 1)
+
+                release.set()
+                deadline = time.monotonic() + 5
+                while self.manager.run_pool.stats()["abandoned"] and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+        self.assertEqual(self.manager.feeds.get(item.id).last_status, "TIMEOUT")
+        self.assertEqual(self.manager.get_job(job["id"])["status"], "failed")
+        self.assertEqual(self.manager.evicted_runs, set())
+
+    def test_failing_feed_is_rearmed_with_exponential_backoff(self):
+        item = self._add_item(interval=10)
+        self.manager.feeds.update(item.id, consecutive_failures=3)
+
+        with patch("src.rss_manager.random.uniform", return_value=1.0):
+            with patch.object(self.manager, "_schedule_next_run") as mock_arm:
+                self.manager._apply_failure_backoff(item.id)
+
+        mock_arm.assert_called_once_with(item.id, delay_seconds=4 * 600, source="backoff")
+        self.assertLessEqual(
+            self.manager._failure_backoff_seconds(item.id, 30),
+            GC.FAILURE_BACKOFF_MAX_SECONDS * (1 + GC.FAILURE_BACKOFF_JITTER),
+        )
+
+    def test_pre_send_rules_drop_entries_before_any_rpc(self):
+        item = self._add_item(path="/tv")
+        self.manager.feeds.update(item.id, max_size_mb=1024)
+        self.manager.storage["settings"] = {"transmission_url": "localhost"}
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[
+                SimpleNamespace(title="Small E01", links=[{"rel": "enclosure", "href": "https://example.com/s.torrent", "length": "1048576"}]),
+                SimpleNamespace(title="Huge E01 [40 GB]", links=[{"rel": "enclosure", "href": "https://example.com/h.torrent"}]),
+            ],
+        )
+        client = SimpleNamespace(added=[])
+        client.add_torrent = lambda url, download_dir=None: client.added.append((url, download_dir))
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            with patch("src.rss_manager.transmission_rpc.Client", return_value=client):
+                result = self.manager.check_rss(item.id, run_id="testrun")
+
+        self.assertEqual(client.added, [("https://example.com/s.torrent", "/tv")])
+        self.assertEqual(result["rejected"], [{"title": "Huge E01 [40 GB]", "reason": "max_size"}])
+
+    def test_links_transmission_already_has_are_skipped_without_add_rpc(self):
+        item = self._add_item(path="/tv")
+        self.manager.storage["settings"] = {"transmission_url": "localhost"}
+        known_hash = "c12fe1c06bba254a9dc9f519b335aa7c1367a88a"
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[
+                SimpleNamespace(title="Show E02", links=[{"rel": "enclosure", "href": "https://example.com/e02.torrent"}]),
+                SimpleNamespace(title="Show E01", links=[{"rel": "enclosure", "href": f"magnet:?xt=urn:btih:{known_hash}"}]),
+            ],
+        )
+        client = SimpleNamespace(added=[], snapshots=0)
+        client.add_torrent = lambda url, download_dir=None: client.added.append(url)
+
+        def get_torrents(arguments=None):
+            client.snapshots += 1
+            return [SimpleNamespace(hashString=known_hash, name="Show E01", status="seeding")]
+
+        client.get_torrents = get_torrents
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            with patch("src.rss_manager.transmission_rpc.Client", return_value=client):
+                result = self.manager.check_rss(item.id, run_id="run-1")
+                self.manager.feeds.update(item.id, last_title=None)
+                self.manager.check_rss(item.id, run_id="run-2")
+
+        self.assertEqual(client.added, ["https://example.com/e02.torrent", "https://example.com/e02.torrent"])
+        self.assertEqual(result["skipped"], [{"link": f"magnet:?xt=urn:btih:{known_hash}", "hash": known_hash, "name": "Show E01"}])
+        self.assertEqual(client.snapshots, 1)
+
+    def test_filter_cache_is_searchable_and_backfill_sends_to_the_feed_path(self):
+        item = self._add_item(pt_site=GC.AUDIENCES, key_words="Nothing", path="/tv/a")
+        self.manager.storage["settings"] = {"transmission_url": "localhost"}
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[SimpleNamespace(title="Show A E01 1080p", links=[{"rel": "enclosure", "href": "https://example.com/a.torrent"}])],
+        )
+        client = SimpleNamespace(added=[])
+        client.add_torrent = lambda url, download_dir=None: client.added.append((url, download_dir))
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            self.manager.check_rss(item.id, run_id="testrun")
+        total, hits = self.manager.search_torrents("show 1080p")
+        self.assertEqual(total, 1)
+
+        with patch("src.rss_manager.transmission_rpc.Client", return_value=client):
+            results = self.manager.send_backfill([
+                {"feedId": item.id, "title": hits[0]["title"]},
+                {"feedId": item.id, "title": "Missing"},
+            ])
+
+        self.assertEqual(client.added, [("https://example.com/a.torrent", "/tv/a")])
+        self.assertEqual([result["status"] for result in results], ["SENT", "NOT_FOUND"])
+
+
+    def test_sends_fail_over_across_transmission_endpoints(self):
+        import transmission_rpc
+
+        item = self._add_item(key_words="Show", path="/tv")
+        self.manager.storage["settings"] = {
+            "transmission_url": "box-a",
+            "transmission_endpoints": [{"id": "b", "url": "box-b"}, {"id": "c", "url": "box-c"}],
+        }
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[
+                SimpleNamespace(title=f"Show E0{n}", links=[{"rel": "enclosure", "href": f"https://example.com/{n}.torrent"}])
+                for n in (1, 2)
+            ],
+        )
+        added = []
+        refused = transmission_rpc.TransmissionConnectError("refused")
+
+        def open_client(endpoint):
+            if endpoint["url"] == "box-a":
+                raise refused
+
+            def add_torrent(url, download_dir=None):
+                if endpoint["url"] == "box-b" and added:
+                    raise refused
+                added.append((endpoint["id"], url))
+                return SimpleNamespace(hashString=None, name=url)
+
+            return SimpleNamespace(
+                add_torrent=add_torrent,
+                session_stats=lambda: SimpleNamespace(active_torrent_count=0 if endpoint["url"] == "box-b" else 5, torrent_count=9),
+                get_session=lambda: SimpleNamespace(download_dir="/downloads"),
+                free_space=lambda path: 100 * 1024 ** 3,
+            )
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            with patch.object(self.manager, "_open_transmission_client", side_effect=open_client):
+                result = self.manager.check_rss(item.id, run_id="testrun")
+
+                # box-b had the fewest active torrents; it refused the second add, which box-c took over
+                self.assertEqual(added, [("b", "https://example.com/1.torrent"), ("c", "https://example.com/2.torrent")])
+                self.assertEqual(result["status"], "OK")
+
+                # A pinned feed goes to its endpoint regardless of load
+                added.clear()
+                self.manager.feeds.update(item.id, transmission_endpoint="c", last_title=None)
+                self.manager.check_rss(item.id, run_id="pinned")
+                self.assertEqual({endpoint for endpoint, _ in added}, {"c"})
+
+        status = {entry["id"]: entry for entry in self.manager.transmission_endpoints_status()}
+        self.assertEqual(status["default"]["error"], "refused")
+        self.assertEqual(status["b"]["activeTorrents"], 0)
+        self.assertNotIn("password", status["c"])
+
+    def test_torrent_files_are_sent_as_metainfo_and_downloaded_once(self):
+        item = self._add_item(key_words="Show", path="/tv")
+        self.manager.storage["settings"] = {"transmission_url": "localhost"}
+        self.manager.torrent_files = TorrentFileCache(str(self.storage_dir / "torrents"), 1024 * 1024)
+        metainfo = b"d4:infod4:name8:Show.E01ee"
+        feed = SimpleNamespace(
+            bozo=False,
+            entries=[SimpleNamespace(title="Show E01", links=[{"rel": "enclosure", "href": "https://example.com/1.torrent"}])],
+        )
+        client = SimpleNamespace(added=[], get_torrents=lambda arguments=None: [])
+
+        def add_torrent(torrent, download_dir=None):
+            client.added.append(torrent)
+            return SimpleNamespace(hashString=None, name="Show.E01")
+
+        client.add_torrent = add_torrent
+
+        with patch.object(self.manager, "_fetch_feed", return_value=feed):
+            with patch("src.rss_manager.transmission_rpc.Client", return_value=client):
+                with patch.object(self.manager, "_download_torrent_file", return_value=metainfo) as mock_download:
+                    self.manager.check_rss(item.id, run_id="first")
+                    infohash = self.manager.torrent_files.get("https://example.com/1.torrent")[0]
+                    # Same link again (e.g. after the feed reset): the cache supplies the hash for dedupe
+                    self.manager.feeds.update(item.id, last_title=None)
+                    result = self.manager.check_rss(item.id, run_id="second")
 
+        mock_download.assert_called_once_with("https://example.com/1.torrent")
+        self.assertEqual(client.added, [metainfo])
+        self.assertEqual(result["skipped"], [{"link": "https://example.com/1.torrent", "hash": infohash, "name": "Show.E01"}])
+        self.assertEqual(self.manager.storage_usage()["torrentFiles"]["files"], 1)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,134 @@
+import threading
+import time
+import unittest
+
+from src.run_pool import PRIORITY_MANUAL, PRIORITY_STARTUP, PRIORITY_TIMER, RunPool, trigger_priority
+
+
+class RunPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = RunPool(1, name="test-run")
+        self.gate = threading.Event()
+        self.order = []
+        self.done = threading.Event()
+        # Occupy the single worker so everything submitted next stays queued
+        self.pool.submit("blocker", PRIORITY_MANUAL, lambda: self.gate.wait(5))
+        self._wait_for(lambda stats: stats["busy"] == 1)
+
+    def tearDown(self):
+        self.gate.set()
+        self.pool.shutdown()
+
+    def _record(self, key, last=False):
+        def task():
+            self.order.append(key)
+            if last:
+                self.done.set()
+        return task
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition(self.pool.stats()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_runs_by_priority_then_fifo(self):
+        self.pool.submit("startup", PRIORITY_STARTUP, self._record("startup", last=True))
+        self.pool.submit("timer-1", PRIORITY_TIMER, self._record("timer-1"))
+        self.pool.submit("manual", PRIORITY_MANUAL, self._record("manual"))
+        self.pool.submit("timer-2", PRIORITY_TIMER, self._record("timer-2"))
+
+        self.gate.set()
+        self.assertTrue(self.done.wait(5))
+
+        self.assertEqual(self.order, ["manual", "timer-1", "timer-2", "startup"])
+
+    def test_a_queued_key_is_coalesced_and_only_moves_up(self):
+        self.pool.submit("feed", PRIORITY_STARTUP, self._record("feed"))
+        self.pool.submit("other", PRIORITY_TIMER, self._record("other", last=True))
+        self.assertFalse(self.pool.submit("feed", PRIORITY_MANUAL, self._record("duplicate")))
+        self.assertFalse(self.pool.submit("feed", PRIORITY_STARTUP, self._record("duplicate")))
+
+        stats = self.pool.stats()
+        self.assertEqual((stats["queued"], stats["coalesced"]), (2, 2))
+        self.assertEqual(stats["queuedByPriority"]["manual"], 1)
+
+        self.gate.set()
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.order, ["feed", "other"])
+
+    def test_concurrency_is_bounded_and_waits_are_measured(self):
+        pool = RunPool(2, name="bounded")
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def task():
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.01)
+            with lock:
+                running["now"] -= 1
+
+        try:
+            for n in range(10):
+                pool.submit(f"feed-{n}", PRIORITY_TIMER, task)
+            deadline = time.monotonic() + 5
+            while pool.stats()["completed"] < 10 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            stats = pool.stats()
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(running["peak"], 2)
+        self.assertEqual(stats["completed"], 10)
+        self.assertGreater(stats["waitSeconds"]["max"], 0)
+
+    def test_discarded_and_failing_tasks_do_not_stop_the_pool(self):
+        self.pool.submit("dropped", PRIORITY_TIMER, self._record("dropped"))
+        self.pool.submit("broken", PRIORITY_TIMER, lambda: 1 / 0)
+        self.pool.submit("after", PRIORITY_STARTUP, self._record("after", last=True))
+        self.assertTrue(self.pool.discard("dropped"))
+
+        self.gate.set()
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.order, ["after"])
+        self._wait_for(lambda stats: stats["completed"] == 3)
+        self.assertEqual(self.pool.stats()["errors"], 1)
+
+    def test_abandoned_worker_is_replaced_and_exits_when_it_returns(self):
+        self.assertTrue(self.pool.abandon("blocker"))
+        self.assertFalse(self.pool.abandon("blocker"))
+        self.pool.submit("next", PRIORITY_TIMER, self._record("next", last=True))
+
+        # The replacement runs new work while the stuck task is still blocked
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.pool.stats()["abandoned"], 1)
+
+        self.gate.set()
+        self._wait_for(lambda stats: stats["abandoned"] == 0)
+        stats = self.pool.stats()
+        self.assertEqual((stats["busy"], stats["completed"]), (0, 2))
+        self.assertEqual(len(self.pool._threads), 1)
+
+    def test_a_key_stuck_again_after_abandon_can_be_abandoned_again(self):
+        second_gate = threading.Event()
+        self.assertTrue(self.pool.abandon("blocker"))
+        self.pool.submit("blocker", PRIORITY_MANUAL, lambda: second_gate.wait(5))
+        self._wait_for(lambda stats: stats["busy"] == 1)
+
+        self.assertTrue(self.pool.abandon("blocker"))
+        self.pool.submit("next", PRIORITY_TIMER, self._record("next", last=True))
+        try:
+            self.assertTrue(self.done.wait(5))
+            self.assertEqual(self.pool.stats()["abandoned"], 2)
+        finally:
+            second_gate.set()
+
+    def test_trigger_priority(self):
+        self.assertEqual(trigger_priority("manual-send"), PRIORITY_MANUAL)
+        self.assertEqual(trigger_priority("timer"), PRIORITY_TIMER)
+        self.assertLess(trigger_priority("retry"), trigger_priority("timer"))
+
+
+if __name__ == "__main__":
+    unittest.main()
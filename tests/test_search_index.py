@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.search_index import SearchIndex, tokenize
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_dir = Path(self.temp_dir.name)
+        self.index_path = self.storage_dir / "search_index.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _index(self):
+        return SearchIndex(str(self.storage_dir), str(self.index_path), flush_seconds=3600, refresh_seconds=0)
+
+    def _write_cache(self, feed_id: str, entries: dict):
+        (self.storage_dir / f"{feed_id}_torrents_list.json").write_text(json.dumps(entries), encoding="utf-8")
+
+    def test_tokenize_splits_latin_words_and_cjk_characters(self):
+        self.assertEqual(tokenize("Show.S01E02.1080p 进击的巨人"), ["show", "s01e02", "1080p", "进", "击", "的", "巨", "人"])
+
+    def test_search_uses_feed_keyword_syntax_and_prefixes(self):
+        self._write_cache("feed-a", {
+            "Show A S01E01 1080p HEVC": "https://example.com/a1.torrent",
+            "Show A S01E02 720p": "https://example.com/a2.torrent",
+        })
+        self._write_cache("feed-b", {"Other Movie 2160p 进击的巨人": "https://example.com/b1.torrent"})
+        index = self._index()
+
+        total, hits = index.search("show 1080")
+        self.assertEqual(total, 1)
+        self.assertEqual(hits[0], {"feedId": "feed-a", "title": "Show A S01E01 1080p HEVC", "link": "https://example.com/a1.torrent"})
+        self.assertEqual(index.search("720p; 巨人")[0], 2)
+        self.assertEqual(index.search("show", feed_ids={"feed-b"})[0], 0)
+        # Tokens match but the phrase is not in the title
+        self.assertEqual(index.search("hevc show a s01e02")[0], 0)
+
+    def test_added_entries_are_searchable_and_survive_a_reload(self):
+        self._write_cache("feed-a", {"Show A S01E01": "https://example.com/a1.torrent"})
+        index = self._index()
+        index.refresh(force=True)
+        self._write_cache("feed-a", {"Show A S01E01": "https://example.com/a1.torrent", "Show A S01E02": "https://example.com/a2.torrent"})
+        index.add_entries("feed-a", {"Show A S01E02": "https://example.com/a2.torrent"})
+
+        _, hits = index.search("show")
+        self.assertEqual([hit["title"] for hit in hits], ["Show A S01E02", "Show A S01E01"])
+        index.close()
+
+        reloaded = SearchIndex(str(self.storage_dir), str(self.index_path), flush_seconds=3600, refresh_seconds=3600)
+        self.assertEqual(reloaded.stats()["entries"], 2)
+        self.assertEqual(reloaded.lookup("feed-a", "Show A S01E02"), "https://example.com/a2.torrent")
+
+    def test_refresh_reindexes_changed_and_removed_cache_files(self):
+        self._write_cache("feed-a", {"Old Title": "https://example.com/old.torrent"})
+        index = self._index()
+        self.assertEqual(index.search("old")[0], 1)
+
+        self._write_cache("feed-a", {"New Title": "https://example.com/new.torrent"})
+        later = time.time() + 5
+        os.utime(self.storage_dir / "feed-a_torrents_list.json", (later, later))
+        self.assertEqual(index.search("old")[0], 0)
+        self.assertEqual(index.search("new")[0], 1)
+
+        (self.storage_dir / "feed-a_torrents_list.json").unlink()
+        self.assertEqual(index.search("new")[0], 0)
+        self.assertEqual(index.stats()["feeds"], 0)
+
+
+    def test_reindexing_a_changed_cache_file_keeps_newest_entries_first(self):
+        self._write_cache("feed-a", {"Show Old": "https://example.com/old.torrent"})
+        index = self._index()
+        index.search("show")
+        self._write_cache("feed-b", {"Show Newer": "https://example.com/newer.torrent"})
+        index.search("show")
+
+        self._write_cache("feed-a", {"Show Old": "https://example.com/old-v2.torrent", "Show Newest": "https://example.com/newest.torrent"})
+        later = time.time() + 5
+        os.utime(self.storage_dir / "feed-a_torrents_list.json", (later, later))
+
+        _, hits = index.search("show")
+        self.assertEqual([hit["title"] for hit in hits], ["Show Newest", "Show Newer", "Show Old"])
+        self.assertEqual(hits[-1]["link"], "https://example.com/old-v2.torrent")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from src.sorted_index import SortedIndex
+
+
+class SortedIndexTests(unittest.TestCase):
+    def test_updates_keep_members_ordered_and_pages_resume_after_a_cursor(self):
+        index = SortedIndex()
+        for member, key in (("c", 3), ("a", 1), ("b", 2), ("d", 2)):
+            index.set(member, key)
+        index.set("a", 5)
+        index.discard("c")
+        index.discard("missing")
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(list(index.iter_after()), [(2, "b"), (2, "d"), (5, "a")])
+        self.assertEqual(list(index.iter_after((2, "b"))), [(2, "d"), (5, "a")])
+        self.assertEqual(list(index.iter_after((5, "a"), descending=True)), [(2, "d"), (2, "b")])
+        # A cursor whose member has since been removed still resumes at its position
+        self.assertEqual(list(index.iter_after((3, "c"))), [(5, "a")])
+
+
+if __name__ == "__main__":
+    unittest.main()
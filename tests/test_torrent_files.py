@@ -0,0 +1,104 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.torrent_files import TorrentFileCache, metainfo_infohash
+
+
+def bencode(value) -> bytes:
+    if isinstance(value, int):
+        return b"i%de" % value
+    if isinstance(value, bytes):
+        return b"%d:%s" % (len(value), value)
+    if isinstance(value, list):
+        return b"l" + b"".join(bencode(item) for item in value) + b"e"
+    return b"d" + b"".join(bencode(key) + bencode(value[key]) for key in sorted(value)) + b"e"
+
+
+def make_torrent(name: bytes, padding: int = 0):
+    info = bencode({b"length": 1024, b"name": name, b"piece length": 16384, b"pieces": b"x" * 20})
+    data = bencode({b"announce": b"https://tracker/announce", b"comment": b"x" * padding, b"url-list": [b"a", b"b"]})
+    # Append the info dictionary as raw bytes, so the expected hash does not depend on the parser
+    return data[:-1] + bencode(b"info") + info + b"e", info
+
+
+class TorrentFileTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "torrents")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_infohash_is_the_sha1_of_the_raw_info_dictionary(self):
+        data, info = make_torrent(b"Show.E01.mkv")
+        self.assertEqual(metainfo_infohash(data), hashlib.sha1(info).hexdigest())
+        for broken in (b"<html>login</html>", b"d8:announce3:urle", data[:40], b"d4:infoi1ee"):
+            with self.assertRaises(ValueError):
+                metainfo_infohash(broken)
+
+    def test_urls_share_one_file_and_survive_a_restart(self):
+        data, _ = make_torrent(b"Show.E01.mkv")
+        cache = TorrentFileCache(self.cache_dir, max_bytes=1024 * 1024)
+        self.assertIsNone(cache.get("https://tracker/dl/1?passkey=secret"))
+        infohash = cache.put("https://tracker/dl/1?passkey=secret", data)
+        self.assertEqual(cache.put("https://mirror/dl/1", data), infohash)
+
+        reopened = TorrentFileCache(self.cache_dir, max_bytes=1024 * 1024)
+        self.assertEqual(reopened.get("https://mirror/dl/1"), (infohash, data))
+        self.assertEqual(reopened.stats()["files"], 1)
+        with open(os.path.join(self.cache_dir, "index.json"), encoding="utf-8") as f:
+            self.assertNotIn("passkey", f.read())
+
+    def test_least_recently_used_files_are_evicted_over_the_cap(self):
+        torrents = [make_torrent(f"Show.E0{n}.mkv".encode(), padding=300)[0] for n in range(3)]
+        cache = TorrentFileCache(self.cache_dir, max_bytes=len(torrents[0]) * 2)
+        cache.put("u0", torrents[0])
+        cache.put("u1", torrents[1])
+        self.assertIsNotNone(cache.get("u0"))
+        cache.put("u2", torrents[2])
+
+        self.assertIsNone(cache.get("u1"))
+        self.assertIsNotNone(cache.get("u0"))
+        self.assertIsNotNone(cache.get("u2"))
+        stats = cache.stats()
+        self.assertEqual((stats["files"], stats["evictions"]), (2, 1))
+        self.assertLessEqual(stats["bytes"], stats["maxBytes"])
+
+    def test_workers_sharing_the_directory_keep_each_others_entries_and_share_the_cap(self):
+        torrents = [make_torrent(f"Show.E0{n}.mkv".encode(), padding=300)[0] for n in range(3)]
+        worker_a = TorrentFileCache(self.cache_dir, max_bytes=len(torrents[0]) * 2)
+        worker_b = TorrentFileCache(self.cache_dir, max_bytes=len(torrents[0]) * 2)
+        worker_b.stats()  # loaded before worker_a's put
+        worker_a.put("u0", torrents[0])
+        worker_b.put("u1", torrents[1])
+
+        reopened = TorrentFileCache(self.cache_dir, max_bytes=len(torrents[0]) * 2)
+        self.assertIsNotNone(reopened.get("u0"))
+        self.assertIsNotNone(reopened.get("u1"))
+
+        # worker_a's put counts worker_b's file towards the cap and evicts the oldest one
+        worker_a.put("u2", torrents[2])
+        self.assertEqual(worker_a.stats()["files"], 2)
+        self.assertIsNone(TorrentFileCache(self.cache_dir, max_bytes=1 << 20).get("u0"))
+
+    def test_files_removed_while_loading_are_skipped(self):
+        data, _ = make_torrent(b"Show.E01.mkv")
+        TorrentFileCache(self.cache_dir, max_bytes=1024 * 1024).put("u0", data)
+        real_stat = os.stat
+
+        def vanishing_stat(path, *args, **kwargs):
+            if path.endswith(".torrent"):
+                raise FileNotFoundError(path)
+            return real_stat(path, *args, **kwargs)
+
+        with patch("src.torrent_files.os.stat", side_effect=vanishing_stat):
+            cache = TorrentFileCache(self.cache_dir, max_bytes=1024 * 1024)
+            self.assertEqual(cache.stats()["files"], 0)
+        self.assertIsNone(cache.get("u0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from src.transmission_pool import TransmissionPool, configured_endpoints
+
+GIB = 1024 * 1024 * 1024
+
+
+class TransmissionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.now = [0.0]
+        self.pool = TransmissionPool(ttl=60, min_free_bytes=10 * GIB, clock=lambda: self.now[0])
+        self.endpoints = configured_endpoints(
+            {
+                "transmission_url": "box-a",
+                "transmission_port": 9091,
+                "transmission_endpoints": [
+                    {"id": "b", "url": "box-b"},
+                    {"id": "c", "url": "box-c", "port": 9092},
+                    {"id": "off", "url": "box-d", "enabled": False},
+                ],
+            },
+            default_port=9091,
+        )
+        self.loads = {
+            "box-a": {"active": 12, "torrents": 40, "free_bytes": 500 * GIB},
+            "box-b": {"active": 3, "torrents": 10, "free_bytes": 200 * GIB},
+            "box-c": {"active": 1, "torrents": 2, "free_bytes": 2 * GIB},
+        }
+        self.probes = []
+
+    def _probe(self, endpoint):
+        self.probes.append(endpoint["id"])
+        load = self.loads[endpoint["url"]]
+        if isinstance(load, Exception):
+            raise load
+        return load
+
+    def _order(self, affinity=None):
+        return [endpoint["id"] for endpoint in self.pool.order(self.endpoints, affinity, self._probe)]
+
+    def test_configured_endpoints_put_the_legacy_endpoint_first(self):
+        self.assertEqual([endpoint["id"] for endpoint in self.endpoints], ["default", "b", "c"])
+        self.assertEqual(self.endpoints[2]["name"], "transmission:box-c:9092")
+        self.assertEqual(configured_endpoints({"transmission_url": ""}, 9091), [])
+
+    def test_least_active_endpoint_first_and_low_disk_last(self):
+        self.assertEqual(self._order(), ["b", "default", "c"])
+
+        # Adds through this process count until the next sample
+        for _ in range(10):
+            self.pool.record_added("transmission:box-b:9091")
+        self.assertEqual(self._order(), ["default", "b", "c"])
+        self.assertEqual(len(self.probes), 3)
+
+        self.now[0] = 61
+        self.assertEqual(self._order(), ["b", "default", "c"])
+        self.assertEqual(len(self.probes), 6)
+
+    def test_pinned_endpoint_goes_first_and_failed_probes_rank_last(self):
+        self.loads["box-b"] = ConnectionError("refused")
+
+        self.assertEqual(self._order(affinity="c"), ["c", "default", "b"])
+        self.assertNotIn("c", self.probes)
+
+        stats = {entry["id"]: entry for entry in self.pool.stats(self.endpoints)}
+        self.assertEqual(stats["b"]["error"], "refused")
+        self.assertIsNone(stats["c"]["activeTorrents"])
+        self.assertEqual(stats["default"]["activeTorrents"], 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
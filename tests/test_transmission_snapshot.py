@@ -0,0 +1,45 @@
+import unittest
+from types import SimpleNamespace
+
+from src.transmission_snapshot import TorrentSnapshot, entry_infohash, link_infohash, normalize_infohash
+
+HASH = "c12fe1c06bba254a9dc9f519b335aa7c1367a88a"
+
+
+class FakeClient:
+    def __init__(self, torrents):
+        self.torrents = torrents
+        self.calls = []
+
+    def get_torrents(self, arguments=None):
+        self.calls.append(arguments)
+        return self.torrents
+
+
+class TransmissionSnapshotTests(unittest.TestCase):
+    def test_infohash_from_magnet_links_and_entry_fields(self):
+        self.assertEqual(link_infohash(f"magnet:?xt=urn:btih:{HASH.upper()}&dn=show"), HASH)
+        self.assertEqual(link_infohash("magnet:?xt=urn:btih:YEX6DQDLXISUVHOJ6UM3GNNKPQJWPKEK"), HASH)
+        self.assertIsNone(link_infohash("https://example.com/file.torrent"))
+        self.assertEqual(entry_infohash({"nyaa_infohash": HASH}), HASH)
+        self.assertIsNone(entry_infohash(SimpleNamespace(title="no hash")))
+        self.assertIsNone(normalize_infohash("not-a-hash"))
+
+    def test_snapshot_is_cached_per_endpoint_until_it_expires(self):
+        now = [0.0]
+        snapshot = TorrentSnapshot(ttl=60, clock=lambda: now[0])
+        client = FakeClient([SimpleNamespace(hashString=HASH, name="Show", status="seeding")])
+
+        self.assertEqual(snapshot.torrents(client, "tx:a"), {HASH: {"name": "Show", "status": "seeding"}})
+        snapshot.record_added("tx:a", "a" * 40, "New")
+        self.assertIn("a" * 40, snapshot.torrents(client, "tx:a"))
+        self.assertEqual(len(client.calls), 1)
+
+        now[0] = 61
+        self.assertNotIn("a" * 40, snapshot.torrents(client, "tx:a"))
+        self.assertEqual(len(client.calls), 2)
+        self.assertEqual(client.calls[0], ["hashString", "name", "status"])
+
+
+if __name__ == "__main__":
+    unittest.main()